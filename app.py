@@ -5,6 +5,7 @@ import dateutil.parser
 import datetime
 import re
 import mimetypes
+import concurrent.futures
 
 from dateutil.parser import parse
 from datetime import date
@@ -15,26 +16,46 @@ from functools import wraps
 from io import BytesIO
 from logging.config import dictConfig
 
-from flask import Flask, url_for, render_template, session, redirect, json, send_file, request
+from flask import Flask, g, url_for, session, redirect, json, send_file, request
+from flask import render_template as flask_render_template, stream_template
 from flask_oauthlib.contrib.client import OAuth, OAuth2Application
-from flask_session import Session
-from xero_python.accounting import AccountingApi, Account, Accounts, AccountType, Allocation, Allocations, BatchPayment, BatchPayments, BankTransaction, BankTransactions, BankTransfer, BankTransfers, Contact, Contacts, ContactGroup, ContactGroups, ContactPerson, CreditNote, CreditNotes, Currency, Currencies, CurrencyCode, Employee, Employees, ExpenseClaim, ExpenseClaims, HistoryRecord, HistoryRecords, Invoice, Invoices, Item, Items, LineAmountTypes, LineItem, Payment, Payments, PaymentService, PaymentServices, Phone, Purchase, Quote, Quotes, Receipt, Receipts, RepeatingInvoice, RepeatingInvoices, Schedule, TaxComponent, TaxRate, TaxRates, TaxType, TrackingCategory, TrackingCategories, TrackingOption, TrackingOptions, User, Users
-from xero_python.assets import AssetApi, Asset, AssetStatus, AssetStatusQueryParam, AssetType, BookDepreciationSetting
-from xero_python.project import ProjectApi, Amount, ChargeType, Projects, ProjectCreateOrUpdate, ProjectPatch, ProjectStatus, ProjectUsers, Task, TaskCreateOrUpdate, TimeEntryCreateOrUpdate
-from xero_python.payrollau import PayrollAuApi, Employees, Employee, EmployeeStatus,State, HomeAddress
-from xero_python.payrolluk import PayrollUkApi, Employees, Employee, Address, Employment
-from xero_python.payrollnz import PayrollNzApi, Employees, Employee, Address, Employment, EmployeeLeaveSetup
-from xero_python.file import FilesApi
-from xero_python.finance import FinanceApi
-from xero_python.api_client import ApiClient, serialize
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+from xero_python.api_client import serialize
 from xero_python.api_client.configuration import Configuration
-from xero_python.api_client.oauth2 import OAuth2Token
+from xero_python.api_client.oauth2 import OAuth2Token, TokenApi
 from xero_python.exceptions import AccountingBadRequestException, PayrollUkBadRequestException
-from xero_python.identity import IdentityApi
 from xero_python.utils import getvalue
 
 import logging_settings
-from utils import jsonify, serialize_model
+from bulk import BulkWriter
+from caching import TTLCache
+from compression import init_compression
+from demo_registry import DemoRegistry
+from fanout import fan_out
+from lazy_imports import LazyName, import_now, lazy_import
+from ledger import GeneralLedger
+from mirror import SQLiteRecordStore
+from ratelimit import RateLimitedApiClient, TenantRateLimiter
+from session_store import init_session
+from token_refresh import TokenRefresher
+from snippets import SnippetIndex
+from sync import JOURNALS, SYNC_ENTITIES, IncrementalSync
+from utils import (
+    RawJSON, build_model_plans, json_stream, json_style, jsonify, keep_raw_bodies, raw_bodies,
+    serialize_model,
+)
+
+# product apis and models are imported on first use, see lazy_imports
+AccountingApi, Account, Accounts, AccountType, Allocation, Allocations, BatchPayment, BatchPayments, BankTransaction, BankTransactions, BankTransfer, BankTransfers, Contact, Contacts, ContactGroup, ContactGroups, ContactPerson, CreditNote, CreditNotes, Currency, Currencies, CurrencyCode, Employee, Employees, ExpenseClaim, ExpenseClaims, HistoryRecord, HistoryRecords, Invoice, Invoices, Item, Items, LineAmountTypes, LineItem, Payment, Payments, PaymentService, PaymentServices, Phone, Purchase, Quote, Quotes, Receipt, Receipts, RepeatingInvoice, RepeatingInvoices, Schedule, TaxComponent, TaxRate, TaxRates, TaxType, TrackingCategory, TrackingCategories, TrackingOption, TrackingOptions, User, Users = lazy_import("xero_python.accounting", "AccountingApi", "Account", "Accounts", "AccountType", "Allocation", "Allocations", "BatchPayment", "BatchPayments", "BankTransaction", "BankTransactions", "BankTransfer", "BankTransfers", "Contact", "Contacts", "ContactGroup", "ContactGroups", "ContactPerson", "CreditNote", "CreditNotes", "Currency", "Currencies", "CurrencyCode", "Employee", "Employees", "ExpenseClaim", "ExpenseClaims", "HistoryRecord", "HistoryRecords", "Invoice", "Invoices", "Item", "Items", "LineAmountTypes", "LineItem", "Payment", "Payments", "PaymentService", "PaymentServices", "Phone", "Purchase", "Quote", "Quotes", "Receipt", "Receipts", "RepeatingInvoice", "RepeatingInvoices", "Schedule", "TaxComponent", "TaxRate", "TaxRates", "TaxType", "TrackingCategory", "TrackingCategories", "TrackingOption", "TrackingOptions", "User", "Users")
+AssetApi, Asset, AssetStatus, AssetStatusQueryParam, AssetType, BookDepreciationSetting = lazy_import("xero_python.assets", "AssetApi", "Asset", "AssetStatus", "AssetStatusQueryParam", "AssetType", "BookDepreciationSetting")
+ProjectApi, Amount, ChargeType, Projects, ProjectCreateOrUpdate, ProjectPatch, ProjectStatus, ProjectUsers, Task, TaskCreateOrUpdate, TimeEntryCreateOrUpdate = lazy_import("xero_python.project", "ProjectApi", "Amount", "ChargeType", "Projects", "ProjectCreateOrUpdate", "ProjectPatch", "ProjectStatus", "ProjectUsers", "Task", "TaskCreateOrUpdate", "TimeEntryCreateOrUpdate")
+PayrollAuApi, Employees, Employee, EmployeeStatus, State, HomeAddress = lazy_import("xero_python.payrollau", "PayrollAuApi", "Employees", "Employee", "EmployeeStatus", "State", "HomeAddress")
+PayrollUkApi, Employees, Employee, Address, Employment = lazy_import("xero_python.payrolluk", "PayrollUkApi", "Employees", "Employee", "Address", "Employment")
+PayrollNzApi, Employees, Employee, Address, Employment, EmployeeLeaveSetup = lazy_import("xero_python.payrollnz", "PayrollNzApi", "Employees", "Employee", "Address", "Employment", "EmployeeLeaveSetup")
+FilesApi = LazyName("xero_python.file", "FilesApi")
+FinanceApi = LazyName("xero_python.finance", "FinanceApi")
+IdentityApi = LazyName("xero_python.identity", "IdentityApi")
 
 dictConfig(logging_settings.default_settings)
 
@@ -48,7 +69,49 @@ if app.config["ENV"] != "production":
     os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
 
 # configure persistent session cache
-Session(app)
+init_session(app)
+
+# gzip/brotli page compression and etags, registered first so it runs after other hooks
+compression = init_compression(app)
+
+# api demo pages, served through one url rule
+demos = DemoRegistry()
+demos.init_app(app)
+
+# keep compiled templates on disk so new worker processes skip compiling them
+if app.config["TEMPLATE_BYTECODE_CACHE_DIR"]:
+    os.makedirs(app.config["TEMPLATE_BYTECODE_CACHE_DIR"], exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+        app.config["TEMPLATE_BYTECODE_CACHE_DIR"]
+    )
+
+# index code snippets shown next to each api call, reloaded on change outside production
+snippet_index = SnippetIndex(
+    os.path.abspath(__file__), auto_reload=app.config["ENV"] != "production"
+)
+snippet_index.build()
+
+# cache of the organisation connection per token, saves an identity api call per lookup
+tenant_cache = TTLCache(ttl=app.config["TENANT_CACHE_TTL"])
+
+# cache of the sample record ids picked by demo pages per tenant, reset once a request
+# has written to the tenant through the sdk
+seed_cache = TTLCache(ttl=app.config["SEED_CACHE_TTL"])
+written_tenants = set()
+
+# local copy of the main accounting entities, later syncs only fetch what changed
+mirror = SQLiteRecordStore(app.config["MIRROR_DATABASE"])
+incremental_sync = IncrementalSync(store=mirror, page_size=app.config["SYNC_PAGE_SIZE"])
+# account totals per month kept up to date from the synced journals
+ledger = GeneralLedger(mirror)
+
+# batch creates of any size, split into chunks sent in parallel
+bulk_writer = BulkWriter(
+    chunk_size=app.config["BULK_CHUNK_SIZE"], parallel=app.config["BULK_PARALLEL_CHUNKS"]
+)
+
+# rendered sidebar menu per url root, the menu is the same on every page
+sidebar_cache = {}
 
 # configure flask-oauthlib application
 # TODO fetch config from https://identity.xero.com/.well-known/openid-configuration #1
@@ -69,15 +132,27 @@ xero = oauth.remote_app(
 
 
 # configure xero-python sdk client
-api_client = ApiClient(
-    Configuration(
-        debug=app.config["DEBUG"],
-        oauth2_token=OAuth2Token(
-            client_id=app.config["CLIENT_ID"], client_secret=app.config["CLIENT_SECRET"]
-        ),
+api_configuration = Configuration(
+    debug=app.config["DEBUG"],
+    oauth2_token=OAuth2Token(
+        client_id=app.config["CLIENT_ID"], client_secret=app.config["CLIENT_SECRET"]
+    ),
+)
+# keep enough pooled connections for every worker thread running concurrent calls
+api_configuration.connection_pool_maxsize = app.config["API_CONNECTION_POOL_MAXSIZE"]
+api_client = RateLimitedApiClient(
+    api_configuration,
+    rate_limiter=TenantRateLimiter(
+        per_minute=app.config["API_CALLS_PER_MINUTE"],
+        concurrent=app.config["API_CONCURRENT_CALLS"],
+        max_wait=app.config["API_MAX_WAIT"],
+        day_block=app.config["API_DAY_LIMIT_BLOCK"],
     ),
-    pool_threads=1,
+    max_retries=app.config["API_MAX_RETRIES"],
+    pool_threads=app.config["API_POOL_THREADS"],
+    on_write=written_tenants.add,
 )
+keep_raw_bodies(api_client)
 
 # configure token persistence and exchange point between flask-oauthlib and xero-python
 @xero.tokengetter
@@ -88,8 +163,45 @@ def obtain_xero_oauth2_token():
 @xero.tokensaver
 @api_client.oauth2_token_saver
 def store_xero_oauth2_token(token):
-    session["token"] = token
-    session.modified = True
+    # the sdk saves the token after every refresh check, only write real changes
+    if session.get("token") != token:
+        session["token"] = token
+        session.modified = True
+
+def refresh_xero_oauth2_token(token):
+    # refresh outside of the session so it can run on a background thread
+    oauth2_token = OAuth2Token(
+        client_id=app.config["CLIENT_ID"], client_secret=app.config["CLIENT_SECRET"]
+    )
+    oauth2_token.update_token(**token)
+    token_api = TokenApi(api_client, app.config["CLIENT_ID"], app.config["CLIENT_SECRET"])
+    return oauth2_token.fetch_access_token(token_api)
+
+token_refresher = TokenRefresher(
+    refresh_xero_oauth2_token,
+    refresh_margin=app.config["TOKEN_REFRESH_MARGIN"],
+    expiration_buffer=OAuth2Token.EXPIRATION_BUFFER_DEFAULT,
+)
+
+@app.before_request
+def refresh_xero_oauth2_token_ahead_of_expiry():
+    if request.endpoint in (
+        "index", "static", "login", "oauth_callback", "logout", "revoke_token"
+    ):
+        return
+    xero_token = obtain_xero_oauth2_token()
+    if not xero_token:
+        return
+    timeout = app.config["TOKEN_REFRESH_TIMEOUT"]
+    try:
+        new_token = token_refresher.current_token(xero_token, timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        app.logger.warning("oauth2 token refresh took over %ss, using the current token", timeout)
+    except Exception as exception:
+        # eg. a revoked refresh token, the sdk still refreshes or fails on the api call
+        app.logger.warning("oauth2 token refresh failed, using the current token: %s", exception)
+    else:
+        store_xero_oauth2_token(new_token)
 
 def xero_token_required(function):
     @wraps(function)
@@ -102,17 +214,107 @@ def xero_token_required(function):
 
     return decorator
 
+@app.before_request
+def select_json_style():
+    # ?format=json serves compact api responses to machine consumers
+    g.json_only = request.args.get("format") == "json"
+    json_style.set("compact" if g.json_only else "pretty")
+    # compact pages return the api response body of the models they show as is
+    g.raw_bodies_token = raw_bodies.set({} if g.json_only else None)
+    # large read_all pages (or ?stream=1) send their json while it is being encoded
+    page = demos.current_page()
+    g.json_stream = (page is not None and page.stream) or request.args.get("stream") == "1"
+    json_stream.set(g.json_stream)
+
+@app.before_request
+def serve_from_mirror():
+    # ?source=mirror answers synced read pages locally, ?id= picks the read_one record
+    page = demos.current_page()
+    if request.args.get("source") != "mirror" or page is None or page.mirror is None:
+        return None
+    xero_tenant_id = get_xero_tenant_id()
+    if xero_tenant_id is None:
+        return None
+
+    entity = page.mirror
+    title = entity.replace("_", " ").capitalize()
+    started = time.perf_counter()
+    if page.name.endswith("_read_all"):
+        bodies = mirror.bodies(xero_tenant_id, entity)
+        body = "[" + ",".join(bodies) + "]"
+        output = "{} read from the local mirror: {}".format(title, len(bodies))
+    else:
+        body = mirror.body(xero_tenant_id, entity, request.args.get("id"))
+        output = "{} read from the local mirror".format(title)
+    if body is None:
+        return render_template(
+            "output.html", title=title,
+            output="Error: not in the local mirror, sync it at /sync?entity=" + entity,
+        )
+    json = RawJSON(body).json()
+
+    output += " in {:.2f} ms".format((time.perf_counter() - started) * 1000)
+    return render_template("output.html", title=title, output=output, json=json)
+
+@app.before_request
+def serve_raw_json():
+    # ?format=json forwards the api response of a raw page unparsed, no sdk models are built
+    page = demos.current_page()
+    if not g.json_only or page is None or page.raw is None:
+        return None
+    xero_tenant_id = get_xero_tenant_id()
+    if xero_tenant_id is None:
+        return None
+
+    api_class, method = page.raw[:2]
+    kwargs = page.raw[2] if len(page.raw) > 2 else {}
+    try:
+        response = getattr(get_api(api_class), method)(
+            xero_tenant_id, _preload_content=False, **kwargs
+        )
+    except AccountingBadRequestException as exception:
+        return app.response_class(jsonify(exception.error_data), mimetype="application/json")
+    try:
+        body = response.data
+    finally:
+        response.release_conn()
+    return app.response_class(body, mimetype="application/json")
+
+@app.teardown_request
+def reset_raw_bodies(exception=None):
+    # raw bodies map model ids, which are reused once the request's models are freed
+    token = g.pop("raw_bodies_token", None)
+    if token is not None:
+        raw_bodies.reset(token)
+
+def render_template(template_name, **context):
+    page = demos.current_page()
+    if page is not None:
+        # demo pages take their title and sidebar entry from the registry
+        context.setdefault("title", page.title)
+        context.update(set=page.menu, endpoint=page.section, page=page.name)
+    if g.get("json_only") and context.get("json"):
+        return app.response_class(context["json"], mimetype="application/json")
+    if g.get("json_stream"):
+        return app.response_class(stream_template(template_name, **context))
+    return flask_render_template(template_name, **context)
+
+@app.template_global()
+def sidebar():
+    # the selected menu entry is highlighted by script in base.html, not in the fragment
+    fragment = sidebar_cache.get(request.script_root)
+    if fragment is None or app.jinja_env.auto_reload:
+        fragment = Markup(
+            app.jinja_env.get_template("sidebar.html").render(menus=demos.menus())
+        )
+        sidebar_cache[request.script_root] = fragment
+    return fragment
+
 def attachment_image():
     return Path(__file__).resolve().parent.joinpath("helo-heros.jpg")
 
 def get_code_snippet(endpoint,action):
-    s = open("app.py").read()
-    startstr = "["+ endpoint +":"+ action +"]"
-    endstr = "#[/"+ endpoint +":"+ action +"]"
-    start = s.find(startstr) + len(startstr)
-    end = s.find(endstr)
-    substring = s[start:end]
-    return substring
+    return snippet_index.get(endpoint, action)
 
 def get_random_num():
     return str(randint(0, 10000))
@@ -130,18 +332,42 @@ def index():
 @app.route("/tenants")
 @xero_token_required
 def tenants():
-    identity_api = IdentityApi(api_client)
-    accounting_api = AccountingApi(api_client)
-    asset_api = AssetApi(api_client)
+    identity_api = get_api(IdentityApi)
+    accounting_api = get_api(AccountingApi)
+    asset_api = get_api(AssetApi)
+    timeout = app.config["TENANT_FETCH_TIMEOUT"]
+
+    # fetch organisations of all tenants concurrently, a failing tenant doesn't fail the page
+    connections = identity_api.get_connections()
+    tenant_ids = [
+        connection.tenant_id
+        for connection in connections
+        if connection.tenant_type == "ORGANISATION"
+    ]
+    outcomes = fan_out(
+        api_client,
+        [
+            (
+                accounting_api.get_organisations,
+                (),
+                {"xero_tenant_id": tenant_id, "_request_timeout": timeout},
+            )
+            for tenant_id in tenant_ids
+        ],
+    )
+    organisations = dict(zip(tenant_ids, outcomes))
 
     available_tenants = []
-    for connection in identity_api.get_connections():
+    for connection in connections:
         tenant = serialize(connection)
         if connection.tenant_type == "ORGANISATION":
-            organisations = accounting_api.get_organisations(
-                xero_tenant_id=connection.tenant_id
-            )
-            tenant["organisations"] = serialize(organisations)
+            outcome = organisations[connection.tenant_id]
+            if outcome.error is None:
+                tenant["organisations"] = serialize(outcome.value)
+            else:
+                tenant["error"] = "Error: {}".format(
+                    getattr(outcome.error, "reason", None) or outcome.error
+                )
 
         available_tenants.append(tenant)
 
@@ -152,6 +378,129 @@ def tenants():
         len=0
     )
 
+# sidebar menus and their sections, demo pages are listed under them with
+# @demos.page(title, menu=(menu, section, label))
+demos.add_menus((
+    ("accounting", "Accounting", "fa-dashboard", (
+        ("account", "Accounts"),
+        ("bank_transaction", "Bank Transactions"),
+        ("bank_transfer", "Bank Transfers"),
+        ("batch_payment", "Batch Payments"),
+        ("branding_theme", "Branding Themes"),
+        ("contact", "Contacts"),
+        ("contact_group", "Contact Groups"),
+        ("credit_note", "Credit Notes"),
+        ("currency", "Currencies"),
+        ("employee", "Employees"),
+        ("expense_claim", "Expense Claims"),
+        ("invoice", "Invoices"),
+        ("invoice_reminder", "Invoice Reminders"),
+        ("item", "Items"),
+        ("journals", "Journals"),
+        ("linked_transactions", "Linked Transactions"),
+        ("manual_journals", "Manual Journals"),
+        ("organisations", "Organisations"),
+        ("overpayments", "Overpayments"),
+        ("payments", "Payments"),
+        ("payment_service", "Payment Services"),
+        ("prepayments", "Prepayments"),
+        ("purchase_orders", "Purchase Orders"),
+        ("quotes", "Quotes"),
+        ("receipts", "Receipts"),
+        ("repeating_invoices", "Repeating Invoices"),
+        ("reports", "Reports"),
+        ("tax_rate", "Tax Rates"),
+        ("tracking_categories", "Tracking Categories"),
+        ("user", "Users"),
+    )),
+    ("assets", "Assets", "fa-dashboard", (
+        ("asset", "Assets"),
+        ("assettype", "Asset Types"),
+        ("settings", "Asset Settings"),
+    )),
+    ("projects", "Projects", "fa-user", (
+        ("project", "Projects"),
+        ("projectuser", "Project Users"),
+        ("task", "Tasks"),
+        ("time", "Time"),
+    )),
+    ("payroll_au", "Payroll AU", "fa-user", (
+        ("employee", "Employee"),
+        ("leave_application", "Leave Applications"),
+        ("pay_item", "Pay Items"),
+        ("payroll_calendar", "Payroll Calendar"),
+        ("pay_run", "Pay Runs"),
+        ("pay_slip", "Pay Slips"),
+        ("settings", "Settings"),
+        ("superfund", "SuperFunds"),
+        ("superfund_product", "SuperFund Products"),
+        ("timesheet", "Timesheets"),
+    )),
+    ("payroll_nz", "Payroll NZ", "fa-user", (
+        ("employee_nz", "Employee"),
+        ("employment_nz", "Employment"),
+        ("employee_tax_nz", "Employee Tax"),
+        ("employee_leave_setup_nz", "Emp Leave Setup"),
+        ("employee_leave_nz", "Employee Leave"),
+        ("employee_leave_balances_nz", "Emp Leave Balances"),
+        ("employee_payment_method_nz", "Payment Methods"),
+        ("pay_run_calendars_nz", "Payrun Calendars"),
+        ("employee_salary_and_wages_nz", "Emp Salary & Wages"),
+        ("employee_opening_balances_nz", "Emp Opening Balances"),
+        ("employee_leave_periods_nz", "Emp Leave Periods"),
+        ("employee_leave_types_nz", "Emp Leave Types"),
+        ("employee_pay_templates_nz", "Emp Pay Templates"),
+        ("earnings_rates_nz", "Earnings Rates"),
+        ("deductions_nz", "Deductions"),
+        ("leave_types_nz", "Leave Types"),
+        ("reimbursements_nz", "Reimbursements"),
+        ("statutory_deductions_nz", "Statutory Deductions"),
+        ("superannuation_nz", "Superannuation"),
+        ("pay_runs_nz", "Payruns"),
+        ("pay_slips_nz", "Payslips"),
+        ("timesheets_nz", "Timesheets"),
+        ("settings_nz", "Settings"),
+        ("tracking_categories_nz", "Tracking Categories"),
+    )),
+    ("payroll_uk", "Payroll UK", "fa-user", (
+        ("employee_uk", "Employee"),
+        ("employment_uk", "Employment"),
+        ("employee_tax_uk", "Employee Tax"),
+        ("employee_opening_balance_uk", "Emp Opening Balance"),
+        ("employee_leaves_uk", "Employees Leave"),
+        ("employee_leave_balances_uk", "Emp Leave Balances"),
+        ("employee_statutory_leave_balance_uk", "Emp Statutory Leave Bal"),
+        ("employee_statutory_leave_summary_uk", "Emp Statutory Leave Su"),
+        ("employee_statutory_sick_leave_uk", "Emp Statutory Sick Le"),
+        ("employee_leave_periods_uk", "Emp Leave Periods"),
+        ("employee_leave_types_uk", "Emp Leave Types"),
+        ("employee_pay_template_uk", "Emp Pay Template"),
+        ("employer_pensions_uk", "Employer Pensions"),
+        ("deductions_uk", "Deductions"),
+        ("earnings_orders_uk", "Earnings Orders"),
+        ("earnings_rates_uk", "Earnings Rates"),
+        ("leave_types_uk", "Leave Types"),
+        ("reimbursements_uk", "Reimbursements"),
+        ("timesheets_uk", "Timesheets"),
+        ("payment_methods_uk", "Payment Methods"),
+        ("pay_run_calendars_uk", "Payrun Calendars"),
+        ("salary_and_wage_uk", "Salary and Wage"),
+        ("pay_runs_uk", "Pay runs"),
+        ("pay_slips_uk", "Pay slips"),
+        ("settings_uk", "Settings"),
+        ("tracking_categories_uk", "Tracking Categories"),
+    )),
+    ("files", "Files", "fa-user", (
+        ("file", "File"),
+        ("folder", "Folder"),
+    )),
+    ("finance", "Finance", "fa-user", (
+        ("accounting_activities", "Accounting Activities"),
+        ("cash_validation", "Cash Validation"),
+        ("financial_statements", "Financial Statements"),
+    )),
+))
+
 # ACCOUNTS
 # getAccounts x
 # createAccount x
@@ -164,7 +513,10 @@ def tenants():
 # updateAccountAttachmentByFileName x
 # createAccountAttachmentByFileName x
 
-@app.route("/accounting_account_read_all")
+@demos.page(
+    "Accounts", menu=("accounting", "account", "Read (all)"), mirror="accounts",
+    raw=(AccountingApi, "get_accounts", {"order": "Name ASC"}),
+)
 @xero_token_required
 def accounting_account_read_all():
     code = get_code_snippet("ACCOUNTS","READ_ALL")
@@ -189,21 +541,18 @@ def accounting_account_read_all():
     #[/ACCOUNTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Accounts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="account", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_account_read_one")
+@demos.page("Accounts", menu=("accounting", "account", "Read (one)"), mirror="accounts")
 @xero_token_required
 def accounting_account_read_one():
     code = get_code_snippet("ACCOUNTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id
-        )
-        account_id = getvalue(read_accounts, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -221,21 +570,21 @@ def accounting_account_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Account read with name {} ".format(
-            getvalue(read_accounts, "accounts.0.name", "")
+            getvalue(read_one_account, "accounts.0.name", "")
         )
         json = serialize_model(read_one_account)
     #[/ACCOUNTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Accounts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="account", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_account_get_attachments")
+@demos.page("Accounts", menu=("accounting", "account", "Read (attachments)"))
 @xero_token_required
 def accounting_account_get_attachments():
     code = get_code_snippet("ACCOUNTS","GET_ATTACHMENTS")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -291,15 +640,15 @@ def accounting_account_get_attachments():
     #[/ACCOUNTS:GET_ATTACHMENTS]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="get_attachments"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_get_attachment_by_id")
+@demos.page("Accounts", menu=("accounting", "account", "Read (attachment by ID)"))
 @xero_token_required
 def accounting_account_get_attachment_by_id():
     code = get_code_snippet("ACCOUNTS","GET_ATTACHMENTS_BY_ID")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -356,15 +705,15 @@ def accounting_account_get_attachment_by_id():
     #[/ACCOUNTS:GET_ATTACHMENTS_BY_ID]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="get_attachment_by_id"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_get_attachment_by_file_name")
+@demos.page("Accounts", menu=("accounting", "account", "Read (attachment by file name)"))
 @xero_token_required
 def accounting_account_get_attachment_by_file_name():
     code = get_code_snippet("ACCOUNTS","GET_ATTACHMENT_BY_FILE_NAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -421,10 +770,10 @@ def accounting_account_get_attachment_by_file_name():
     #[/ACCOUNTS:GET_ATTACHMENT_BY_FILE_NAME]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="get_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_create")
+@demos.page("Accounts", menu=("accounting", "account", "Create"))
 @xero_token_required
 def accounting_account_create():
     code = get_code_snippet("ACCOUNTS","CREATE")
@@ -455,15 +804,15 @@ def accounting_account_create():
     #[/ACCOUNTS:CREATE]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_update")
+@demos.page("Accounts", menu=("accounting", "account", "Update"))
 @xero_token_required
 def accounting_account_update():
     code = get_code_snippet("ACCOUNTS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -507,15 +856,15 @@ def accounting_account_update():
     #[/ACCOUNTS:UPDATE]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_create_attachment")
+@demos.page("Accounts", menu=("accounting", "account", "Create (attachment)"))
 @xero_token_required
 def accounting_account_create_attachment():
     code = get_code_snippet("ACCOUNTS","CREATE_ATTACHMENT")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -563,15 +912,15 @@ def accounting_account_create_attachment():
     #[/ACCOUNTS:CREATE_ATTACHMENT]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="create_attachment"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_update_attachment")
+@demos.page("Accounts", menu=("accounting", "account", "Update (attachment)"))
 @xero_token_required
 def accounting_account_update_attachment():
     code = get_code_snippet("ACCOUNTS","UPDATE_ATTACHMENT")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -637,15 +986,15 @@ def accounting_account_update_attachment():
     #[/ACCOUNTS:UPDATE_ATTACHMENT]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="update_attachment"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_archive")
+@demos.page("Accounts", menu=("accounting", "account", "Archive"))
 @xero_token_required
 def accounting_account_archive():
     code = get_code_snippet("ACCOUNTS","ARCHIVE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -689,15 +1038,15 @@ def accounting_account_archive():
     #[/ACCOUNTS:ARCHIVE]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="archive"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_account_delete")
+@demos.page("Accounts", menu=("accounting", "account", "Delete"))
 @xero_token_required
 def accounting_account_delete():
     code = get_code_snippet("ACCOUNTS","DELETE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE ACCOUNT
     account = Account(
@@ -733,7 +1082,7 @@ def accounting_account_delete():
     #[/ACCOUNTS:DELETE]
 
     return render_template(
-        "output.html", title="Accounts", code=code, output=output, json=json, len = 0, set="accounting", endpoint="account", action="delete"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # BANK TRANSACTIONS
@@ -750,7 +1099,10 @@ def accounting_account_delete():
 # getBankTransactionsHistory x
 # createBankTransactionHistoryRecord x
 
-@app.route("/accounting_bank_transaction_read_all")
+@demos.page(
+    "Bank Transactions", menu=("accounting", "bank_transaction", "Read (all)"), stream=True, mirror="bank_transactions",
+    raw=(AccountingApi, "get_bank_transactions", {"page": 1}),
+)
 @xero_token_required
 def accounting_bank_transaction_read_all():
     code = get_code_snippet("BANKTRANSACTIONS","READ_ALL")
@@ -761,34 +1113,33 @@ def accounting_bank_transaction_read_all():
 
     try:
         read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
+            xero_tenant_id, page=1
         )
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     else:
-        output = "Bank Transactions read {} total".format(
-            len(read_bank_transactions.bank_transactions)
+        # the first page holds up to 100 records, pagination (when sent) counts all of them
+        output = "Bank Transactions read {} of {} total".format(
+            len(read_bank_transactions.bank_transactions),
+            getvalue(read_bank_transactions, "pagination.item_count", len(read_bank_transactions.bank_transactions)),
         )
         json = serialize_model(read_bank_transactions)
     #[/BANKTRANSACTIONS:READ_ALL]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transaction_read_one")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read (one)"), mirror="bank_transactions")
 @xero_token_required
 def accounting_bank_transaction_read_one():
     code = get_code_snippet("BANKTRANSACTIONS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -806,47 +1157,38 @@ def accounting_bank_transaction_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Bank transaction read with id {} ".format(
-            getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+            bank_transaction_id
         )
         json = serialize_model(read_one_bank_transaction)
     #[/BANKTRANSACTIONS:READ_ONE]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transaction_create")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Create"))
 @xero_token_required
 def accounting_bank_transaction_create():
     code = get_code_snippet("BANKTRANSACTIONS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "TaxType!=\"NONE\" AND TaxType!=\"BASEXCLUDED\""
     try:
-        read_accounts_for_valid_code = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_code = getvalue(read_accounts_for_valid_code, "accounts.0.code", "")
+        account_code = get_seed_value(AccountingApi, "get_accounts", "accounts.0.code", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Status==\"ACTIVE\" AND Type==\"BANK\""
     try:
-        read_accounts_for_valid_status = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts_for_valid_status, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -890,41 +1232,32 @@ def accounting_bank_transaction_create():
     #[/BANKTRANSACTIONS:CREATE]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_update_or_create")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Update or Create"))
 @xero_token_required
 def accounting_bank_transaction_update_or_create():
     code = get_code_snippet("BANKTRANSACTIONS","UPDATE_OR_CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "TaxType!=\"NONE\" AND TaxType!=\"BASEXCLUDED\""
     try:
-        read_accounts_for_valid_code = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_code = getvalue(read_accounts_for_valid_code, "accounts.0.code", "")
+        account_code = get_seed_value(AccountingApi, "get_accounts", "accounts.0.code", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Status==\"ACTIVE\" AND Type==\"BANK\""
     try:
-        read_accounts_for_valid_status = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts_for_valid_status, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -969,51 +1302,39 @@ def accounting_bank_transaction_update_or_create():
     #[/BANKTRANSACTIONS:UPDATE_OR_CREATE]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="update_or_create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transaction_update")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Update"))
 @xero_token_required
 def accounting_bank_transaction_update():
     code = get_code_snippet("BANKTRANSACTIONS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     where = "Status!=\"VOIDED\""
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id, where=where
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "TaxType!=\"NONE\" AND TaxType!=\"BASEXCLUDED\""
     try:
-        read_accounts_for_valid_code = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_code = getvalue(read_accounts_for_valid_code, "accounts.0.code", "")
+        account_code = get_seed_value(AccountingApi, "get_accounts", "accounts.0.code", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Status==\"ACTIVE\" AND Type==\"BANK\""
     try:
-        read_accounts_for_valid_status = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts_for_valid_status, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1060,21 +1381,18 @@ def accounting_bank_transaction_update():
     #[/BANKTRANSACTIONS:UPDATE]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="update"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transaction_get_attachments")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read (attachments)"))
 @xero_token_required
 def accounting_bank_transaction_get_attachments():
     code = get_code_snippet("BANKTRANSACTIONS","GET_ATTACHMENTS")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1116,21 +1434,18 @@ def accounting_bank_transaction_get_attachments():
     #[/BANKTRANSACTIONS:GET_ATTACHMENTS]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="get_attachments"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_get_attachment_by_id")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read (attachment by ID)"))
 @xero_token_required
 def accounting_bank_transaction_get_attachment_by_id():
     code = get_code_snippet("BANKTRANSACTIONS","GET_ATTACHMENTS_BY_ID")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1173,21 +1488,18 @@ def accounting_bank_transaction_get_attachment_by_id():
     #[/BANKTRANSACTIONS:GET_ATTACHMENTS_BY_ID]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="get_attachment_by_id"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_get_attachment_by_file_name")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read (attachment by file name)"))
 @xero_token_required
 def accounting_bank_transaction_get_attachment_by_file_name():
     code = get_code_snippet("BANKTRANSACTIONS","GET_ATTACHMENT_BY_FILE_NAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1230,21 +1542,18 @@ def accounting_bank_transaction_get_attachment_by_file_name():
     #[/BANKTRANSACTIONS:GET_ATTACHMENT_BY_FILE_NAME]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="get_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_attachment_create_by_file_name")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Create (attachment)"))
 @xero_token_required
 def accounting_bank_transaction_attachment_create_by_file_name():
     code = get_code_snippet("BANKTRANSACTIONATTACHMENTS","CREATEBYFILENAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1279,21 +1588,18 @@ def accounting_bank_transaction_attachment_create_by_file_name():
     #[/BANKTRANSACTIONATTACHMENTS:CREATEBYFILENAME]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="create_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_update_attachment")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Update (attachment)"))
 @xero_token_required
 def accounting_bank_transaction_update_attachment():
     code = get_code_snippet("BANKTRANSACTIONS","UPDATE_ATTACHMENT")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1345,21 +1651,18 @@ def accounting_bank_transaction_update_attachment():
     #[/BANKTRANSACTIONS:UPDATE_ATTACHMENT]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transaction", action="update_attachment"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transaction_history_read")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read History"))
 @xero_token_required
 def accounting_bank_transaction_history_read():
     code = get_code_snippet("BANKTRANSACTIONHISTORY","READ")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1383,21 +1686,18 @@ def accounting_bank_transaction_history_read():
     #[/BANKTRANSACTIONHISTORY:READ]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="read_history"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transaction_history_create")
+@demos.page("Bank Transactions", menu=("accounting", "bank_transaction", "Read History"))
 @xero_token_required
 def accounting_bank_transaction_history_create():
     code = get_code_snippet("BANKTRANSACTIONHISTORY","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transactions = accounting_api.get_bank_transactions(
-            xero_tenant_id
-        )
-        bank_transaction_id = getvalue(read_bank_transactions, "bank_transactions.0.bank_transaction_id", "")
+        bank_transaction_id = get_seed_value(AccountingApi, "get_bank_transactions", "bank_transactions.0.bank_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1429,7 +1729,7 @@ def accounting_bank_transaction_history_create():
     #[/BANKTRANSACTIONHISTORY:CREATE]
 
     return render_template(
-        "output.html", title="Bank Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transaction", action="create_history"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # BANK TRANSFERS TODO
@@ -1444,7 +1744,10 @@ def accounting_bank_transaction_history_create():
 # getBankTransferHistory
 # createBankTransferHistoryRecord
 
-@app.route("/accounting_bank_transfer_read_all")
+@demos.page(
+    "Bank Transfers", menu=("accounting", "bank_transfer", "Read (all)"),
+    raw=(AccountingApi, "get_bank_transfers"),
+)
 @xero_token_required
 def accounting_bank_transfer_read_all():
     code = get_code_snippet("BANKTRANSFERS","READ_ALL")
@@ -1468,21 +1771,18 @@ def accounting_bank_transfer_read_all():
     #[/BANKTRANSFERS:READ_ALL]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transfer", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transfer_read_one")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Read (one)"))
 @xero_token_required
 def accounting_bank_transfer_read_one():
     code = get_code_snippet("BANKTRANSFERS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_bank_transfers = accounting_api.get_bank_transfers(
-            xero_tenant_id
-        )
-        bank_transfer_id = getvalue(read_bank_transfers, "bank_transfers.0.bank_transfer_id", "")
+        bank_transfer_id = get_seed_value(AccountingApi, "get_bank_transfers", "bank_transfers.0.bank_transfer_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -1500,21 +1800,21 @@ def accounting_bank_transfer_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Bank transfer read with id {} ".format(
-            getvalue(read_bank_transfers, "bank_transfers.0.bank_transfer_id", "")
+            bank_transfer_id
         )
         json = serialize_model(read_one_bank_transfer)
     #[/BANKTRANSFERS:READ_ONE]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transfer", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transfer_create")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Create"))
 @xero_token_required
 def accounting_bank_transfer_create():
     code = get_code_snippet("BANKTRANSFERS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -1579,15 +1879,15 @@ def accounting_bank_transfer_create():
     #[/BANKTRANSFERS:CREATE]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, json=json, output=output, len = 0, set="accounting", endpoint="bank_transfer", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_bank_transfer_get_attachments")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Read (attachments)"))
 @xero_token_required
 def accounting_bank_transfer_get_attachments():
     code = get_code_snippet("BANKTRANSFERS","GET_ATTACHMENTS")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -1679,15 +1979,15 @@ def accounting_bank_transfer_get_attachments():
     #[/BANKTRANSFERS:GET_ATTACHMENTS]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transfer", action="get_attachments"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transfer_get_attachment_by_id")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Read (attachment by ID)"))
 @xero_token_required
 def accounting_bank_transfer_get_attachment_by_id():
     code = get_code_snippet("BANKTRANSFERS","GET_ATTACHMENTS_BY_ID")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -1780,15 +2080,15 @@ def accounting_bank_transfer_get_attachment_by_id():
     #[/BANKTRANSFERS:GET_ATTACHMENTS_BY_ID]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transfer", action="get_attachment_by_id"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transfer_get_attachment_by_file_name")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Read (attachment by file name)"))
 @xero_token_required
 def accounting_bank_transfer_get_attachment_by_file_name():
     code = get_code_snippet("BANKTRANSFERS","GET_ATTACHMENT_BY_FILE_NAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -1881,15 +2181,15 @@ def accounting_bank_transfer_get_attachment_by_file_name():
     #[/BANKTRANSFERS:GET_ATTACHMENT_BY_FILE_NAME]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transfer", action="get_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transfer_attachment_create_by_file_name")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Create (attachment)"))
 @xero_token_required
 def accounting_bank_transfer_attachment_create_by_file_name():
     code = get_code_snippet("BANKTRANSFERATTACHMENTS","CREATEBYFILENAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -1974,15 +2274,15 @@ def accounting_bank_transfer_attachment_create_by_file_name():
     #[/BANKTRANSFERATTACHMENTS:CREATEBYFILENAME]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transfer", action="create_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_bank_transfer_update_attachment")
+@demos.page("Bank Transfers", menu=("accounting", "bank_transfer", "Update (attachment)"))
 @xero_token_required
 def accounting_bank_transfer_update_attachment():
     code = get_code_snippet("BANKTRANSFERS","UPDATE_ATTACHMENT")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     new_account_1 = Account(
         name="FooBar" + get_random_num(),
@@ -2083,7 +2383,7 @@ def accounting_bank_transfer_update_attachment():
     #[/BANKTRANSFERS:UPDATE_ATTACHMENT]
 
     return render_template(
-        "output.html", title="Bank Transfers", code=code, output=output, json=json, len = 0, set="accounting", endpoint="bank_transfer", action="update_attachment"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -2176,7 +2476,10 @@ def accounting_bank_transfer_update_attachment():
 # getBatchPaymentHistory
 # createBatchPaymentHistoryRecord
 
-@app.route("/accounting_batch_payment_read_all")
+@demos.page(
+    "Batch Payments", menu=("accounting", "batch_payment", "Read (all)"),
+    raw=(AccountingApi, "get_batch_payments"),
+)
 @xero_token_required
 def accounting_batch_payment_read_all():
     code = get_code_snippet("BATCHPAYMENTS","READ_ALL")
@@ -2200,21 +2503,18 @@ def accounting_batch_payment_read_all():
     #[/BATCHPAYMENTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Batch Payments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="batch_payment", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_batch_payment_read_one")
+@demos.page("Batch Payments", menu=("accounting", "batch_payment", "Read (one)"))
 @xero_token_required
 def accounting_batch_payment_read_one():
     code = get_code_snippet("BATCHPAYMENTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_batch_payments = accounting_api.get_batch_payments(
-            xero_tenant_id
-        )
-        batch_payment_id = getvalue(read_batch_payments, "batch_payments.0.batch_payment_id", "")
+        batch_payment_id = get_seed_value(AccountingApi, "get_batch_payments", "batch_payments.0.batch_payment_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2238,22 +2538,19 @@ def accounting_batch_payment_read_one():
     #[/BATCHPAYMENTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Batch Payments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="batch_payment", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_batch_payment_create")
+@demos.page("Batch Payments", menu=("accounting", "batch_payment", "Create"))
 @xero_token_required
 def accounting_batch_payment_create():
     code = get_code_snippet("BATCHPAYMENTS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # we need a contact
     try:
-        contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
         contact = Contact(contact_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
@@ -2349,7 +2646,7 @@ def accounting_batch_payment_create():
     #[/BATCHPAYMENTS:CREATE]
 
     return render_template(
-        "output.html", title="Batch Payments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="batch_payment", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -2442,7 +2739,10 @@ def accounting_batch_payment_create():
 # getBrandingThemePaymentServices x
 # createBrandingThemePaymentServices x
 
-@app.route("/accounting_branding_theme_read_all")
+@demos.page(
+    "Branding Themes", menu=("accounting", "branding_theme", "Read (all)"),
+    raw=(AccountingApi, "get_branding_themes"),
+)
 @xero_token_required
 def accounting_branding_theme_read_all():
     code = get_code_snippet("BRANDINGTHEMES","READ_ALL")
@@ -2466,21 +2766,18 @@ def accounting_branding_theme_read_all():
     #[/BRANDINGTHEMES:READ_ALL]
 
     return render_template(
-        "output.html", title="Branding Themes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="branding_theme", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_branding_theme_read_one")
+@demos.page("Branding Themes", menu=("accounting", "branding_theme", "Read (one)"))
 @xero_token_required
 def accounting_branding_theme_read_one():
     code = get_code_snippet("BRANDINGTHEMES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_branding_themes = accounting_api.get_branding_themes(
-            xero_tenant_id
-        )
-        branding_theme_id = getvalue(read_branding_themes, "branding_themes.0.branding_theme_id", "")
+        branding_theme_id = get_seed_value(AccountingApi, "get_branding_themes", "branding_themes.0.branding_theme_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2498,27 +2795,24 @@ def accounting_branding_theme_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Branding theme read with id {} ".format(
-            getvalue(read_branding_themes, "branding_themes.0.branding_theme_id", "")
+            branding_theme_id
         )
         json = serialize_model(read_one_branding_theme)
     #[/BRANDINGTHEMES:READ_ONE]
 
     return render_template(
-        "output.html", title="Branding Themes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="branding_theme", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_branding_theme_payment_service_read_all")
+@demos.page("Branding Themes", menu=("accounting", "branding_theme", "Read payment services"))
 @xero_token_required
 def accounting_branding_theme_payment_service_read_all():
     code = get_code_snippet("BRANDINGTHEMEPAYMENTSERVICES","READ_ALL")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
     
     try:
-        read_branding_themes = accounting_api.get_branding_themes(
-            xero_tenant_id
-        )
-        branding_theme_id = getvalue(read_branding_themes, "branding_themes.0.branding_theme_id", "")
+        branding_theme_id = get_seed_value(AccountingApi, "get_branding_themes", "branding_themes.0.branding_theme_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2542,15 +2836,15 @@ def accounting_branding_theme_payment_service_read_all():
     #[/BRANDINGTHEMEPAYMENTSERVICES:READ_ALL]
 
     return render_template(
-        "output.html", title="Branding Themes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="branding_theme_payment_service", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_branding_theme_payment_service_create")
+@demos.page("Branding Themes", menu=("accounting", "branding_theme", "Create payment service"))
 @xero_token_required
 def accounting_branding_theme_payment_service_create():
     code = get_code_snippet("BRANDINGTHEMEPAYMENTSERVICES","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # we'll need a payment service
     new_payment_service = PaymentService(
@@ -2572,10 +2866,7 @@ def accounting_branding_theme_payment_service_create():
 
     # we'll also need a branding theme
     try:
-        read_branding_themes = accounting_api.get_branding_themes(
-            xero_tenant_id
-        )
-        branding_theme_id = getvalue(read_branding_themes, "branding_themes.0.branding_theme_id", "")
+        branding_theme_id = get_seed_value(AccountingApi, "get_branding_themes", "branding_themes.0.branding_theme_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2601,7 +2892,7 @@ def accounting_branding_theme_payment_service_create():
     #[/BRANDINGTHEMEPAYMENTSERVICES:CREATE]
 
     return render_template(
-        "output.html", title="Branding Themes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="branding_theme_payment_service", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # BUDGETS TODO
@@ -2623,7 +2914,7 @@ def accounting_branding_theme_payment_service_create():
 # getContactHistory
 # createContactHistory
 
-@app.route("/accounting_contact_create_multiple")
+@demos.page("Contacts", menu=("accounting", "contact", "Create (multiple)"))
 @xero_token_required
 def accounting_contact_create_multiple():
     code = get_code_snippet("CONTACTS","CREATE_MULTIPLE")
@@ -2663,10 +2954,10 @@ def accounting_contact_create_multiple():
     #[/CONTACTS:CREATE_MULTIPLE]
 
     return render_template(
-        "output.html", title="Contacts", result_list=result_list, code=code, json=json, len=0, set="accounting", endpoint="contact", action="create_multiple"
+        "output.html", result_list=result_list, code=code, json=json, len=0
     )
 
-@app.route("/accounting_contact_create")
+@demos.page("Contacts", menu=("accounting", "contact", "Create (one)"))
 @xero_token_required
 def accounting_contact_create():
     code = get_code_snippet("CONTACTS","CREATE")
@@ -2707,10 +2998,10 @@ def accounting_contact_create():
     #[/CONTACTS:CREATE]
 
     return render_template(
-        "output.html",  title="Contacts", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="contact", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_contact_update_or_create")
+@demos.page("Contacts", menu=("accounting", "contact", "Update or Create"))
 @xero_token_required
 def accounting_contact_update_or_create():
     code = get_code_snippet("CONTACTS","UPDATE_OR_CREATE")
@@ -2748,21 +3039,18 @@ def accounting_contact_update_or_create():
     #[/CONTACTS:UPDATE_OR_CREATE]
 
     return render_template(
-        "output.html",  title="Contacts", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="contact", action="update_or_create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_contact_update")
+@demos.page("Contacts", menu=("accounting", "contact", "Update"))
 @xero_token_required
 def accounting_contact_update():
     code = get_code_snippet("CONTACTS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2795,10 +3083,13 @@ def accounting_contact_update():
     #[/CONTACTS:UPDATE]
 
     return render_template(
-        "output.html",  title="Contacts", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="contact", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_contact_read_all")
+@demos.page(
+    "Contacts", menu=("accounting", "contact", "Read (all)"), mirror="contacts",
+    raw=(AccountingApi, "get_contacts", {"page": 1}),
+)
 @xero_token_required
 def accounting_contact_read_all():
     code = get_code_snippet("CONTACTS","READ_ALL")
@@ -2809,34 +3100,33 @@ def accounting_contact_read_all():
 
     try:
         read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
+            xero_tenant_id, page=1
         )
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     else:
-        output = "Contact(s) read {} total".format(
-            len(read_contacts.contacts)
+        # the first page holds up to 100 records, pagination (when sent) counts all of them
+        output = "Contact(s) read {} of {} total".format(
+            len(read_contacts.contacts),
+            getvalue(read_contacts, "pagination.item_count", len(read_contacts.contacts)),
         )
         json = serialize_model(read_contacts)
     #[/CONTACTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Contacts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_contact_read_one")
+@demos.page("Contacts", menu=("accounting", "contact", "Read (one)"), mirror="contacts")
 @xero_token_required
 def accounting_contact_read_one():
     code = get_code_snippet("CONTACTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2860,21 +3150,18 @@ def accounting_contact_read_one():
     #[/CONTACTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Contacts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_contact_read_one_by_contact_number")
+@demos.page("Contacts", menu=("accounting", "contact", "Read (one) by num"))
 @xero_token_required
 def accounting_contact_read_one_by_contact_number():
     code = get_code_snippet("CONTACTS","READ_ONE_BY_CONTACT_NUMBER")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_number = getvalue(read_contacts, "contacts.0.contact_number", "")
+        contact_number = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_number")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -2900,7 +3187,7 @@ def accounting_contact_read_one_by_contact_number():
     #[/CONTACTS:READ_ONE_BY_CONTACT_NUMBER]
 
     return render_template(
-        "output.html", title="Contacts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact", action="read_one_by_number"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_account_get_attachments")
@@ -3276,7 +3563,10 @@ def accounting_contact_read_one_by_contact_number():
 # deleteContactGroupContacts
 # deleteContactGroupContact
 
-@app.route("/accounting_contact_group_read_all")
+@demos.page(
+    "Contact Groups", menu=("accounting", "contact_group", "Read (all)"),
+    raw=(AccountingApi, "get_contact_groups"),
+)
 @xero_token_required
 def accounting_contact_group_read_all():
     code = get_code_snippet("CONTACTGROUPS","READ_ALL")
@@ -3300,21 +3590,18 @@ def accounting_contact_group_read_all():
     #[/CONTACTGROUPS:READ_ALL]
 
     return render_template(
-        "output.html", title="Contact Groups", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact_group", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_contact_group_read_one")
+@demos.page("Contact Groups", menu=("accounting", "contact_group", "Read (one)"))
 @xero_token_required
 def accounting_contact_group_read_one():
     code = get_code_snippet("CONTACTGROUPS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contact_groups = accounting_api.get_contact_groups(
-            xero_tenant_id
-        )
-        contact_group_id = getvalue(read_contact_groups, "contact_groups.0.contact_group_id", "")
+        contact_group_id = get_seed_value(AccountingApi, "get_contact_groups", "contact_groups.0.contact_group_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3332,16 +3619,16 @@ def accounting_contact_group_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Contact group read with id {} ".format(
-            getvalue(read_contact_groups, "contact_groups.0.contact_group_id", "")
+            contact_group_id
         )
         json = serialize_model(read_one_contact_group)
     #[/CONTACTGROUPS:READ_ONE]
 
     return render_template(
-        "output.html", title="Contact Groups", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact_group", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_contact_group_create")
+@demos.page("Contact Groups", menu=("accounting", "contact_group", "Create"))
 @xero_token_required
 def accounting_contact_group_create():
     code = get_code_snippet("CONTACTGROUPS","CREATE")
@@ -3371,30 +3658,24 @@ def accounting_contact_group_create():
     #[/CONTACTGROUPS:CREATE]
 
     return render_template(
-        "output.html",  title="Contact Groups", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="contact_group", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_contact_group_contacts_create")
+@demos.page("Contact Groups", menu=("accounting", "contact_group", "Create (contact)"))
 @xero_token_required
 def accounting_contact_group_contacts_create():
     code = get_code_snippet("CONTACTGROUPCONTACTS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contact_groups = accounting_api.get_contact_groups(
-            xero_tenant_id
-        )
-        contact_group_id = getvalue(read_contact_groups, "contact_groups.0.contact_group_id", "")
+        contact_group_id = get_seed_value(AccountingApi, "get_contact_groups", "contact_groups.0.contact_group_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3426,21 +3707,18 @@ def accounting_contact_group_contacts_create():
     #[/CONTACTGROUPCONTACTS:CREATE]
 
     return render_template(
-        "output.html",  title="Contact Groups", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="contact_group", action="create_contact"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_contact_group_update")
+@demos.page("Contact Groups", menu=("accounting", "contact_group", "Update"))
 @xero_token_required
 def accounting_contact_group_update():
     code = get_code_snippet("CONTACTGROUPS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contact_groups = accounting_api.get_contact_groups(
-            xero_tenant_id
-        )
-        contact_group_id = getvalue(read_contact_groups, "contact_groups.0.contact_group_id", "")
+        contact_group_id = get_seed_value(AccountingApi, "get_contact_groups", "contact_groups.0.contact_group_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3472,7 +3750,7 @@ def accounting_contact_group_update():
     #[/CONTACTGROUPS:UPDATE]
 
     return render_template(
-        "output.html", title="Contact Groups", code=code, json=json, output=output, len = 0, set="accounting", endpoint="contact_group", action="update"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # CREDIT NOTES TODO
@@ -3491,7 +3769,10 @@ def accounting_contact_group_update():
 # getCreditNoteHistory
 # createCreditNoteHistory
 
-@app.route("/accounting_credit_note_read_all")
+@demos.page(
+    "Credit Notes", menu=("accounting", "credit_note", "Read (all)"), mirror="credit_notes",
+    raw=(AccountingApi, "get_credit_notes", {"page": 1}),
+)
 @xero_token_required
 def accounting_credit_note_read_all():
     code = get_code_snippet("CREDITNOTES","READ_ALL")
@@ -3502,34 +3783,33 @@ def accounting_credit_note_read_all():
 
     try:
         read_credit_notes = accounting_api.get_credit_notes(
-            xero_tenant_id
+            xero_tenant_id, page=1
         )
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     else:
-        output = "Credit Notes read {} total".format(
-            len(read_credit_notes.credit_notes)
+        # the first page holds up to 100 records, pagination (when sent) counts all of them
+        output = "Credit Notes read {} of {} total".format(
+            len(read_credit_notes.credit_notes),
+            getvalue(read_credit_notes, "pagination.item_count", len(read_credit_notes.credit_notes)),
         )
         json = serialize_model(read_credit_notes)
     #[/CREDITNOTES:READ_ALL]
 
     return render_template(
-        "output.html", title="Credit Notes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="credit_note", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_credit_note_read_one")
+@demos.page("Credit Notes", menu=("accounting", "credit_note", "Read (one)"), mirror="credit_notes")
 @xero_token_required
 def accounting_credit_note_read_one():
     code = get_code_snippet("CREDITNOTES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_credit_notes = accounting_api.get_credit_notes(
-            xero_tenant_id
-        )
-        credit_note_id = getvalue(read_credit_notes, "credit_notes.0.credit_note_id", "")
+        credit_note_id = get_seed_value(AccountingApi, "get_credit_notes", "credit_notes.0.credit_note_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3547,28 +3827,25 @@ def accounting_credit_note_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Credit note read with id {} ".format(
-            getvalue(read_credit_notes, "credit_notes.0.credit_note_id", "")
+            credit_note_id
         )
         json = serialize_model(read_one_credit_note)
     #[/CREDITNOTES:READ_ONE]
 
     return render_template(
-        "output.html", title="Credit Notes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="credit_note", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_credit_note_create")
+@demos.page("Credit Notes", menu=("accounting", "credit_note", "Create"))
 @xero_token_required
 def accounting_credit_note_create():
     code = get_code_snippet("CREDITNOTES","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # we're going to need a contact
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3576,10 +3853,7 @@ def accounting_credit_note_create():
     # we're going to need an account
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3645,31 +3919,25 @@ def accounting_credit_note_create():
     #[/CREDITNOTES:CREATE]
 
     return render_template(
-        "output.html",  title="Credit Notes", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="credit_note", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_credit_note_update_or_create")
+@demos.page("Credit Notes", menu=("accounting", "credit_note", "Update or Create"))
 @xero_token_required
 def accounting_credit_note_update_or_create():
     code = get_code_snippet("CREDITNOTES","UPDATECREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_code = getvalue(read_accounts, "accounts.0.account_code", "")
+        account_code = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_code", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3715,41 +3983,32 @@ def accounting_credit_note_update_or_create():
     #[/CREDITNOTES:UPDATECREATE]
 
     return render_template(
-        "output.html",  title="Credit Notes", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="credit_note", action="update_or_create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_credit_note_update")
+@demos.page("Credit Notes", menu=("accounting", "credit_note", "Update"))
 @xero_token_required
 def accounting_credit_note_update():
     code = get_code_snippet("CREDITNOTES","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_code = getvalue(read_accounts, "accounts.0.account_code", "")
+        account_code = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_code", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     where = "Status==\"SUBMITTED\""
     try:
-        read_credit_notes = accounting_api.get_credit_notes(
-            xero_tenant_id
-        )
-        credit_note_id = getvalue(read_credit_notes, "credit_notes.0.credit_note_id", "")
+        credit_note_id = get_seed_value(AccountingApi, "get_credit_notes", "credit_notes.0.credit_note_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3797,30 +4056,24 @@ def accounting_credit_note_update():
     #[/CREDITNOTES:UPDATE]
 
     return render_template(
-        "output.html",  title="Credit Notes", code=code, output=output, json=json, len = 0,  set="accounting", endpoint="credit_note", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_credit_note_allocation_create")
+@demos.page("Credit Notes", menu=("accounting", "credit_note", "Create allocation"))
 @xero_token_required
 def accounting_credit_note_allocation_create():
     code = get_code_snippet("CREDITNOTES","CREATE_ALLOCATION")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_credit_notes = accounting_api.get_credit_notes(
-            xero_tenant_id
-        )
-        credit_note_id = getvalue(read_credit_notes, "credit_notes.0.credit_note_id", "")
+        credit_note_id = get_seed_value(AccountingApi, "get_credit_notes", "credit_notes.0.credit_note_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -3856,7 +4109,7 @@ def accounting_credit_note_allocation_create():
     #[/CREDITNOTES:CREATE_ALLOCATION]
 
     return render_template(
-        "output.html", title="Credit Notes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="credit_note_allocation", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_account_get_attachments")
@@ -4227,7 +4480,10 @@ def accounting_credit_note_allocation_create():
 # getCurrencies x
 # createCurrency x
 
-@app.route("/accounting_currency_read_all")
+@demos.page(
+    "Currencies", menu=("accounting", "currency", "Read (all)"),
+    raw=(AccountingApi, "get_currencies"),
+)
 @xero_token_required
 def accounting_currency_read_all():
     code = get_code_snippet("CURRENCIES","READ_ALL")
@@ -4251,10 +4507,10 @@ def accounting_currency_read_all():
     #[/CURRENCIES:READ_ALL]
 
     return render_template(
-        "output.html", title="Currencies", code=code, json=json, output=output, len = 0, set="accounting", endpoint="currency", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_currency_create")
+@demos.page("Currencies", menu=("accounting", "currency", "Create"))
 @xero_token_required
 def accounting_currency_create():
     code = get_code_snippet("CURRENCIES","CREATE")
@@ -4284,7 +4540,7 @@ def accounting_currency_create():
     #[/CURRENCIES:CREATE]
 
     return render_template(
-        "output.html", title="Currencies", code=code, json=json, output=output, len = 0, set="accounting", endpoint="currency", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # EMPLOYEES
@@ -4293,7 +4549,10 @@ def accounting_currency_create():
 # updateOrCreateEmployees x
 # getEmployee x
 
-@app.route("/accounting_employee_read_all")
+@demos.page(
+    "Employees", menu=("accounting", "employee", "Read (all)"),
+    raw=(AccountingApi, "get_employees"),
+)
 @xero_token_required
 def accounting_employee_read_all():
     code = get_code_snippet("EMPLOYEES","READ_ALL")
@@ -4317,21 +4576,18 @@ def accounting_employee_read_all():
     #[/EMPLOYEES:READ_ALL]
 
     return render_template(
-        "output.html", title="Employees", code=code, json=json, output=output, len = 0, set="accounting", endpoint="employee", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_employee_read_one")
+@demos.page("Employees", menu=("accounting", "employee", "Read (one)"))
 @xero_token_required
 def accounting_employee_read_one():
     code = get_code_snippet("EMPLOYEES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = accounting_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(AccountingApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4349,16 +4605,16 @@ def accounting_employee_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Employee read with id {} ".format(
-            getvalue(read_employees, "employees.0.employee_id", "")
+            employee_id
         )
         json = serialize_model(read_one_employee)
     #[/EMPLOYEES:READ_ONE]
 
     return render_template(
-        "output.html", title="Employees", code=code, json=json, output=output, len = 0, set="accounting", endpoint="employee", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_employee_create")
+@demos.page("Employees", menu=("accounting", "employee", "Create"))
 @xero_token_required
 def accounting_employee_create():
     code = get_code_snippet("EMPLOYEES","CREATE")
@@ -4389,10 +4645,10 @@ def accounting_employee_create():
     #[/EMPLOYEES:CREATE]
 
     return render_template(
-        "output.html", title="Employees", code=code, json=json, output=output, len = 0, set="accounting", endpoint="employee", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_employee_update_or_create")
+@demos.page("Employees", menu=("accounting", "employee", "Update or Create"))
 @xero_token_required
 def accounting_employee_update_or_create():
     code = get_code_snippet("EMPLOYEES","UPDATEORCREATE")
@@ -4423,7 +4679,7 @@ def accounting_employee_update_or_create():
     #[/EMPLOYEES:UPDATEORCREATE]
 
     return render_template(
-        "output.html", title="Employees", code=code, json=json, output=output, len = 0, set="accounting", endpoint="employee", action="update_or_create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # EXPENSE CLAIMS (DEPRECATED) TODO
@@ -4434,7 +4690,10 @@ def accounting_employee_update_or_create():
 # getExpenseClaimHistory
 # createExpenseClaimHistory
 
-@app.route("/accounting_expense_claim_read_all")
+@demos.page(
+    "Expense Claims", menu=("accounting", "expense_claim", "Read (all)"),
+    raw=(AccountingApi, "get_expense_claims"),
+)
 @xero_token_required
 def accounting_expense_claim_read_all():
     code = get_code_snippet("EXPENSECLAIMS","READ_ALL")
@@ -4458,21 +4717,18 @@ def accounting_expense_claim_read_all():
     #[/EXPENSECLAIMS:READ_ALL]
 
     return render_template(
-        "output.html", title="Expense Claims", code=code, json=json, output=output, len = 0, set="accounting", endpoint="expense_claim", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_expense_claim_read_one")
+@demos.page("Expense Claims", menu=("accounting", "expense_claim", "Read (one)"))
 @xero_token_required
 def accounting_expense_claim_read_one():
     code = get_code_snippet("EXPENSECLAIMS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_expense_claims = accounting_api.get_expense_claims(
-            xero_tenant_id
-        )
-        expense_claim_id = getvalue(read_expense_claims, "expense_claims.0.expense_claim_id", "")
+        expense_claim_id = get_seed_value(AccountingApi, "get_expense_claims", "expense_claims.0.expense_claim_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4490,36 +4746,30 @@ def accounting_expense_claim_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Expense claim read with id {} ".format(
-            getvalue(read_expense_claims, "expense_claims.0.expense_claim_id", "")
+            expense_claim_id
         )
         json = serialize_model(read_one_expense_claim)
     #[/EXPENSECLAIMS:READ_ONE]
 
     return render_template(
-        "output.html", title="Expense Claims", code=code, json=json, output=output, len = 0, set="accounting", endpoint="expense_claim", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_expense_claim_create")
+@demos.page("Expense Claims", menu=("accounting", "expense_claim", "Create"))
 @xero_token_required
 def accounting_expense_claim_create():
     code = get_code_snippet("EXPENSECLAIMS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_users = accounting_api.get_users(
-            xero_tenant_id
-        )
-        user_id = getvalue(read_users, "users.0.user_id", "")
+        user_id = get_seed_value(AccountingApi, "get_users", "users.0.user_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     
     try:
-        read_receipts = accounting_api.get_receipts(
-            xero_tenant_id
-        )
-        receipt_id = getvalue(read_receipts, "receipts.0.receipt_id", "")
+        receipt_id = get_seed_value(AccountingApi, "get_receipts", "receipts.0.receipt_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4562,39 +4812,30 @@ def accounting_expense_claim_create():
     #[/EXPENSECLAIMS:CREATE]
 
     return render_template(
-        "output.html", title="Expense Claims", code=code, json=json, output=output, len = 0, set="accounting", endpoint="expense_claim", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_expense_claim_update")
+@demos.page("Expense Claims", menu=("accounting", "expense_claim", "Update"))
 @xero_token_required
 def accounting_expense_claim_update():
     code = get_code_snippet("EXPENSECLAIMS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_users = accounting_api.get_users(
-            xero_tenant_id
-        )
-        user_id = getvalue(read_users, "users.0.user_id", "")
+        user_id = get_seed_value(AccountingApi, "get_users", "users.0.user_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     
     try:
-        read_receipts = accounting_api.get_receipts(
-            xero_tenant_id
-        )
-        receipt_id = getvalue(read_receipts, "receipts.0.receipt_id", "")
+        receipt_id = get_seed_value(AccountingApi, "get_receipts", "receipts.0.receipt_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     
     try:
-        read_expense_claims = accounting_api.get_expense_claims(
-            xero_tenant_id
-        )
-        expense_claim_id = getvalue(read_expense_claims, "expense_claims.0.expense_claim_id", "")
+        expense_claim_id = get_seed_value(AccountingApi, "get_expense_claims", "expense_claims.0.expense_claim_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4639,7 +4880,7 @@ def accounting_expense_claim_update():
     #[/EXPENSECLAIMS:UPDATE]
 
     return render_template(
-        "output.html", title="Expense Claims", code=code, json=json, output=output, len = 0, set="accounting", endpoint="expense_claim", action="update"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -4742,7 +4983,10 @@ def accounting_expense_claim_update():
 # emailInvoice
 # getInvoiceHistory
 # createInvoiceHistory
-@app.route("/accounting_invoice_read_all")
+@demos.page(
+    "Invoices", menu=("accounting", "invoice", "Read (all)"), stream=True, mirror="invoices",
+    raw=(AccountingApi, "get_invoices", {"page": 1}),
+)
 @xero_token_required
 def accounting_invoice_read_all():
     code = get_code_snippet("INVOICES","READ_ALL")
@@ -4753,33 +4997,33 @@ def accounting_invoice_read_all():
 
     try:
         invoices_read = accounting_api.get_invoices(
-            xero_tenant_id
+            xero_tenant_id, page=1
         )
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     else:
-        output = "Total invoices found:  {}.".format(len(invoices_read.invoices)
+        # the first page holds up to 100 invoices, pagination (when sent) counts all of them
+        output = "Total invoices found:  {}, showing {}.".format(
+            getvalue(invoices_read, "pagination.item_count", len(invoices_read.invoices)),
+            len(invoices_read.invoices),
         )
         json = serialize_model(invoices_read)
     #[/INVOICES:READ_ALL]
 
     return render_template(
-        "output.html", title="Invoices",code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_read_one")
+@demos.page("Invoices", menu=("accounting", "invoice", "Read (one)"), mirror="invoices")
 @xero_token_required
 def accounting_invoice_read_one():
     code = get_code_snippet("INVOICES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4797,28 +5041,23 @@ def accounting_invoice_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Invoice read with id {} ".format(
-            getvalue(read_invoices, "invoices.0.invoice_id", "")
+            invoice_id
         )
         json = serialize_model(read_one_invoice)
     #[/INVOICES:READ_ONE]
 
     return render_template(
-        "output.html", title="Invoices", code=code, json=json, output=output, len = 0, set="accounting", endpoint="invoice", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_invoice_create")
+@demos.page("Invoices", menu=("accounting", "invoice", "Create"))
 @xero_token_required
 def accounting_invoice_create():
     code = get_code_snippet("INVOICES","CREATE")
-    xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
 
     # READ CONTACT
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4826,10 +5065,7 @@ def accounting_invoice_create():
     # READ ACCOUNT
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4874,21 +5110,18 @@ def accounting_invoice_create():
     #[/INVOICES:CREATE]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_get_attachments")
+@demos.page("Invoices", menu=("accounting", "invoice", "Read (attachments)"))
 @xero_token_required
 def accounting_invoice_get_attachments():
     code = get_code_snippet("INVOICES","GET_ATTACHMENTS")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4931,21 +5164,18 @@ def accounting_invoice_get_attachments():
     #[/INVOICES:GET_ATTACHMENTS]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="get_attachments"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_get_attachment_by_id")
+@demos.page("Invoices", menu=("accounting", "invoice", "Read (attachment by ID)"))
 @xero_token_required
 def accounting_invoice_get_attachment_by_id():
     code = get_code_snippet("INVOICES","GET_ATTACHMENTS_BY_ID")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -4989,21 +5219,18 @@ def accounting_invoice_get_attachment_by_id():
     #[/INVOICES:GET_ATTACHMENTS_BY_ID]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="get_attachment_by_id"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_get_attachment_by_file_name")
+@demos.page("Invoices", menu=("accounting", "invoice", "Read (attachment by file name)"))
 @xero_token_required
 def accounting_invoice_get_attachment_by_file_name():
     code = get_code_snippet("INVOICES","GET_ATTACHMENT_BY_FILE_NAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5046,21 +5273,18 @@ def accounting_invoice_get_attachment_by_file_name():
     #[/INVOICES:GET_ATTACHMENT_BY_FILE_NAME]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="get_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_attachment_create_by_file_name")
+@demos.page("Invoices", menu=("accounting", "invoice", "Create Attachment (by file name)"))
 @xero_token_required
 def accounting_invoice_attachment_create_by_file_name():
     code = get_code_snippet("INVOICEATTACHMENTS","CREATEBYFILENAME")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5096,21 +5320,18 @@ def accounting_invoice_attachment_create_by_file_name():
     #[/INVOICEATTACHMENTS:CREATEBYFILENAME]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="create_attachment_by_file_name"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_invoice_update_attachment")
+@demos.page("Invoices", menu=("accounting", "invoice", "Update Attachment (by file name)"))
 @xero_token_required
 def accounting_invoice_update_attachment():
     code = get_code_snippet("ACCOUNTS","UPDATE_ATTACHMENT")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_invoices = accounting_api.get_invoices(
-            xero_tenant_id
-        )
-        invoice_id = getvalue(read_invoices, "invoices.0.invoice_id", "")
+        invoice_id = get_seed_value(AccountingApi, "get_invoices", "invoices.0.invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5163,7 +5384,7 @@ def accounting_invoice_update_attachment():
     #[/INVOICES:UPDATE_ATTACHMENT]
 
     return render_template(
-        "output.html", title="Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="invoice", action="update_attachment"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -5253,7 +5474,10 @@ def accounting_invoice_update_attachment():
 # INVOICE REMINDERS
 # getInvoiceReminders x
 
-@app.route("/accounting_invoice_reminder_read_all")
+@demos.page(
+    "Invoice Reminders", menu=("accounting", "invoice_reminder", "Read (all)"),
+    raw=(AccountingApi, "get_invoice_reminders"),
+)
 @xero_token_required
 def accounting_invoice_reminder_read_all():
     code = get_code_snippet("INVOICEREMINDERS","READ_ALL")
@@ -5277,7 +5501,7 @@ def accounting_invoice_reminder_read_all():
     #[/INVOICEREMINDERS:READ_ALL]
 
     return render_template(
-        "output.html", title="Invoice Reminders", code=code, json=json, output=output, len = 0, set="accounting", endpoint="invoice_reminder", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # ITEMS TODO
@@ -5290,7 +5514,7 @@ def accounting_invoice_reminder_read_all():
 # getItemHistory
 # createItemHistory
 
-@app.route("/accounting_item_read_all")
+@demos.page("Items", menu=("accounting", "item", "Read (all)"), raw=(AccountingApi, "get_items"))
 @xero_token_required
 def accounting_item_read_all():
     code = get_code_snippet("ITEMS","READ_ALL")
@@ -5314,21 +5538,18 @@ def accounting_item_read_all():
     #[/ITEMS:READ_ALL]
 
     return render_template(
-        "output.html", title="Items", code=code, json=json, output=output, len = 0, set="accounting", endpoint="item", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_item_read_one")
+@demos.page("Items", menu=("accounting", "item", "Read (one)"))
 @xero_token_required
 def accounting_item_read_one():
     code = get_code_snippet("ITEMS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_items = accounting_api.get_items(
-            xero_tenant_id
-        )
-        item_id = getvalue(read_items, "items.0.item_id", "")
+        item_id = get_seed_value(AccountingApi, "get_items", "items.0.item_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5346,16 +5567,16 @@ def accounting_item_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Item read with id {} ".format(
-            getvalue(read_items, "items.0.item_id", "")
+            item_id
         )
         json = serialize_model(read_one_item)
     #[/ITEMS:READ_ONE]
 
     return render_template(
-        "output.html", title="Items", code=code, json=json, output=output, len = 0, set="accounting", endpoint="item", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_item_create")
+@demos.page("Items", menu=("accounting", "item", "Create"))
 @xero_token_required
 def accounting_item_create():
     code = get_code_snippet("ITEMS","CREATE")
@@ -5400,7 +5621,7 @@ def accounting_item_create():
     #[/ITEMS:CREATE]
 
     return render_template(
-        "output.html", title="Items", code=code, json=json, output=output, len = 0, set="accounting", endpoint="item", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -5490,7 +5711,10 @@ def accounting_item_create():
 # JOURNALS
 # getJournals x
 # getJournal x
-@app.route("/accounting_journals_read_all")
+@demos.page(
+    "Journals", menu=("accounting", "journals", "Read (all)"), stream=True, mirror=JOURNALS,
+    raw=(AccountingApi, "get_journals"),
+)
 @xero_token_required
 def accounting_journals_read_all():
     code = get_code_snippet("JOURNALS","READ_ALL")
@@ -5514,21 +5738,16 @@ def accounting_journals_read_all():
     #[/JOURNALS:READ_ALL]
 
     return render_template(
-        "output.html", title="Journals", code=code, json=json, output=output, len = 0, set="accounting", endpoint="journals", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_journals_read_one")
+@demos.page("Journals", menu=("accounting", "journals", "Read (one by ID)"), mirror=JOURNALS)
 @xero_token_required
 def accounting_journals_read_one():
     code = get_code_snippet("JOURNAL","READ_ONE")
-    xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
 
     try:
-        read_journals = accounting_api.get_journals(
-            xero_tenant_id
-        )
-        journal_id = getvalue(read_journals, "journals.0.journal_id", "")
+        journal_id = get_seed_value(AccountingApi, "get_journals", "journals.0.journal_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5546,27 +5765,24 @@ def accounting_journals_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Journal read with id {} ".format(
-            getvalue(read_journals, "journals.0.journal_id", "")
+            journal_id
         )
         json = serialize_model(read_one_journal)
     #[/JOURNAL:READ_ONE]
 
     return render_template(
-        "output.html", title="Journals", code=code, json=json, output=output, len = 0, set="accounting", endpoint="journals", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_journals_read_one_by_number")
+@demos.page("Journals", menu=("accounting", "journals", "Read (one by number)"))
 @xero_token_required
 def accounting_journals_read_one_by_number():
     code = get_code_snippet("JOURNAL","READ_ONE_BY_NUMBER")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_journals = accounting_api.get_journals(
-            xero_tenant_id
-        )
-        journal_number = getvalue(read_journals, "journals.0.journal_number", "")
+        journal_number = get_seed_value(AccountingApi, "get_journals", "journals.0.journal_number")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5584,13 +5800,13 @@ def accounting_journals_read_one_by_number():
         json = jsonify(exception.error_data)
     else:
         output = "Journal read with number {} ".format(
-            getvalue(read_journals, "journals.0.journal_number", "")
+            journal_number
         )
         json = serialize_model(read_one_journal)
     #[/JOURNAL:READ_ONE_BY_NUMBER]
 
     return render_template(
-        "output.html", title="Journals", code=code, json=json, output=output, len = 0, set="accounting", endpoint="journals", action="read_one_by_number"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # LINKED TRANSACTIONS TODO
@@ -5599,7 +5815,10 @@ def accounting_journals_read_one_by_number():
 # getLinkedTransaction x
 # updateLinkedTransaction
 # deleteLinkedTransaction
-@app.route("/accounting_linked_transactions_read_all")
+@demos.page(
+    "Linked Transactions", menu=("accounting", "linked_transactions", "Read (all)"),
+    raw=(AccountingApi, "get_linked_transactions"),
+)
 @xero_token_required
 def accounting_linked_transactions_read_all():
     code = get_code_snippet("LINKED_TRANSACTIONS","READ_ALL")
@@ -5623,21 +5842,18 @@ def accounting_linked_transactions_read_all():
     #[/LINKED_TRANSACTIONS:READ_ALL]
 
     return render_template(
-        "output.html", title="Linked Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="linked_transactions", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_linked_transactions_read_one")
+@demos.page("Linked Transactions", menu=("accounting", "linked_transactions", "Read (one)"))
 @xero_token_required
 def accounting_linked_transactions_read_one():
     code = get_code_snippet("LINKED_TRANSACTIONS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_linked_transactions = accounting_api.get_linked_transactions(
-            xero_tenant_id
-        )
-        linked_transaction_id = getvalue(read_linked_transactions, "linked_transactions.0.linked_transaction_id", "")
+        linked_transaction_id = get_seed_value(AccountingApi, "get_linked_transactions", "linked_transactions.0.linked_transaction_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5655,13 +5871,13 @@ def accounting_linked_transactions_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Linked Transaction read with id {} ".format(
-            getvalue(read_linked_transactions, "linked_transactions.0.linked_transaction_id", "")
+            linked_transaction_id
         )
         json = serialize_model(read_one_linked_transaction)
     #[/LINKED_TRANSACTIONS:READ_ONE]
 
     return render_template(
-        "output.html", title="Linked Transactions", code=code, json=json, output=output, len = 0, set="accounting", endpoint="linked_transactions", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # MANUAL JOURNALS TODO
@@ -5675,7 +5891,10 @@ def accounting_linked_transactions_read_one():
 # getManualJournalAttachmentByFileName
 # updateManualJournalAttachmentByFileName
 # createManualJournalAttachmentByFileName
-@app.route("/accounting_manual_journals_read_all")
+@demos.page(
+    "Manual Journals", menu=("accounting", "manual_journals", "Read (all)"),
+    raw=(AccountingApi, "get_manual_journals"),
+)
 @xero_token_required
 def accounting_manual_journals_read_all():
     code = get_code_snippet("MANUAL_JOURNALS","READ_ALL")
@@ -5699,21 +5918,18 @@ def accounting_manual_journals_read_all():
     #[/MANUAL_JOURNALS:READ_ALL]
 
     return render_template(
-        "output.html", title="Manual Journals", code=code, json=json, output=output, len = 0, set="accounting", endpoint="manual_journals", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_manual_journals_read_one")
+@demos.page("Manual Journals", menu=("accounting", "manual_journals", "Read (one)"))
 @xero_token_required
 def accounting_manual_journals_read_one():
     code = get_code_snippet("MANUAL_JOURNALS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_manual_journals = accounting_api.get_manual_journals(
-            xero_tenant_id
-        )
-        manual_journal_id = getvalue(read_manual_journals, "manual_journals.0.manual_journal_id", "")
+        manual_journal_id = get_seed_value(AccountingApi, "get_manual_journals", "manual_journals.0.manual_journal_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -5731,13 +5947,13 @@ def accounting_manual_journals_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Manual Journal read with id {} ".format(
-            getvalue(read_manual_journals, "manual_journals.0.manual_journal_id", "")
+            manual_journal_id
         )
         json = serialize_model(read_one_manual_journal)
     #[/MANUAL_JOURNALS:READ_ONE]
 
     return render_template(
-        "output.html", title="Manual Journals", code=code, json=json, output=output, len = 0, set="accounting", endpoint="manual_journals", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_account_get_attachments")
@@ -6023,7 +6239,10 @@ def accounting_manual_journals_read_one():
 # ORGANISATION TODO
 # getOrganisations x
 # getOrganisationCISSettings
-@app.route("/accounting_organisations_read_all")
+@demos.page(
+    "Organisations", menu=("accounting", "organisations", "Read (all)"),
+    raw=(AccountingApi, "get_organisations"),
+)
 @xero_token_required
 def accounting_organisations_read_all():
     code = get_code_snippet("ORGANISATIONS","READ_ALL")
@@ -6047,7 +6266,7 @@ def accounting_organisations_read_all():
     #[/ORGANISATIONS:READ_ALL]
 
     return render_template(
-        "output.html", title="Organisations", code=code, json=json, output=output, len = 0, set="accounting", endpoint="organisations", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # OVERPAYMENTS TODO
@@ -6056,7 +6275,10 @@ def accounting_organisations_read_all():
 # createOverpaymentAllocations
 # getOverpaymentHistory
 # createOverpaymentHistory
-@app.route("/accounting_overpayments_read_all")
+@demos.page(
+    "Overpayments", menu=("accounting", "overpayments", "Read (all)"),
+    raw=(AccountingApi, "get_overpayments"),
+)
 @xero_token_required
 def accounting_overpayments_read_all():
     code = get_code_snippet("OVERPAYMENTS","READ_ALL")
@@ -6080,21 +6302,18 @@ def accounting_overpayments_read_all():
     #[/OVERPAYMENTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Overpayments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="overpayments", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_overpayments_read_one")
+@demos.page("Overpayments", menu=("accounting", "overpayments", "Read (one)"))
 @xero_token_required
 def accounting_overpayments_read_one():
     code = get_code_snippet("OVERPAYMENTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_overpayments = accounting_api.get_overpayments(
-            xero_tenant_id
-        )
-        overpayment_id = getvalue(read_overpayments, "overpayments.0.overpayment_id", "")
+        overpayment_id = get_seed_value(AccountingApi, "get_overpayments", "overpayments.0.overpayment_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6112,13 +6331,13 @@ def accounting_overpayments_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Overpayment read with id {} ".format(
-            getvalue(read_overpayments, "overpayments.0.overpayment_id", "")
+            overpayment_id
         )
         json = serialize_model(read_one_overpayment)
     #[/OVERPAYMENTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Overpayments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="overpayments", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -6213,7 +6432,10 @@ def accounting_overpayments_read_one():
 # deletePayment
 # getPaymentHistory
 # createPaymentHistory
-@app.route("/accounting_payments_read_all")
+@demos.page(
+    "Payments", menu=("accounting", "payments", "Read (all)"), mirror="payments",
+    raw=(AccountingApi, "get_payments", {"page": 1}),
+)
 @xero_token_required
 def accounting_payments_read_all():
     code = get_code_snippet("PAYMENTS","READ_ALL")
@@ -6224,34 +6446,33 @@ def accounting_payments_read_all():
 
     try:
         read_payments = accounting_api.get_payments(
-            xero_tenant_id
+            xero_tenant_id, page=1
         )
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     else:
-        output = "Payments read {} total".format(
-            len(read_payments.payments)
+        # the first page holds up to 100 records, pagination (when sent) counts all of them
+        output = "Payments read {} of {} total".format(
+            len(read_payments.payments),
+            getvalue(read_payments, "pagination.item_count", len(read_payments.payments)),
         )
         json = serialize_model(read_payments)
     #[/PAYMENTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Payments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="payments", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_payments_read_one")
+@demos.page("Payments", menu=("accounting", "payments", "Read (one)"), mirror="payments")
 @xero_token_required
 def accounting_payments_read_one():
     code = get_code_snippet("PAYMENTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_payments = accounting_api.get_payments(
-            xero_tenant_id
-        )
-        payment_id = getvalue(read_payments, "payments.0.payment_id", "")
+        payment_id = get_seed_value(AccountingApi, "get_payments", "payments.0.payment_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6269,13 +6490,13 @@ def accounting_payments_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Payment read with id {} ".format(
-            getvalue(read_payments, "payments.0.payment_id", "")
+            payment_id
         )
         json = serialize_model(read_one_payment)
     #[/PAYMENTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Payments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="payments", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -6365,7 +6586,10 @@ def accounting_payments_read_one():
 # PAYMENT SERVICES
 # getPaymentServices x
 # createPaymentService x
-@app.route("/accounting_payment_services_read_all")
+@demos.page(
+    "Payment Services", menu=("accounting", "payment_service", "Read (all)"),
+    raw=(AccountingApi, "get_payment_services"),
+)
 @xero_token_required
 def accounting_payment_services_read_all():
     code = get_code_snippet("PAYMENT_SERVICES","READ_ALL")
@@ -6389,10 +6613,10 @@ def accounting_payment_services_read_all():
     #[/PAYMENT_SERVICES:READ_ALL]
 
     return render_template(
-        "output.html", title="Payment Services", code=code, json=json, output=output, len = 0, set="accounting", endpoint="payment_services", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_payment_service_create")
+@demos.page("Payment Services", menu=("accounting", "payment_service", "Create"))
 @xero_token_required
 def accounting_payment_service_create():
     code = get_code_snippet("PAYMENTSERVICES","CREATE")
@@ -6424,7 +6648,7 @@ def accounting_payment_service_create():
     #[/PAYMENTSERVICES:CREATE]
 
     return render_template(
-        "output.html", title="Payment Services", code=code, json=json, output=output, len = 0, set="accounting", endpoint="payment_service", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # PREPAYMENTS TODO
@@ -6433,7 +6657,10 @@ def accounting_payment_service_create():
 # createPrepaymentAllocations
 # getPrepaymentHistory
 # createPrepaymentHistory
-@app.route("/accounting_prepayments_read_all")
+@demos.page(
+    "Prepayments", menu=("accounting", "prepayments", "Read (all)"),
+    raw=(AccountingApi, "get_prepayments"),
+)
 @xero_token_required
 def accounting_prepayments_read_all():
     code = get_code_snippet("PREPAYMENTS","READ_ALL")
@@ -6457,21 +6684,18 @@ def accounting_prepayments_read_all():
     #[/PREPAYMENTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Prepayments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="prepayments", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_prepayments_read_one")
+@demos.page("Prepayments", menu=("accounting", "prepayments", "Read (one)"))
 @xero_token_required
 def accounting_prepayments_read_one():
     code = get_code_snippet("PREPAYMENTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_prepayments = accounting_api.get_prepayments(
-            xero_tenant_id
-        )
-        prepayment_id = getvalue(read_prepayments, "prepayments.0.prepayment_id", "")
+        prepayment_id = get_seed_value(AccountingApi, "get_prepayments", "prepayments.0.prepayment_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6489,13 +6713,13 @@ def accounting_prepayments_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Prepayment read with id {} ".format(
-            getvalue(read_prepayments, "prepayments.0.prepayment_id", "")
+            prepayment_id
         )
         json = serialize_model(read_one_prepayment)
     #[/PREPAYMENTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Prepayments", code=code, json=json, output=output, len = 0, set="accounting", endpoint="prepayments", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -6592,7 +6816,10 @@ def accounting_prepayments_read_one():
 # getPurchaseOrderByNumber
 # getPurchaseOrderHistory
 # createPurchaseOrderHistory
-@app.route("/accounting_purchase_orders_read_all")
+@demos.page(
+    "Purchase Orders", menu=("accounting", "purchase_orders", "Read (all)"),
+    raw=(AccountingApi, "get_purchase_orders"),
+)
 @xero_token_required
 def accounting_purchase_orders_read_all():
     code = get_code_snippet("PURCHASE_ORDERS","READ_ALL")
@@ -6616,21 +6843,18 @@ def accounting_purchase_orders_read_all():
     #[/PURCHASE_ORDERS:READ_ALL]
 
     return render_template(
-        "output.html", title="Purchase Orders", code=code, json=json, output=output, len = 0, set="accounting", endpoint="purchase_orders", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_purchase_orders_read_one")
+@demos.page("Purchase Orders", menu=("accounting", "purchase_orders", "Read (one)"))
 @xero_token_required
 def accounting_purchase_orders_read_one():
     code = get_code_snippet("PURCHASE_ORDERS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_purchase_orders = accounting_api.get_purchase_orders(
-            xero_tenant_id
-        )
-        purchase_order_id = getvalue(read_purchase_orders, "purchase_orders.0.purchase_order_id", "")
+        purchase_order_id = get_seed_value(AccountingApi, "get_purchase_orders", "purchase_orders.0.purchase_order_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6648,13 +6872,13 @@ def accounting_purchase_orders_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Purchase Order read with id {} ".format(
-            getvalue(read_purchase_orders, "purchase_orders.0.purchase_order_id", "")
+            purchase_order_id
         )
         json = serialize_model(read_one_purchase_order)
     #[/PURCHASE_ORDERS:READ_ONE]
 
     return render_template(
-        "output.html", title="Purchase Orders", code=code, json=json, output=output, len = 0, set="accounting", endpoint="purchase_orders", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_read")
@@ -6755,7 +6979,10 @@ def accounting_purchase_orders_read_one():
 # getQuoteAttachmentByFileName
 # updateQuoteAttachmentByFileName
 # createQuoteAttachmentByFileName
-@app.route("/accounting_quotes_read_all")
+@demos.page(
+    "Quotes", menu=("accounting", "quotes", "Read (all)"),
+    raw=(AccountingApi, "get_quotes"),
+)
 @xero_token_required
 def accounting_quotes_read_all():
     code = get_code_snippet("QUOTES","READ_ALL")
@@ -6779,21 +7006,18 @@ def accounting_quotes_read_all():
     #[/QUOTES:READ_ALL]
 
     return render_template(
-        "output.html", title="Quotes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="quotes", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_quotes_read_one")
+@demos.page("Quotes", menu=("accounting", "quotes", "Read (one)"))
 @xero_token_required
 def accounting_quotes_read_one():
     code = get_code_snippet("QUOTES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_quotes = accounting_api.get_quotes(
-            xero_tenant_id
-        )
-        quote_id = getvalue(read_quotes, "quotes.0.quote_id", "")
+        quote_id = get_seed_value(AccountingApi, "get_quotes", "quotes.0.quote_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6811,28 +7035,25 @@ def accounting_quotes_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Quote read with id {} ".format(
-            getvalue(read_quotes, "quotes.0.quote_id", "")
+            quote_id
         )
         json = serialize_model(read_one_quote)
     #[/QUOTES:READ_ONE]
 
     return render_template(
-        "output.html", title="Quotes", code=code, json=json, output=output, len = 0, set="accounting", endpoint="quotes", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_quotes_create")
+@demos.page("Quotes", menu=("accounting", "quotes", "Create"))
 @xero_token_required
 def accounting_quotes_create():
     code = get_code_snippet("QUOTES","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # READ CONTACT
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6840,10 +7061,7 @@ def accounting_quotes_create():
     # READ ACCOUNT
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -6884,7 +7102,7 @@ def accounting_quotes_create():
     #[/QUOTES:CREATE]
 
     return render_template(
-        "output.html", title="Quotes", code=code, output=output, json=json, len = 0, set="accounting", endpoint="quotes", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # @app.route("/accounting_bank_transaction_history_create")
@@ -7225,7 +7443,10 @@ def accounting_quotes_create():
 # createReceiptAttachmentByFileName
 # getReceiptHistory
 # createReceiptHistory
-@app.route("/accounting_receipts_read_all")
+@demos.page(
+    "Receipts", menu=("accounting", "receipts", "Read (all)"),
+    raw=(AccountingApi, "get_receipts"),
+)
 @xero_token_required
 def accounting_receipts_read_all():
     code = get_code_snippet("RECEIPTS","READ_ALL")
@@ -7249,21 +7470,18 @@ def accounting_receipts_read_all():
     #[/RECEIPTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Receipts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="receipts", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_receipts_read_one")
+@demos.page("Receipts", menu=("accounting", "receipts", "Read (one)"))
 @xero_token_required
 def accounting_receipts_read_one():
     code = get_code_snippet("RECEIPTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_receipts = accounting_api.get_receipts(
-            xero_tenant_id
-        )
-        receipt_id = getvalue(read_receipts, "receipts.0.receipt_id", "")
+        receipt_id = get_seed_value(AccountingApi, "get_receipts", "receipts.0.receipt_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7281,34 +7499,30 @@ def accounting_receipts_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Receipt read with id {} ".format(
-            getvalue(read_receipts, "receipts.0.receipt_id", "")
+            receipt_id
         )
         json = serialize_model(read_one_receipt)
     #[/RECEIPTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Receipts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="receipts", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_receipts_create")
+@demos.page("Receipts", menu=("accounting", "receipts", "Create"))
 @xero_token_required
 def accounting_receipts_create():
     code = get_code_snippet("RECEIPTS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
+        read_contacts = fetch_once(AccountingApi, "get_contacts")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_users = accounting_api.get_users(
-            xero_tenant_id
-        )
+        read_users = fetch_once(AccountingApi, "get_users")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7356,7 +7570,7 @@ def accounting_receipts_create():
     #[/RECEIPTS:CREATE]
 
     return render_template(
-        "output.html", title="Receipts", code=code, json=json, output=output, len = 0, set="accounting", endpoint="receipts", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_account_get_attachments")
@@ -7733,7 +7947,10 @@ def accounting_receipts_create():
 # createRepeatingInvoiceAttachmentByFileName
 # getRepeatingInvoiceHistory x
 # createRepeatingInvoiceHistory
-@app.route("/accounting_repeating_invoices_read_all")
+@demos.page(
+    "Repeating Invoices", menu=("accounting", "repeating_invoices", "Read (all)"),
+    raw=(AccountingApi, "get_repeating_invoices"),
+)
 @xero_token_required
 def accounting_repeating_invoices_read_all():
     code = get_code_snippet("REPEATING_INVOICES","READ_ALL")
@@ -7757,21 +7974,18 @@ def accounting_repeating_invoices_read_all():
     #[/REPEATING_INVOICES:READ_ALL]
 
     return render_template(
-        "output.html", title="Repeating Invoices", code=code, json=json, output=output, len = 0, set="accounting", endpoint="repeating_invoices", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_repeating_invoices_read_one")
+@demos.page("Repeating Invoices", menu=("accounting", "repeating_invoices", "Read (one)"))
 @xero_token_required
 def accounting_repeating_invoices_read_one():
     code = get_code_snippet("REPEATING_INVOICES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_repeating_invoices = accounting_api.get_repeating_invoices(
-            xero_tenant_id
-        )
-        repeating_invoice_id = getvalue(read_repeating_invoices, "repeating_invoices.0.repeating_invoice_id", "")
+        repeating_invoice_id = get_seed_value(AccountingApi, "get_repeating_invoices", "repeating_invoices.0.repeating_invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7789,28 +8003,25 @@ def accounting_repeating_invoices_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Repeating Invoice read with id {} ".format(
-            getvalue(read_repeating_invoices, "repeating_invoices.0.repeating_invoice_id", "")
+            repeating_invoice_id
         )
         json = serialize_model(read_one_repeating_invoice)
     #[/REPEATING_INVOICES:READ_ONE]
 
     return render_template(
-        "output.html", title="Repeating Invoices", code=code, json=json, output=output, len = 0, set="accounting", endpoint="repeating_invoices", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_repeating_invoices_create")
+@demos.page("Repeating Invoices", menu=("accounting", "repeating_invoices", "Create"))
 @xero_token_required
 def accounting_repeating_invoices_create():
     code = get_code_snippet("REPEATING_INVOICES","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # READ CONTACT
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7818,10 +8029,7 @@ def accounting_repeating_invoices_create():
     # READ ACCOUNT
     where = "Type==\"SALES\"&&Status==\"ACTIVE\""
     try:
-        read_accounts = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7876,21 +8084,18 @@ def accounting_repeating_invoices_create():
     #[/REPEATING_INVOICES:CREATE]
 
     return render_template(
-        "output.html", title="Repeating Invoices", code=code, output=output, json=json, len = 0, set="accounting", endpoint="repeating_invoices", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_repeating_invoices_read_history")
+@demos.page("Repeating Invoice History Read", menu=("accounting", "repeating_invoices", "Read History"))
 @xero_token_required
 def accounting_repeating_invoices_read_history():
     code = get_code_snippet("REPEATING_INVOICES","READ_HISTORY")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_repeating_invoices = accounting_api.get_repeating_invoices(
-            xero_tenant_id
-        )
-        repeating_invoice_id = getvalue(read_repeating_invoices, "repeating_invoices.0.repeating_invoice_id", "")
+        repeating_invoice_id = get_seed_value(AccountingApi, "get_repeating_invoices", "repeating_invoices.0.repeating_invoice_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7912,20 +8117,18 @@ def accounting_repeating_invoices_read_history():
     #[/REPEATING_INVOICES:READ_HISTORY]
 
     return render_template(
-        "output.html", title="Repeating Invoice History Read", code=code, json=json, output=output, len = 0, set="accounting", endpoint="repeating_invoices", action="read_history"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_repeating_invoices_create_history")
+@demos.page("Repeating Invoice History Created", menu=("accounting", "repeating_invoices", "Create History"))
 @xero_token_required
 def accounting_repeating_invoices_create_history():
     code = get_code_snippet("REPEATING_INVOICES","CREATE_HISTORY")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_repeating_invoices = accounting_api.get_repeating_invoices(
-            xero_tenant_id
-        )
+        read_repeating_invoices = fetch_once(AccountingApi, "get_repeating_invoices")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -7954,7 +8157,7 @@ def accounting_repeating_invoices_create_history():
     #[/REPEATING_INVOICES:CREATE_HISTORY]
 
     return render_template(
-        "output.html", title="Repeating Invoice History Created", code=code, json=json, output=output, len = 0, set="accounting", endpoint="repeating_invoices", action="create_history"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # @app.route("/accounting_account_get_attachments")
@@ -8333,7 +8536,7 @@ def accounting_repeating_invoices_create_history():
 # getReportExecutiveSummary x
 # getReportProfitAndLoss x
 # getReportTrialBalance x
-@app.route("/accounting_reports_read_ten_ninety_nine")
+@demos.page("Reports - 1099", menu=("accounting", "reports", "1099 (US)"))
 @xero_token_required
 def accounting_reports_read_ten_ninety_nine():
     code = get_code_snippet("REPORTS_TEN_NINETY_NINE","READ")
@@ -8358,10 +8561,10 @@ def accounting_reports_read_ten_ninety_nine():
     #[/REPORTS_TEN_NINETY_NINE:READ]
 
     return render_template(
-        "output.html", title="Reports - 1099", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_ten_ninety_nine"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_aged_payables_by_contact")
+@demos.page("Reports - Aged Payables by Contact", menu=("accounting", "reports", "Aged Payables"))
 @xero_token_required
 def accounting_reports_read_aged_payables_by_contact():
     code = get_code_snippet("REPORTS_AGED_PAYABLES_BY_CONTACT","READ")
@@ -8392,10 +8595,10 @@ def accounting_reports_read_aged_payables_by_contact():
     #[/REPORTS_AGED_PAYABLES_BY_CONTACT:READ]
 
     return render_template(
-        "output.html", title="Reports - Aged Payables by Contact", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_aged_payables_by_contact"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_aged_receivables_by_contact")
+@demos.page("Reports - Aged Receivables by Contact", menu=("accounting", "reports", "Aged Receivables"))
 @xero_token_required
 def accounting_reports_read_aged_receivables_by_contact():
     code = get_code_snippet("REPORTS_AGED_RECEIVABLES_BY_CONTACT","READ")
@@ -8426,10 +8629,10 @@ def accounting_reports_read_aged_receivables_by_contact():
     #[/REPORTS_AGED_RECEIVABLES_BY_CONTACT:READ]
 
     return render_template(
-        "output.html", title="Reports - Aged Receivables by Contact", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_aged_receivables_by_contact"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_balance_sheet")
+@demos.page("Reports - Balance Sheet", menu=("accounting", "reports", "Balance Sheet"))
 @xero_token_required
 def accounting_reports_read_balance_sheet():
     code = get_code_snippet("REPORTS_BALANCE_SHEET","READ")
@@ -8456,10 +8659,10 @@ def accounting_reports_read_balance_sheet():
     #[/REPORTS_BALANCE_SHEET:READ]
 
     return render_template(
-        "output.html", title="Reports - Balance Sheet", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_balance_sheet"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_bank_summary")
+@demos.page("Reports - Bank Summary", menu=("accounting", "reports", "Bank Summary"))
 @xero_token_required
 def accounting_reports_read_bank_summary():
     code = get_code_snippet("REPORTS_BANK_SUMMARY","READ")
@@ -8483,10 +8686,10 @@ def accounting_reports_read_bank_summary():
     #[/REPORTS_BANK_SUMMARY:READ]
 
     return render_template(
-        "output.html", title="Reports - Bank Summary", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_bank_summary"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_report_get_reports_list")
+@demos.page("Reports - List", menu=("accounting", "reports", "Get Reports List"))
 @xero_token_required
 def accounting_report_get_reports_list():
     code = get_code_snippet("GET_REPORTS_LIST","READ")
@@ -8510,10 +8713,10 @@ def accounting_report_get_reports_list():
     #[/GET_REPORTS_LIST:READ]
 
     return render_template(
-        "output.html", title="Reports - List", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="get_reports_list"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_report_get_report_from_id")
+@demos.page("Reports - Report", menu=("accounting", "reports", "Get Report from ID"))
 @xero_token_required
 def accounting_report_get_report_from_id():
     code = get_code_snippet("REPORT_FROM_ID","READ")
@@ -8543,10 +8746,10 @@ def accounting_report_get_report_from_id():
     #[/REPORT_FROM_ID:READ]
 
     return render_template(
-        "output.html", title="Reports - Report", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="get_report_from_id"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_budget_summary")
+@demos.page("Reports - Budget Summary", menu=("accounting", "reports", "Budget Summary"))
 @xero_token_required
 def accounting_reports_read_budget_summary():
     code = get_code_snippet("REPORTS_BUDGET_SUMMARY","READ")
@@ -8570,10 +8773,10 @@ def accounting_reports_read_budget_summary():
     #[/REPORTS_BUDGET_SUMMARY:READ]
 
     return render_template(
-        "output.html", title="Reports - Budget Summary", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_budget_summary"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_executive_summary")
+@demos.page("Reports - Executive Summary", menu=("accounting", "reports", "Executive Summary"))
 @xero_token_required
 def accounting_reports_read_executive_summary():
     code = get_code_snippet("REPORTS_EXECUTIVE_SUMMARY","READ")
@@ -8596,10 +8799,10 @@ def accounting_reports_read_executive_summary():
     #[/REPORTS_EXECUTIVE_SUMMARY:READ]
 
     return render_template(
-        "output.html", title="Reports - Executive Summary", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_executive_summary"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_profit_and_loss")
+@demos.page("Reports - Profit & Loss", menu=("accounting", "reports", "Profit & Loss"))
 @xero_token_required
 def accounting_reports_read_profit_and_loss():
     code = get_code_snippet("REPORTS_PROFIT_AND_LOSS","READ")
@@ -8627,10 +8830,10 @@ def accounting_reports_read_profit_and_loss():
     #[/REPORTS_PROFIT_AND_LOSS:READ]
 
     return render_template(
-        "output.html", title="Reports - Profit & Loss", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_profit_and_loss"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_reports_read_trial_balance")
+@demos.page("Reports - Trial Balance", menu=("accounting", "reports", "Trial Balance"))
 @xero_token_required
 def accounting_reports_read_trial_balance():
     code = get_code_snippet("REPORTS_TRIAL_BALANCE","READ")
@@ -8654,14 +8857,17 @@ def accounting_reports_read_trial_balance():
     #[/REPORTS_TRIAL_BALANCE:READ]
 
     return render_template(
-        "output.html", title="Reports - Trial Balance", code=code, json=json, output=output, len = 0, set="accounting", endpoint="reports", action="read_trial_balance"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # TAX RATES TODO
 # getTaxRates x
 # createTaxRates x
 # updateTaxRate x
-@app.route("/accounting_tax_rate_read_all")
+@demos.page(
+    "Tax Rates", menu=("accounting", "tax_rate", "Read (all)"),
+    raw=(AccountingApi, "get_tax_rates"),
+)
 @xero_token_required
 def accounting_tax_rate_read_all():
     code = get_code_snippet("TAX_RATES","READ_ALL")
@@ -8685,10 +8891,10 @@ def accounting_tax_rate_read_all():
     #[/TAX_RATES:READ_ALL]
 
     return render_template(
-        "output.html", title="Tax Rates", code=code, json=json, output=output, len = 0, set="accounting", endpoint="tax_rate", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_tax_rate_create")
+@demos.page("Tax Rates", menu=("accounting", "tax_rate", "Create"))
 @xero_token_required
 def accounting_tax_rate_create():
     code = get_code_snippet("TAX_RATES","CREATE")
@@ -8727,10 +8933,10 @@ def accounting_tax_rate_create():
     #[/TAX_RATES:CREATE]
 
     return render_template(
-        "output.html", title="Tax Rates", code=code, json=json, output=output, len = 0, set="accounting", endpoint="tax_rate", action="create"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_tax_rate_update")
+@demos.page("Tax Rates", menu=("accounting", "tax_rate", "Update"))
 @xero_token_required
 def accounting_tax_rate_update():
     code = get_code_snippet("TAX_RATES","UPDATE")
@@ -8773,7 +8979,7 @@ def accounting_tax_rate_update():
     #[/TAX_RATES:UPDATE]
 
     return render_template(
-        "output.html", title="Tax Rates", code=code, json=json, output=output, len = 0, set="accounting", endpoint="tax_rate", action="update"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 # TRACKING CATEGORIES TODO
@@ -8785,7 +8991,10 @@ def accounting_tax_rate_update():
 # createTrackingOptions x
 # updateTrackingOptions x
 # deleteTrackingOptions x
-@app.route("/accounting_tracking_categories_read_all")
+@demos.page(
+    "Tracking Categories", menu=("accounting", "tracking_categories", "Read (all)"),
+    raw=(AccountingApi, "get_tracking_categories"),
+)
 @xero_token_required
 def accounting_tracking_categories_read_all():
     code = get_code_snippet("TRACKING_CATEGORIES","READ_ALL")
@@ -8809,21 +9018,18 @@ def accounting_tracking_categories_read_all():
     #[/TRACKING_CATEGORIES:READ_ALL]
 
     return render_template(
-        "output.html", title="Tracking Categories", code=code, json=json, output=output, len = 0, set="accounting", endpoint="tracking_categories", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_tracking_categories_read_one")
+@demos.page("Tracking Category", menu=("accounting", "tracking_categories", "Read (one)"))
 @xero_token_required
 def accounting_tracking_categories_read_one():
     code = get_code_snippet("TRACKING_CATEGORIES","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_tracking_categories = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-        tracking_category_id = getvalue(read_tracking_categories, "tracking_categories.0.tracking_category_id", "")
+        tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.tracking_category_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -8841,16 +9047,16 @@ def accounting_tracking_categories_read_one():
         json = jsonify(exception.error_data)
     else:
         output = "Tracking Category read with id {} ".format(
-            getvalue(read_tracking_categories, "tracking_categories.0.tracking_category_id", "")
+            tracking_category_id
         )
         json = serialize_model(read_one_tracking_category)
     #[/TRACKING_CATEGORIES:READ_ONE]
 
     return render_template(
-        "output.html", title="Tracking Category", code=code, json=json, output=output, len = 0, set="accounting", endpoint="tracking_categories", action="read_one"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/accounting_tracking_categories_create")
+@demos.page("Tracking Categories", menu=("accounting", "tracking_categories", "Create Category"))
 @xero_token_required
 def accounting_tracking_categories_create():
     code = get_code_snippet("TRACKING_CATEGORIES","CREATE")
@@ -8879,20 +9085,17 @@ def accounting_tracking_categories_create():
     #[/TRACKING_CATEGORIES:CREATE]
 
     return render_template(
-        "output.html", title="Tracking Categories", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_tracking_categories_update")
+@demos.page("Tracking Categories", menu=("accounting", "tracking_categories", "Update Category"))
 @xero_token_required
 def accounting_tracking_categories_update():
     code = get_code_snippet("TRACKING_CATEGORIES","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
-    tracking_category = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-    tracking_category_id = getvalue(tracking_category, "tracking_categories.0.tracking_category_id", "")
+    tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.tracking_category_id")
 
     tracking_category = TrackingCategory(
         name = "Foobar" + get_random_num())
@@ -8914,20 +9117,17 @@ def accounting_tracking_categories_update():
     #[/TRACKING_CATEGORIES:UPDATE]
 
     return render_template(
-        "output.html", title="Tracking Categories", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_tracking_categories_delete")
+@demos.page("Tracking Categories", menu=("accounting", "tracking_categories", "Delete Category"))
 @xero_token_required
 def accounting_tracking_categories_delete():
     code = get_code_snippet("TRACKING_CATEGORIES","DELETE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
-    tracking_category = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-    tracking_category_id = getvalue(tracking_category, "tracking_categories.1.tracking_category_id", "")
+    tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.1.tracking_category_id")
 
     #[TRACKING_CATEGORIES:DELETE]
     xero_tenant_id = get_xero_tenant_id()
@@ -8946,21 +9146,18 @@ def accounting_tracking_categories_delete():
     #[/TRACKING_CATEGORIES:DELETE]
 
     return render_template(
-        "output.html", title="Tracking Categories", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="delete"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_tracking_categories_create_options")
+@demos.page("Tracking Options", menu=("accounting", "tracking_categories", "Create Option"))
 @xero_token_required
 def accounting_tracking_categories_create_options():
     code = get_code_snippet("TRACKING_OPTIONS","CREATE")
 
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
-    tracking_category = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-    tracking_category_id = getvalue(tracking_category, "tracking_categories.0.tracking_category_id", "")
+    tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.tracking_category_id")
 
     #[TRACKING_OPTIONS:CREATE]
     xero_tenant_id = get_xero_tenant_id()
@@ -8985,22 +9182,18 @@ def accounting_tracking_categories_create_options():
     #[/TRACKING_OPTIONS:CREATE]
 
     return render_template(
-        "output.html", title="Tracking Options", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="create_options"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_tracking_categories_update_options")
+@demos.page("Tracking Options", menu=("accounting", "tracking_categories", "Update Option"))
 @xero_token_required
 def accounting_tracking_categories_update_options():
     code = get_code_snippet("TRACKING_OPTIONS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
-
-    tracking_category = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-    tracking_category_id = getvalue(tracking_category, "tracking_categories.0.tracking_category_id", "")
+    accounting_api = get_api(AccountingApi)
 
-    tracking_option_id = getvalue(tracking_category, "tracking_categories.0.options.0.tracking_option_id", "")
+    tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.tracking_category_id")
+    tracking_option_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.options.0.tracking_option_id")
 
     tracking_option = TrackingOption(
         name = "Foobar" + get_random_num())
@@ -9022,22 +9215,18 @@ def accounting_tracking_categories_update_options():
     #[/TRACKING_OPTIONS:UPDATE]
 
     return render_template(
-        "output.html", title="Tracking Options", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="update_options"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/accounting_tracking_categories_delete_options")
+@demos.page("Tracking Options", menu=("accounting", "tracking_categories", "Delete Option"))
 @xero_token_required
 def accounting_tracking_categories_delete_options():
     code = get_code_snippet("TRACKING_OPTIONS","DELETE")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
-
-    tracking_category = accounting_api.get_tracking_categories(
-            xero_tenant_id
-        )
-    tracking_category_id = getvalue(tracking_category, "tracking_categories.0.tracking_category_id", "")
+    accounting_api = get_api(AccountingApi)
 
-    tracking_option_id = getvalue(tracking_category, "tracking_categories.0.options.0.tracking_option_id", "")
+    tracking_category_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.tracking_category_id")
+    tracking_option_id = get_seed_value(AccountingApi, "get_tracking_categories", "tracking_categories.0.options.0.tracking_option_id")
 
     #[TRACKING_OPTIONS:DELETE]
     xero_tenant_id = get_xero_tenant_id()
@@ -9056,13 +9245,13 @@ def accounting_tracking_categories_delete_options():
     #[/TRACKING_OPTIONS:DELETE]
 
     return render_template(
-        "output.html", title="Tracking Options", code=code, output=output, json=json, len = 0, set="accounting", endpoint="tracking_categories", action="delete_options"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # USERS TODO
 # getUsers x
 # getUser
-@app.route("/accounting_user_read_all")
+@demos.page("Users", menu=("accounting", "user", "Read (all)"), raw=(AccountingApi, "get_users"))
 @xero_token_required
 def accounting_user_read_all():
     code = get_code_snippet("USERS","READ_ALL")
@@ -9086,10 +9275,10 @@ def accounting_user_read_all():
     #[/USERS:READ_ALL]
 
     return render_template(
-        "output.html", title="Users", code=code, json=json, output=output, len = 0, set="accounting", endpoint="user", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/assets_asset_read_all")
+@demos.page("Assets", menu=("assets", "asset", "Read (all)"))
 @xero_token_required
 def assets_asset_read_all():
     code = get_code_snippet("ASSETS","READ_ALL")
@@ -9114,22 +9303,19 @@ def assets_asset_read_all():
     #[/ASSETS:READ_ALL]
 
     return render_template(
-        "output.html", title="Assets", code=code, output=output, json=json, len = 0, set="assets", endpoint="asset", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/assets_asset_read_one")
+@demos.page("Assets", menu=("assets", "asset", "Read (one)"))
 @xero_token_required
 def assets_asset_read_one():
     code = get_code_snippet("ASSETS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    asset_api = AssetApi(api_client)
+    asset_api = get_api(AssetApi)
 
     # READ ALL ASSETS
     try:
-        read_assets = asset_api.get_assets(
-            xero_tenant_id, status=AssetStatusQueryParam.DRAFT
-        )
-        asset_id = getvalue(read_assets, "items.0.asset_id", "")
+        asset_id = get_seed_value(AssetApi, "get_assets", "items.0.asset_id", status=AssetStatusQueryParam.DRAFT)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9153,10 +9339,10 @@ def assets_asset_read_one():
     #[/ASSETS:READ_ONE]
 
     return render_template(
-        "output.html", title="Assets", code=code, output=output, json=json, len = 0, set="assets", endpoint="asset", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/assets_asset_create")
+@demos.page("Assets", menu=("assets", "asset", "Create"))
 @xero_token_required
 def assets_asset_create():
     code = get_code_snippet("ASSETS","CREATE")
@@ -9188,10 +9374,10 @@ def assets_asset_create():
     #[/ASSETS:CREATE]
 
     return render_template(
-        "output.html", title="Assets", code=code, output=output, json=json, len = 0, set="assets", endpoint="asset", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/assets_assettype_read_all")
+@demos.page("Asset Type", menu=("assets", "assettype", "Read (all)"))
 @xero_token_required
 def assets_assettype_read_all():
     code = get_code_snippet("ASSET_TYPE","READ_ALL")
@@ -9215,10 +9401,10 @@ def assets_assettype_read_all():
     #[/ASSET_TYPE:READ_ALL]
 
     return render_template(
-        "output.html", title="Asset Type",  code=code, output=output, json=json, len = 0, set="assets", endpoint="assettype", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/assets_assettype_create")
+@demos.page("Asset Type", menu=("assets", "assettype", "Create"))
 @xero_token_required
 def assets_assettype_create():
     code = get_code_snippet("ASSET_TYPE","CREATE")
@@ -9275,10 +9461,10 @@ def assets_assettype_create():
     #[/ASSET_TYPE:CREATE]
 
     return render_template(
-        "output.html", title="Asset Type",  code=code, output=output, json=json, len = 0, set="assets", endpoint="assettype", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/assets_settings_read")
+@demos.page("Asset Settings", menu=("assets", "settings", "Read"))
 @xero_token_required
 def assets_settings_read():
     code = get_code_snippet("ASSET_SETTINGS","READ")
@@ -9302,10 +9488,10 @@ def assets_settings_read():
     #[/ASSET_SETTINGS:READ]
 
     return render_template(
-        "output.html", title="Asset Settings", code=code, output=output, json=json, len = 0, set="assets", endpoint="settings", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_project_read_all")
+@demos.page("Projects", menu=("projects", "project", "Read (all)"))
 @xero_token_required
 def projects_project_read_all():
     code = get_code_snippet("PROJECTS","READ_ALL")
@@ -9328,21 +9514,18 @@ def projects_project_read_all():
     #[/PROJECTS:READ_ALL]
 
     return render_template(
-        "output.html", title="Projects", code=code, output=output, json=json, len = 0, set="projects", endpoint="project", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_project_read_one")
+@demos.page("Projects", menu=("projects", "project", "Read (one)"))
 @xero_token_required
 def projects_project_read_one():
     code = get_code_snippet("PROJECTS","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9366,25 +9549,21 @@ def projects_project_read_one():
     #[/PROJECTS:READ_ONE]
 
     return render_template(
-        "output.html", title="Projects", code=code, output=output, json=json, len = 0, set="projects", endpoint="project", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_project_create")
+@demos.page("Projects", menu=("projects", "project", "Create"))
 @xero_token_required
 def projects_project_create():
     code = get_code_snippet("PROJECTS","READ_ALL")
 
-    #[PROJECTS:CREATE]
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     # CREATE PROJECT
     # READ CONTACTS FIRST
     try:
-        read_contacts = accounting_api.get_contacts(
-            xero_tenant_id
-        )  # type: Contacts
-        contact_id = getvalue(read_contacts, "contacts.0.contact_id", "")
+        contact_id = get_seed_value(AccountingApi, "get_contacts", "contacts.0.contact_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9414,22 +9593,19 @@ def projects_project_create():
     #[/PROJECTS:CREATE]
 
     return render_template(
-        "output.html", title="Projects", code=code, output=output, json=json, len = 0, set="projects", endpoint="project", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_project_update")
+@demos.page("Projects", menu=("projects", "project", "Update"))
 @xero_token_required
 def projects_project_update():
     code = get_code_snippet("PROJECTS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9455,22 +9631,19 @@ def projects_project_update():
     #[/PROJECTS:UPDATE]
 
     return render_template(
-        "output.html", title="Projects", code=code, output=output, json=json, len = 0, set="projects", endpoint="project", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_project_patch")
+@demos.page("Projects", menu=("projects", "project", "Patch"))
 @xero_token_required
 def projects_project_patch():
     code = get_code_snippet("PROJECTS","PATCH")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9496,10 +9669,10 @@ def projects_project_patch():
     #[/PROJECTS:PATCH]
 
     return render_template(
-        "output.html", title="Projects", code=code, output=output, json=json, len = 0, set="projects", endpoint="project", action="patch"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_projectuser_read_all")
+@demos.page("Project Users", menu=("projects", "projectuser", "Read (all)"))
 @xero_token_required
 def projects_projectuser_read_all():
     code = get_code_snippet("PROJECT_USERS","READ")
@@ -9523,23 +9696,20 @@ def projects_projectuser_read_all():
     #[/PROJECT_USERS:READ]
 
     return render_template(
-        "output.html",  title="Project Users", code=code, output=output, json=json, len = 0,  set="projects", endpoint="projectuser", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_task_read_all")
+@demos.page("Tasks", menu=("projects", "task", "Read (all)"))
 @xero_token_required
 def projects_task_read_all():
     code = get_code_snippet("TASK","READ_ALL")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ TASKS
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9562,30 +9732,24 @@ def projects_task_read_all():
     #[/TASK:READ_ALL]
 
     return render_template(
-        "output.html", title="Tasks", code=code, output=output, json=json, len = 0, set="projects", endpoint="task", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_task_read_one")
+@demos.page("Tasks", menu=("projects", "task", "Read (one)"))
 @xero_token_required
 def projects_task_read_one():
     code = get_code_snippet("TASK","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_tasks = project_api.get_tasks(
-            xero_tenant_id, project_id=project_id
-        )
-        task_id = getvalue(read_tasks, "items.0.task_id", "")
+        task_id = get_seed_value(ProjectApi, "get_tasks", "items.0.task_id", project_id=project_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9609,21 +9773,18 @@ def projects_task_read_one():
     #[/TASK:READ_ONE]
 
     return render_template(
-        "output.html", title="Tasks", code=code, output=output, json=json, len = 0, set="projects", endpoint="task", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_task_create")
+@demos.page("Tasks", menu=("projects", "task", "Create"))
 @xero_token_required
 def projects_task_create():
     code = get_code_snippet("TASKS","CREATE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9656,21 +9817,18 @@ def projects_task_create():
 
     #[/TASKS:CREATE]
     return render_template(
-        "output.html", title="Tasks", code=code, output=output, json=json, len = 0, set="projects", endpoint="task", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_task_update")
+@demos.page("Tasks", menu=("projects", "task", "Update"))
 @xero_token_required
 def projects_task_update():
     code = get_code_snippet("TASKS","UPDATE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9727,21 +9885,18 @@ def projects_task_update():
 
     #[/TASKS:UPDATE]
     return render_template(
-        "output.html", title="Tasks", code=code, output=output, json=json, len = 0, set="projects", endpoint="task", action="update"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_task_delete")
+@demos.page("Tasks", menu=("projects", "task", "Delete"))
 @xero_token_required
 def projects_task_delete():
     code = get_code_snippet("TASKS","DELETE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9766,10 +9921,7 @@ def projects_task_delete():
         json = jsonify(exception.error_data)
     
     try:
-        read_tasks = project_api.get_tasks(
-            xero_tenant_id, project_id=project_id
-        )
-        task_id = getvalue(read_tasks, "items.0.task_id", "")
+        task_id = get_seed_value(ProjectApi, "get_tasks", "items.0.task_id", project_id=project_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9793,22 +9945,19 @@ def projects_task_delete():
 
     #[/TASKS:DELETE]
     return render_template(
-        "output.html", title="Tasks", code=code, output=output, json=json, len = 0, set="projects", endpoint="task", action="delete"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_time_read_all")
+@demos.page("Time", menu=("projects", "time", "Read (all)"))
 @xero_token_required
 def projects_time_read_all():
     code = get_code_snippet("TIME","READ_ALL")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9833,30 +9982,24 @@ def projects_time_read_all():
     #[/TIME:READ_ALL]
 
     return render_template(
-        "output.html", title="Time", code=code, output=output, json=json, len = 0, set="projects", endpoint="time", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_time_read_one")
+@demos.page("Time", menu=("projects", "time", "Read (one)"))
 @xero_token_required
 def projects_time_read_one():
     code = get_code_snippet("TIME","READ_ONE")
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
     try:
-        read_time_entries = project_api.get_time_entries(
-            xero_tenant_id, project_id=project_id
-        )
-        time_entry_id = getvalue(read_time_entries, "items.0.time_entry_id", "")
+        time_entry_id = get_seed_value(ProjectApi, "get_time_entries", "items.0.time_entry_id", project_id=project_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9880,43 +10023,34 @@ def projects_time_read_one():
     #[/TIME:READ_ONE]
 
     return render_template(
-        "output.html", title="Time", code=code, output=output, json=json, len = 0, set="projects", endpoint="time", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/projects_time_create")
+@demos.page("Time", menu=("projects", "time", "Create"))
 @xero_token_required
 def projects_time_create():
     code = get_code_snippet("TIME","CREATE")
 
     xero_tenant_id = get_xero_tenant_id()
-    project_api = ProjectApi(api_client)
+    project_api = get_api(ProjectApi)
 
     # READ PROJECTS
     try:
-        read_projects = project_api.get_projects(
-            xero_tenant_id
-        )  # type: Projects
-        project_id = getvalue(read_projects, "items.0.project_id", "")
+        project_id = get_seed_value(ProjectApi, "get_projects", "items.0.project_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     # READ PROJECT USERS
     try:
-        read_project_users = project_api.get_project_users(
-            xero_tenant_id
-        )  # type: ProjectUsers
-        project_user_id = getvalue(read_project_users, "items.0.user_id", "")
+        project_user_id = get_seed_value(ProjectApi, "get_project_users", "items.0.user_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     # READ TASKS
     try:
-        read_tasks = project_api.get_tasks(
-            xero_tenant_id, project_id=project_id
-        )  # type: Tasks
-        task_id = getvalue(read_tasks, "items.0.task_id", "")
+        task_id = get_seed_value(ProjectApi, "get_tasks", "items.0.task_id", project_id=project_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -9948,17 +10082,17 @@ def projects_time_create():
     #[/TIME:CREATE]
 
     return render_template(
-        "output.html", title="Time", code=code, output=output, json=json, len = 0, set="projects", endpoint="time", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_employee_read_all")
+@demos.page("Employees", menu=("payroll_au", "employee", "Read (all)"))
 @xero_token_required
 def payroll_au_employee_read_all():
     code = get_code_snippet("EMPLOYEES","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollau_api = PayrollAuApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrollau_api = get_api(PayrollAuApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EMPLOYEES:READ_ALL]
     try:
@@ -9974,23 +10108,20 @@ def payroll_au_employee_read_all():
     #[/EMPLOYEES:READ_ALL]
 
     return render_template(
-        "output.html", title="Employees", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="employee", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_employee_read_one")
+@demos.page("Employee", menu=("payroll_au", "employee", "Read (one)"))
 @xero_token_required
 def payroll_au_employee_read_one():
     code = get_code_snippet("EMPLOYEES","READ_ONE")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollau_api = PayrollAuApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrollau_api = get_api(PayrollAuApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrollau_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollAuApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -10011,10 +10142,10 @@ def payroll_au_employee_read_one():
     #[/EMPLOYEES:READ_ONE]
 
     return render_template(
-        "output.html", title="Employee", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="employee", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_employee_create")
+@demos.page("Employees", menu=("payroll_au", "employee", "Create"))
 @xero_token_required
 def payroll_au_employee_create():
     code = get_code_snippet("EMPLOYEES","READ_ALL")
@@ -10062,10 +10193,10 @@ def payroll_au_employee_create():
     #[/EMPLOYEES:CREATE]
 
     return render_template(
-        "output.html", title="Employees", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="employee", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_leave_application_read_all")
+@demos.page("Leave Applications", menu=("payroll_au", "leave_application", "Read"))
 @xero_token_required
 def payroll_au_leave_application_read_all():
     code = get_code_snippet("LEAVE_APPLICATION","READ_ALL")
@@ -10089,10 +10220,10 @@ def payroll_au_leave_application_read_all():
     #[/LEAVE_APPLICATION:READ_ALL]
 
     return render_template(
-        "output.html", title="Leave Applications", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="leave_application", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_pay_item_read_all")
+@demos.page("Pay Items", menu=("payroll_au", "pay_item", "Read"))
 @xero_token_required
 def payroll_au_pay_item_read_all():
     code = get_code_snippet("PAY_ITEM","READ_ALL")
@@ -10116,10 +10247,10 @@ def payroll_au_pay_item_read_all():
     #[/PAY_ITEM:READ_ALL]
 
     return render_template(
-        "output.html", title="Pay Items", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="pay_item", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_payroll_calendar_read_all")
+@demos.page("Payroll Calendars", menu=("payroll_au", "payroll_calendar", "Read"))
 @xero_token_required
 def payroll_au_payroll_calendar_read_all():
     code = get_code_snippet("PAYROLL_CALENDAR","READ_ALL")
@@ -10143,10 +10274,10 @@ def payroll_au_payroll_calendar_read_all():
     #[/PAYROLL_CALENDAR:READ_ALL]
 
     return render_template(
-        "output.html", title="Payroll Calendars", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="payroll_calendar", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_pay_run_read_all")
+@demos.page("PayRuns", menu=("payroll_au", "pay_run", "Read"))
 @xero_token_required
 def payroll_au_pay_run_read_all():
     code = get_code_snippet("PAY_RUN","READ_ALL")
@@ -10170,10 +10301,10 @@ def payroll_au_pay_run_read_all():
     #[/PAY_RUN:READ_ALL]
 
     return render_template(
-        "output.html", title="PayRuns", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="pay_run", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_pay_slip_read_all")
+@demos.page("PaySlips", menu=("payroll_au", "pay_slip", "Read"))
 @xero_token_required
 def payroll_au_pay_slip_read_all():
     code = get_code_snippet("PAY_SLIP","READ_ALL")
@@ -10219,10 +10350,10 @@ def payroll_au_pay_slip_read_all():
     #[/PAY_SLIP:READ_ALL]
 
     return render_template(
-        "output.html", title="PaySlips", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="pay_slip", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_settings_read_all")
+@demos.page("Settings", menu=("payroll_au", "settings", "Read"))
 @xero_token_required
 def payroll_au_settings_read_all():
     code = get_code_snippet("SETTINGS","READ_ALL")
@@ -10246,10 +10377,10 @@ def payroll_au_settings_read_all():
     #[/SETTINGS:READ_ALL]
 
     return render_template(
-        "output.html", title="Settings", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="settings", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_superfund_read_all")
+@demos.page("SuperFunds", menu=("payroll_au", "superfund", "Read"))
 @xero_token_required
 def payroll_au_superfund_read_all():
     code = get_code_snippet("SUPERFUND","READ_ALL")
@@ -10273,10 +10404,10 @@ def payroll_au_superfund_read_all():
     #[/SUPERFUND:READ_ALL]
 
     return render_template(
-        "output.html", title="SuperFunds", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="superfund", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_superfund_product_read_all")
+@demos.page("SuperFund Products", menu=("payroll_au", "superfund_product", "Read"))
 @xero_token_required
 def payroll_au_superfund_product_read_all():
     code = get_code_snippet("SUPERFUND_PRODUCT","READ_ALL")
@@ -10300,10 +10431,10 @@ def payroll_au_superfund_product_read_all():
     #[/SUPERFUND_PRODUCT:READ_ALL]
 
     return render_template(
-        "output.html", title="SuperFund Products", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="superfund_product", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_au_timesheet_read_all")
+@demos.page("Timesheets", menu=("payroll_au", "timesheet", "Read"))
 @xero_token_required
 def payroll_au_timesheet_read_all():
     code = get_code_snippet("TIMESHEET","READ_ALL")
@@ -10327,18 +10458,18 @@ def payroll_au_timesheet_read_all():
     #[/TIMESHEET:READ_ALL]
 
     return render_template(
-        "output.html", title="Timesheets", code=code, output=output, json=json, len = 0, set="payroll_au", endpoint="timesheet", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 
-@app.route("/payroll_nz_employee_nz_read_all")
+@demos.page("Employees", menu=("payroll_nz", "employee_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_employee_nz_read_all():
     code = get_code_snippet("EMPLOYEE_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EMPLOYEE_NZ:READ_ALL]
     try:
@@ -10354,21 +10485,18 @@ def payroll_nz_employee_nz_read_all():
     #[/EMPLOYEE_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Employees", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_nz_read_one")
+@demos.page("Employees", menu=("payroll_nz", "employee_nz", "Read (one)"))
 @xero_token_required
 def payroll_nz_employee_nz_read_one():
     code = get_code_snippet("EMPLOYEE_NZ","READ_ONE")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_NZ:READ_ONE]
     try:
@@ -10386,26 +10514,20 @@ def payroll_nz_employee_nz_read_one():
     #[/EMPLOYEE_NZ:READ_ONE]
 
     return render_template(
-        "output.html", title="Employees", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_nz", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employment_nz_create")
+@demos.page("Employment", menu=("payroll_nz", "employment_nz", "Create"))
 @xero_token_required
 def payroll_nz_employment_nz_create():
     code = get_code_snippet("EMPLOYMENT_NZ","CREATE")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
-    read_pay_run_calendars = payrollnz_api.get_pay_run_calendars(
-        xero_tenant_id
-    )
-    payroll_calendar_id = getvalue(read_pay_run_calendars, "pay_run_calendars.0.payroll_calendar_id", "")
+    payroll_calendar_id = get_seed_value(PayrollNzApi, "get_pay_run_calendars", "pay_run_calendars.0.payroll_calendar_id")
 
     #[EMPLOYMENT_NZ:CREATE]
     employment = Employment(
@@ -10427,21 +10549,18 @@ def payroll_nz_employment_nz_create():
     #[/EMPLOYMENT_NZ:CREATE]
 
     return render_template(
-        "output.html", title="Employment", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employment_nz", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_tax_nz_read")
+@demos.page("Employee Tax", menu=("payroll_nz", "employee_tax_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_tax_nz_read():
     code = get_code_snippet("EMPLOYEE_TAX_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_TAX_NZ:READ]
     try:
@@ -10459,16 +10578,16 @@ def payroll_nz_employee_tax_nz_read():
     #[/EMPLOYEE_TAX_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Tax", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_tax_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_leave_setup_nz_read")
+@demos.page("Employee Leave", menu=("payroll_nz", "employee_leave_setup_nz", "Create"))
 @xero_token_required
 def payroll_nz_employee_leave_setup_nz_read():
     code = get_code_snippet("EMPLOYEE_LEAVE_SETUP_NZ","CREATE")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     address = Address(
         address_line1 = "101 Green St",
@@ -10516,21 +10635,18 @@ def payroll_nz_employee_leave_setup_nz_read():
     #[/EMPLOYEE_LEAVE_SETUP_NZ:CREATE]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_leave_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_leave_nz_read")
+@demos.page("Employee Leave", menu=("payroll_nz", "employee_leave_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_leave_nz_read():
     code = get_code_snippet("EMPLOYEE_LEAVE_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_LEAVE_NZ:READ]
     try:
@@ -10548,21 +10664,18 @@ def payroll_nz_employee_leave_nz_read():
     #[/EMPLOYEE_LEAVE_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_leave_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_leave_balances_nz_read")
+@demos.page("Employee Leave Balances", menu=("payroll_nz", "employee_leave_balances_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_leave_balances_nz_read():
     code = get_code_snippet("EMPLOYEE_LEAVE_BALANCES_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_LEAVE_BALANCES_NZ:READ]
     try:
@@ -10580,21 +10693,18 @@ def payroll_nz_employee_leave_balances_nz_read():
     #[/EMPLOYEE_LEAVE_BALANCES_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Leave Balances", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_leave_balances_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_payment_method_nz_read")
+@demos.page("Employee Payment Method", menu=("payroll_nz", "employee_payment_method_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_payment_method_nz_read():
     code = get_code_snippet("EMPLOYEE_PAYMENT_METHOD_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_PAYMENT_METHOD_NZ:READ]
     try:
@@ -10613,16 +10723,16 @@ def payroll_nz_employee_payment_method_nz_read():
     #[/EMPLOYEE_PAYMENT_METHOD_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Payment Method", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_payment_method_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_pay_run_calendars_nz_read_all")
+@demos.page("Payrun Calendars", menu=("payroll_nz", "pay_run_calendars_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_pay_run_calendars_nz_read_all():
     code = get_code_snippet("PAY_RUN_CALENDARS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[PAY_RUN_CALENDARS_NZ:READ_ALL]
     try:
@@ -10640,21 +10750,18 @@ def payroll_nz_pay_run_calendars_nz_read_all():
     #[/PAY_RUN_CALENDARS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Payrun Calendars", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="pay_run_calendars_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_salary_and_wages_nz_read_all")
+@demos.page("Employee Salary and Wages", menu=("payroll_nz", "employee_salary_and_wages_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_employee_salary_and_wages_nz_read_all():
     code = get_code_snippet("EMPLOYEE_SALARY_AND_WAGES_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_SALARY_AND_WAGES_NZ:READ_ALL]
     try:
@@ -10672,21 +10779,18 @@ def payroll_nz_employee_salary_and_wages_nz_read_all():
     #[/EMPLOYEE_SALARY_AND_WAGES_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Salary and Wages", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_salary_and_wages_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_opening_balances_nz_read")
+@demos.page("Employee Opening Balances", menu=("payroll_nz", "employee_opening_balances_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_opening_balances_nz_read():
     code = get_code_snippet("EMPLOYEE_OPENING_BALANCES_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_OPENING_BALANCES_NZ:READ]
     try:
@@ -10704,21 +10808,18 @@ def payroll_nz_employee_opening_balances_nz_read():
     #[/EMPLOYEE_OPENING_BALANCES_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Opening Balances", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_opening_balances_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_leave_periods_nz_read")
+@demos.page("Employee Leave Periods", menu=("payroll_nz", "employee_leave_periods_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_leave_periods_nz_read():
     code = get_code_snippet("EMPLOYEE_LEAVE_PERIODS_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_LEAVE_PERIODS_NZ:READ]
     start_date = dateutil.parser.parse("2020-03-01T00:00:00Z")
@@ -10739,21 +10840,18 @@ def payroll_nz_employee_leave_periods_nz_read():
     #[/EMPLOYEE_LEAVE_PERIODS_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Leave Periods", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_leave_periods_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_leave_types_nz_read")
+@demos.page("Employee Leave Types", menu=("payroll_nz", "employee_leave_types_nz", "Read"))
 @xero_token_required
 def payroll_nz_employee_leave_types_nz_read():
     code = get_code_snippet("EMPLOYEE_LEAVE_TYPES_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_LEAVE_TYPES_NZ:READ]
     try:
@@ -10771,21 +10869,18 @@ def payroll_nz_employee_leave_types_nz_read():
     #[/EMPLOYEE_LEAVE_TYPES_NZ:READ]
 
     return render_template(
-        "output.html", title="Employee Leave Types", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_leave_types_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_employee_pay_templates_nz_read_all")
+@demos.page("Employee Pay Templates", menu=("payroll_nz", "employee_pay_templates_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_employee_pay_templates_nz_read_all():
     code = get_code_snippet("EMPLOYEE_PAY_TEMPLATES_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_employees = payrollnz_api.get_employees(
-        xero_tenant_id
-    )
-    employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+    employee_id = get_seed_value(PayrollNzApi, "get_employees", "employees.0.employee_id")
 
     #[EMPLOYEE_PAY_TEMPLATES_NZ:READ_ALL]
     try:
@@ -10803,16 +10898,16 @@ def payroll_nz_employee_pay_templates_nz_read_all():
     #[/EMPLOYEE_PAY_TEMPLATES_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Pay Templates", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="employee_pay_templates_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_earnings_rates_nz_read_all")
+@demos.page("Earnings Rates", menu=("payroll_nz", "earnings_rates_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_earnings_rates_nz_read_all():
     code = get_code_snippet("EARNINGS_RATES_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[EARNINGS_RATES_NZ:READ_ALL]
     try:
@@ -10830,16 +10925,16 @@ def payroll_nz_earnings_rates_nz_read_all():
     #[/EARNINGS_RATES_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Earnings Rates", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="earnings_rates_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_deductions_nz_read_all")
+@demos.page("Deductions", menu=("payroll_nz", "deductions_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_deductions_nz_read_all():
     code = get_code_snippet("DEDUCTIONS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[DEDUCTIONS_NZ:READ_ALL]
     try:
@@ -10857,16 +10952,16 @@ def payroll_nz_deductions_nz_read_all():
     #[/DEDUCTIONS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Deductions", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="deductions_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_leave_types_nz_read_all")
+@demos.page("Leave Types", menu=("payroll_nz", "leave_types_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_leave_types_nz_read_all():
     code = get_code_snippet("LEAVE_TYPES_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[LEAVE_TYPES_NZ:READ_ALL]
     try:
@@ -10884,16 +10979,16 @@ def payroll_nz_leave_types_nz_read_all():
     #[/LEAVE_TYPES_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Leave Types", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="leave_types_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_reimbursements_nz_read_all")
+@demos.page("Reimbursements", menu=("payroll_nz", "reimbursements_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_reimbursements_nz_read_all():
     code = get_code_snippet("REIMBURSEMENTS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[REIMBURSEMENTS_NZ:READ_ALL]
     try:
@@ -10911,17 +11006,17 @@ def payroll_nz_reimbursements_nz_read_all():
     #[/REIMBURSEMENTS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Reimbursements", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="reimbursements_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 
-@app.route("/payroll_nz_statutory_deductions_nz_read_all")
+@demos.page("Statutory Deductions", menu=("payroll_nz", "statutory_deductions_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_statutory_deductions_nz_read_all():
     code = get_code_snippet("STATUTORY_DEDUCTIONS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[STATUTORY_DEDUCTIONS_NZ:READ_ALL]
     try:
@@ -10939,16 +11034,16 @@ def payroll_nz_statutory_deductions_nz_read_all():
     #[/STATUTORY_DEDUCTIONS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Statutory Deductions", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="statutory_deductions_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_superannuation_nz_read_all")
+@demos.page("Superannuation", menu=("payroll_nz", "superannuation_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_superannuation_nz_read_all():
     code = get_code_snippet("SUPERANNUATION_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[SUPERANNUATION_NZ:READ_ALL]
     try:
@@ -10966,16 +11061,16 @@ def payroll_nz_superannuation_nz_read_all():
     #[/SUPERANNUATION_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Superannuation", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="superannuations_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_pay_runs_nz_read_all")
+@demos.page("Payruns", menu=("payroll_nz", "pay_runs_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_pay_runs_nz_read_all():
     code = get_code_snippet("PAY_RUNS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[PAY_RUNS_NZ:READ_ALL]
     try:
@@ -10993,21 +11088,18 @@ def payroll_nz_pay_runs_nz_read_all():
     #[/PAY_RUNS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Payruns", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="pay_runs_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_pay_slips_nz_read_all")
+@demos.page("Payslips", menu=("payroll_nz", "pay_slips_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_pay_slips_nz_read_all():
     code = get_code_snippet("PAY_SLIPS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
-    read_all_pay_runs = payrollnz_api.get_pay_runs(
-        xero_tenant_id
-    )
-    pay_run_id = getvalue(read_all_pay_runs, "pay_runs.0.pay_run_id", "")
+    pay_run_id = get_seed_value(PayrollNzApi, "get_pay_runs", "pay_runs.0.pay_run_id")
 
     #[PAY_SLIPS_NZ:READ_ALL]
     try:
@@ -11025,16 +11117,16 @@ def payroll_nz_pay_slips_nz_read_all():
     #[/PAY_SLIPS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Payslips", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="pay_slips_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_timesheets_nz_read_all")
+@demos.page("Timesheets", menu=("payroll_nz", "timesheets_nz", "Read (all)"))
 @xero_token_required
 def payroll_nz_timesheets_nz_read_all():
     code = get_code_snippet("TIMESHEETS_NZ","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[TIMESHEETS_NZ:READ_ALL]
     try:
@@ -11052,16 +11144,16 @@ def payroll_nz_timesheets_nz_read_all():
     #[/TIMESHEETS_NZ:READ_ALL]
 
     return render_template(
-        "output.html", title="Timesheets", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="timesheets_nz", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_settings_nz_read_all")
+@demos.page("Settings", menu=("payroll_nz", "settings_nz", "Read"))
 @xero_token_required
 def payroll_nz_settings_nz_read_all():
     code = get_code_snippet("SETTINGS_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[SETTINGS_NZ:READ]
     try:
@@ -11079,16 +11171,16 @@ def payroll_nz_settings_nz_read_all():
     #[/SETTINGS_NZ:READ]
 
     return render_template(
-        "output.html", title="Settings", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="settings_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_nz_tracking_categories_nz_read_all")
+@demos.page("Tracking Categories", menu=("payroll_nz", "tracking_categories_nz", "Read"))
 @xero_token_required
 def payroll_nz_tracking_categories_nz_read_all():
     code = get_code_snippet("TRACKING_CATEGORIES_NZ","READ")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrollnz_api = PayrollNzApi(api_client)
+    payrollnz_api = get_api(PayrollNzApi)
 
     #[TRACKING_CATEGORIES_NZ:READ]
     try:
@@ -11106,18 +11198,18 @@ def payroll_nz_tracking_categories_nz_read_all():
     #[/TRACKING_CATEGORIES_NZ:READ]
 
     return render_template(
-        "output.html", title="Tracking Categories", code=code, output=output, json=json, len = 0, set="payroll_nz", endpoint="tracking_categories_nz", action="read"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 # UK PAYROLL ------------------------------>
-@app.route("/payroll_uk_employee_uk_read_all")
+@demos.page("Employees", menu=("payroll_uk", "employee_uk", "Read"))
 @xero_token_required
 def payroll_uk_employee_uk_read_all():
     code = get_code_snippet("EMPLOYEE_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EMPLOYEE_UK:READ_ALL]
     try:
@@ -11133,32 +11225,26 @@ def payroll_uk_employee_uk_read_all():
     #[/EMPLOYEE_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employees", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employment_uk_create")
+@demos.page("Employment", menu=("payroll_uk", "employment_uk", "Create"))
 @xero_token_required
 def payroll_uk_employment_uk_create():
     code = get_code_snippet("EMPLOYMENT_UK","CREATE")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_pay_run_calendar = payrolluk_api.get_pay_run_calendars(
-            xero_tenant_id
-        )
-        payroll_calendar_id = getvalue(read_pay_run_calendar, "pay_run_calendars.0.payroll_calendar_id", "")
+        payroll_calendar_id = get_seed_value(PayrollUkApi, "get_pay_run_calendars", "pay_run_calendars.0.payroll_calendar_id")
         print(payroll_calendar_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
@@ -11185,17 +11271,17 @@ def payroll_uk_employment_uk_create():
     #[/EMPLOYMENT_UK:CREATE]
 
     return render_template(
-        "output.html", title="Employment", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employment_uk", action="create"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_tax_uk_read_all")
+@demos.page("Employee Tax", menu=("payroll_uk", "employee_tax_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_tax_uk_read_all():
     code = get_code_snippet("EMPLOYEE_TAX_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EMPLOYEE_TAX_UK:READ_ALL]
     try:
@@ -11211,23 +11297,20 @@ def payroll_uk_employee_tax_uk_read_all():
     #[/EMPLOYEE_TAX_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Tax", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_tax_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_opening_balance_uk_read_all")
+@demos.page("Employee Opening Balance", menu=("payroll_uk", "employee_opening_balance_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_opening_balance_uk_read_all():
     code = get_code_snippet("EMPLOYEE_OPENING_BALANCE_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11246,23 +11329,20 @@ def payroll_uk_employee_opening_balance_uk_read_all():
     #[/EMPLOYEE_OPENING_BALANCE_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Opening Balance", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_opening_balance_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_leaves_uk_read_all")
+@demos.page("Employee Leave", menu=("payroll_uk", "employee_leaves_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_leaves_uk_read_all():
     code = get_code_snippet("EMPLOYEE_LEAVES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11281,23 +11361,20 @@ def payroll_uk_employee_leaves_uk_read_all():
     #[/EMPLOYEE_LEAVES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_leaves_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_leave_balances_uk_read_all")
+@demos.page("Employee Leave", menu=("payroll_uk", "employee_leave_balances_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_leave_balances_uk_read_all():
     code = get_code_snippet("EMPLOYEE_LEAVE_BALANCES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11316,23 +11393,20 @@ def payroll_uk_employee_leave_balances_uk_read_all():
     #[/EMPLOYEE_LEAVE_BALANCES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_leave_balances_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_statutory_leave_balance_uk_read_all")
+@demos.page("Employee Leave", menu=("payroll_uk", "employee_statutory_leave_balance_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_statutory_leave_balance_uk_read_all():
     code = get_code_snippet("EMPLOYEE_STATUTORYLEAVE_BALANCES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11352,24 +11426,21 @@ def payroll_uk_employee_statutory_leave_balance_uk_read_all():
     #[/EMPLOYEE_STATUTORYLEAVE_BALANCES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_statutory_leave_balance_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
 
-@app.route("/payroll_uk_employee_statutory_leave_summary_uk_read_all")
+@demos.page("Employee Leave", menu=("payroll_uk", "employee_statutory_leave_summary_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_statutory_leave_summary_uk_read_all():
     code = get_code_snippet("EMPLOYEE_STATUTORY_LEAVE_SUMMARY_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11389,32 +11460,26 @@ def payroll_uk_employee_statutory_leave_summary_uk_read_all():
     #[/EMPLOYEE_STATUTORY_LEAVE_SUMMARY_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_statutory_leave_summary_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_statutory_sick_leave_uk_read_all")
+@demos.page("Employee Statutory Sick Leave", menu=("payroll_uk", "employee_statutory_sick_leave_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_statutory_sick_leave_uk_read_all():
     code = get_code_snippet("EMPLOYEE_STATUTORY_SICK_LEAVE_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
 
     try:
-        read_statutory_leave_summary = payrolluk_api.get_statutory_leave_summary(
-            xero_tenant_id, employee_id=employee_id
-        )
-        statutory_sick_leave_id = getvalue(read_statutory_leave_summary, "statutory_leaves.0.statutory_leave_id", "")
+        statutory_sick_leave_id = get_seed_value(PayrollUkApi, "get_statutory_leave_summary", "statutory_leaves.0.statutory_leave_id", employee_id=employee_id)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11433,23 +11498,20 @@ def payroll_uk_employee_statutory_sick_leave_uk_read_all():
     #[/EMPLOYEE_STATUTORY_SICK_LEAVE_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Statutory Sick Leave", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_statutory_sick_leave_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_leave_periods_uk_read_all")
+@demos.page("Employee Leave Periods", menu=("payroll_uk", "employee_leave_periods_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_leave_periods_uk_read_all():
     code = get_code_snippet("EMPLOYEE_LEAVE_PERIODS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11470,23 +11532,20 @@ def payroll_uk_employee_leave_periods_uk_read_all():
     #[/EMPLOYEE_LEAVE_PERIODS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave Periods", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_leave_periods_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_leave_types_uk_read_all")
+@demos.page("Employee Leave Types", menu=("payroll_uk", "employee_leave_types_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_leave_types_uk_read_all():
     code = get_code_snippet("EMPLOYEE_LEAVE_TYPES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11505,23 +11564,20 @@ def payroll_uk_employee_leave_types_uk_read_all():
     #[/EMPLOYEE_LEAVE_TYPES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Leave Types", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_leave_types_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employee_pay_template_uk_read_all")
+@demos.page("Employee Pay Template", menu=("payroll_uk", "employee_pay_template_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employee_pay_template_uk_read_all():
     code = get_code_snippet("EMPLOYEE_PAY_TEMPLATE_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11540,17 +11596,17 @@ def payroll_uk_employee_pay_template_uk_read_all():
     #[/EMPLOYEE_PAY_TEMPLATE_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employee Pay Template", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employee_pay_template_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_employer_pensions_uk_read_all")
+@demos.page("Employer Pensions", menu=("payroll_uk", "employer_pensions_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_employer_pensions_uk_read_all():
     code = get_code_snippet("EMPLOYER_PENSIONS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EMPLOYER_PENSIONS_UK:READ_ALL]
     try:
@@ -11566,17 +11622,17 @@ def payroll_uk_employer_pensions_uk_read_all():
     #[/EMPLOYER_PENSIONS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Employer Pensions", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="employer_pensions_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_deductions_uk_read_all")
+@demos.page("Deductions", menu=("payroll_uk", "deductions_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_deductions_uk_read_all():
     code = get_code_snippet("DEDUCTIONS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[DEDUCTIONS_UK:READ_ALL]
     try:
@@ -11592,17 +11648,17 @@ def payroll_uk_deductions_uk_read_all():
     #[/DEDUCTIONS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Deductions", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="deductions_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_earnings_orders_uk_read_all")
+@demos.page("Earnings Orders", menu=("payroll_uk", "earnings_orders_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_earnings_orders_uk_read_all():
     code = get_code_snippet("EARNINGS_ORDERS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EARNINGS_ORDERS_UK:READ_ALL]
     try:
@@ -11618,17 +11674,17 @@ def payroll_uk_earnings_orders_uk_read_all():
     #[/EARNINGS_ORDERS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Earnings Orders", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="earnings_orders_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_earnings_rates_uk_read_all")
+@demos.page("Earnings Rates", menu=("payroll_uk", "earnings_rates_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_earnings_rates_uk_read_all():
     code = get_code_snippet("EARNINGS_RATES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[EARNINGS_RATES_UK:READ_ALL]
     try:
@@ -11644,17 +11700,17 @@ def payroll_uk_earnings_rates_uk_read_all():
     #[/EARNINGS_RATES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Earnings Rates", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="earnings_rates_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_leave_types_uk_read_all")
+@demos.page("Leave Types", menu=("payroll_uk", "leave_types_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_leave_types_uk_read_all():
     code = get_code_snippet("LEAVE_TYPES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[LEAVE_TYPES_UK:READ_ALL]
     try:
@@ -11670,17 +11726,17 @@ def payroll_uk_leave_types_uk_read_all():
     #[/LEAVE_TYPES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Leave Types", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="leave_types_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_reimbursements_uk_read_all")
+@demos.page("Reimbursements", menu=("payroll_uk", "reimbursements_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_reimbursements_uk_read_all():
     code = get_code_snippet("REIMBURSEMENTS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[REIMBURSEMENTS_UK:READ_ALL]
     try:
@@ -11696,17 +11752,17 @@ def payroll_uk_reimbursements_uk_read_all():
     #[/REIMBURSEMENTS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Reimbursements", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="reimbursements_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_timesheets_uk_read_all")
+@demos.page("Timesheets", menu=("payroll_uk", "timesheets_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_timesheets_uk_read_all():
     code = get_code_snippet("TIMESHEETS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[TIMESHEETS_UK:READ_ALL]
     try:
@@ -11722,23 +11778,20 @@ def payroll_uk_timesheets_uk_read_all():
     #[/TIMESHEETS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Timesheets", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="timesheets_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_payment_methods_uk_read_all")
+@demos.page("Payment Methods", menu=("payroll_uk", "payment_methods_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_payment_methods_uk_read_all():
     code = get_code_snippet("PAYMENT_METHODS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11757,23 +11810,20 @@ def payroll_uk_payment_methods_uk_read_all():
     #[/PAYMENT_METHODS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Payment Methods", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="payment_methods_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_pay_run_calendars_uk_read_all")
+@demos.page("Pay Run Calendars", menu=("payroll_uk", "pay_run_calendars_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_pay_run_calendars_uk_read_all():
     code = get_code_snippet("PAY_RUN_CALENDARS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11792,23 +11842,20 @@ def payroll_uk_pay_run_calendars_uk_read_all():
     #[/PAY_RUN_CALENDARS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Pay Run Calendars", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="pay_run_calendars_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_salary_and_wage_uk_read_all")
+@demos.page("Salary and Wage", menu=("payroll_uk", "salary_and_wage_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_salary_and_wage_uk_read_all():
     code = get_code_snippet("SALARY_AND_WAGE_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_employees = payrolluk_api.get_employees(
-            xero_tenant_id
-        )
-        employee_id = getvalue(read_employees, "employees.0.employee_id", "")
+        employee_id = get_seed_value(PayrollUkApi, "get_employees", "employees.0.employee_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11827,17 +11874,17 @@ def payroll_uk_salary_and_wage_uk_read_all():
     #[/SALARY_AND_WAGE_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Salary and Wage", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="salary_and_wage_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_pay_runs_uk_read_all")
+@demos.page("Pay runs", menu=("payroll_uk", "pay_runs_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_pay_runs_uk_read_all():
     code = get_code_snippet("PAY_RUNS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[PAY_RUNS_UK:READ_ALL]
     try:
@@ -11853,23 +11900,20 @@ def payroll_uk_pay_runs_uk_read_all():
     #[/PAY_RUNS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Pay runs", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="pay_runs_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_pay_slips_uk_read_all")
+@demos.page("Pay slips", menu=("payroll_uk", "pay_slips_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_pay_slips_uk_read_all():
     code = get_code_snippet("PAY_SLIPS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_pay_runs = payrolluk_api.get_pay_runs(
-            xero_tenant_id
-        )
-        pay_run_id = getvalue(read_pay_runs, "pay_runs.0.pay_run_id", "")
+        pay_run_id = get_seed_value(PayrollUkApi, "get_pay_runs", "pay_runs.0.pay_run_id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -11888,17 +11932,17 @@ def payroll_uk_pay_slips_uk_read_all():
     #[/PAY_SLIPS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Pay slips", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="pay_slips_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_settings_uk_read_all")
+@demos.page("Settings", menu=("payroll_uk", "settings_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_settings_uk_read_all():
     code = get_code_snippet("SETTINGS_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[SETTINGS_UK:READ_ALL]
     try:
@@ -11914,17 +11958,17 @@ def payroll_uk_settings_uk_read_all():
     #[/SETTINGS_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Settings", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="settings_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/payroll_uk_tracking_categories_uk_read_all")
+@demos.page("Tracking categories", menu=("payroll_uk", "tracking_categories_uk", "Read (all)"))
 @xero_token_required
 def payroll_uk_tracking_categories_uk_read_all():
     code = get_code_snippet("TRACKING_CATEGORIES_UK","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    payrolluk_api = PayrollUkApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    payrolluk_api = get_api(PayrollUkApi)
+    accounting_api = get_api(AccountingApi)
 
     #[TRACKING_CATEGORIES_UK:READ_ALL]
     try:
@@ -11940,17 +11984,17 @@ def payroll_uk_tracking_categories_uk_read_all():
     #[/TRACKING_CATEGORIES_UK:READ_ALL]
 
     return render_template(
-        "output.html", title="Tracking categories", code=code, output=output, json=json, len = 0, set="payroll_uk", endpoint="tracking_categories_uk", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_file_read_all")
+@demos.page("File Read (all)", menu=("files", "file", "Read (all)"))
 @xero_token_required
 def files_file_read_all():
     code = get_code_snippet("FILE","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
 
     #[FILE:READ_ALL]
     try:
@@ -11966,23 +12010,20 @@ def files_file_read_all():
     #[/FILE:READ_ALL]
 
     return render_template(
-        "output.html", title="File Read (all)", code=code, output=output, json=json, len = 0, set="files", endpoint="file", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_file_read_one")
+@demos.page("File Read (one)", menu=("files", "file", "Read (one)"))
 @xero_token_required
 def files_file_read_one():
     code = get_code_snippet("FILE","READ_ONE")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
     
     try:
-        read_files = files_api.get_files(
-            xero_tenant_id, 
-        )
-        file_id = getvalue(read_files, "items.0.id", "")
+        file_id = get_seed_value(FilesApi, "get_files", "items.0.id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -12001,17 +12042,17 @@ def files_file_read_one():
     #[/FILE:READ_ONE]
 
     return render_template(
-        "output.html", title="File Read (one)", code=code, output=output, json=json, len = 0, set="files", endpoint="file", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_file_upload")
+@demos.page("File upload", menu=("files", "file", "Upload"))
 @xero_token_required
 def files_file_upload():
     code = get_code_snippet("FILE","UPLOAD")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
 
     #[FILE:UPLOAD]
     name = "helo-heros"
@@ -12037,17 +12078,17 @@ def files_file_upload():
     #[/FILE:UPLOAD]
 
     return render_template(
-        "output.html", title="File upload", code=code, output=output, json=json, len = 0, set="files", endpoint="file", action="upload"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_folder_read_all")
+@demos.page("Folder Read (all)", menu=("files", "folder", "Read (all)"))
 @xero_token_required
 def files_folder_read_all():
     code = get_code_snippet("FOLDER","READ_ALL")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
 
     #[FOLDER:READ_ALL]
     try:
@@ -12063,23 +12104,20 @@ def files_folder_read_all():
     #[/FOLDER:READ_ALL]
 
     return render_template(
-        "output.html", title="Folder Read (all)", code=code, output=output, json=json, len = 0, set="files", endpoint="folder", action="read_all"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_folder_read_one")
+@demos.page("Folder Read (one)", menu=("files", "folder", "Read (one)"))
 @xero_token_required
 def files_folder_read_one():
     code = get_code_snippet("FOLDER","READ_ONE")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
 
     try:
-        read_folders = files_api.get_folders(
-            xero_tenant_id, 
-        )
-        folder_id = getvalue(read_folders, "1.id", "")
+        folder_id = get_seed_value(FilesApi, "get_folders", "1.id")
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -12098,17 +12136,17 @@ def files_folder_read_one():
     #[/FOLDER:READ_ONE]
 
     return render_template(
-        "output.html", title="Folder Read (one)", code=code, output=output, json=json, len = 0, set="files", endpoint="folder", action="read_one"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/files_folder_read_inbox")
+@demos.page("Inbox Read", menu=("files", "folder", "Read (inbox)"))
 @xero_token_required
 def files_folder_read_inbox():
     code = get_code_snippet("FOLDER","READ_INBOX")
 
     xero_tenant_id = get_xero_tenant_id()
-    files_api = FilesApi(api_client)
-    accounting_api = AccountingApi(api_client)
+    files_api = get_api(FilesApi)
+    accounting_api = get_api(AccountingApi)
 
     #[FOLDER:READ_INBOX]
     try:
@@ -12124,10 +12162,10 @@ def files_folder_read_inbox():
     #[/FOLDER:READ_INBOX]
 
     return render_template(
-        "output.html", title="Inbox Read", code=code, output=output, json=json, len = 0, set="files", endpoint="folder", action="read_inbox"
+        "output.html", code=code, output=output, json=json, len = 0
     )
 
-@app.route("/finance_accounting_activities_account_usage_read_all")
+@demos.page("Accounting Activity Account Usage", menu=("finance", "accounting_activities", "Account Usage (GET)"))
 @xero_token_required
 def finance_accounting_activities_account_usage_read_all():
     code = get_code_snippet("ACCOUNTINGACTIVITYACCOUNTUSAGE","READ_ALL")
@@ -12151,10 +12189,10 @@ def finance_accounting_activities_account_usage_read_all():
     #[/ACCOUNTINGACTIVITYACCOUNTUSAGE:READ_ALL]
 
     return render_template(
-        "output.html", title="Accounting Activity Account Usage", code=code, json=json, output=output, len = 0, set="finance", endpoint="accounting_activities", action="account_usage_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_accounting_activities_lock_history_read_all")
+@demos.page("Accounting Activity Lock History", menu=("finance", "accounting_activities", "Lock History (GET)"))
 @xero_token_required
 def finance_accounting_activities_lock_history_read_all():
     code = get_code_snippet("ACCOUNTINGACTIVITYLOCKHISTORY","READ_ALL")
@@ -12178,10 +12216,10 @@ def finance_accounting_activities_lock_history_read_all():
     #[/ACCOUNTINGACTIVITYLOCKHISTORY:READ_ALL]
 
     return render_template(
-        "output.html", title="Accounting Activity Lock History", code=code, json=json, output=output, len = 0, set="finance", endpoint="accounting_activities", action="lock_history_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_accounting_activities_report_history_read_all")
+@demos.page("Accounting Activity Report History", menu=("finance", "accounting_activities", "Report History (GET)"))
 @xero_token_required
 def finance_accounting_activities_report_history_read_all():
     code = get_code_snippet("ACCOUNTINGACTIVITYREPORTHISTORY","READ_ALL")
@@ -12205,10 +12243,10 @@ def finance_accounting_activities_report_history_read_all():
     #[/ACCOUNTINGACTIVITYREPORTHISTORY:READ_ALL]
 
     return render_template(
-        "output.html", title="Accounting Activity Report History", code=code, json=json, output=output, len = 0, set="finance", endpoint="accounting_activities", action="report_history_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_accounting_activities_user_activities_read_all")
+@demos.page("Accounting Activity User Activities", menu=("finance", "accounting_activities", "User Activities (GET)"))
 @xero_token_required
 def finance_accounting_activities_user_activities_read_all():
     code = get_code_snippet("ACCOUNTINGACTIVITYUSERACTIVITIES","READ_ALL")
@@ -12232,10 +12270,10 @@ def finance_accounting_activities_user_activities_read_all():
     #[/ACCOUNTINGACTIVITYUSERACTIVITIES:READ_ALL]
 
     return render_template(
-        "output.html", title="Accounting Activity User Activities", code=code, json=json, output=output, len = 0, set="finance", endpoint="accounting_activities", action="user_activities_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_cash_validation_read_all")
+@demos.page("Cash Validation", menu=("finance", "cash_validation", "Cash Validation (GET)"))
 @xero_token_required
 def finance_cash_validation_read_all():
     code = get_code_snippet("CASHVALIDATION","READ_ALL")
@@ -12257,10 +12295,10 @@ def finance_cash_validation_read_all():
     #[/CASHVALIDATION:READ_ALL]
 
     return render_template(
-        "output.html", title="Cash Validation", code=code, json=json, output=output, len = 0, set="finance", endpoint="cash_validation", action="read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_balance_sheet_read_all")
+@demos.page("Financial Statements Balance Sheet", menu=("finance", "financial_statements", "Balance Sheet (GET)"))
 @xero_token_required
 def finance_financial_statements_balance_sheet_read_all():
     code = get_code_snippet("BALANCESHEET","READ_ALL")
@@ -12284,10 +12322,10 @@ def finance_financial_statements_balance_sheet_read_all():
     #[/BALANCESHEET:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Balance Sheet", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="balance_sheet_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_cashflow_read_all")
+@demos.page("Financial Statements Cash Flow", menu=("finance", "financial_statements", "Cash Flow (GET)"))
 @xero_token_required
 def finance_financial_statements_cashflow_read_all():
     code = get_code_snippet("CASHFLOW","READ_ALL")
@@ -12311,10 +12349,10 @@ def finance_financial_statements_cashflow_read_all():
     #[/CASHFLOW:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Cash Flow", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="cashflow_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_contacts_expense_read_all")
+@demos.page("Financial Statements Contacts Expense", menu=("finance", "financial_statements", "Contacts Expense (GET)"))
 @xero_token_required
 def finance_financial_statements_contacts_expense_read_all():
     code = get_code_snippet("CONTACTSEXPENSE","READ_ALL")
@@ -12338,10 +12376,10 @@ def finance_financial_statements_contacts_expense_read_all():
     #[/CONTACTSEXPENSE:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Contacts Expense", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="contacts_expense_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_contacts_revenue_read_all")
+@demos.page("Financial Statements Contacts Revenue", menu=("finance", "financial_statements", "Contacts Revenue (GET)"))
 @xero_token_required
 def finance_financial_statements_contacts_revenue_read_all():
     code = get_code_snippet("CONTACTSREVENUE","READ_ALL")
@@ -12365,10 +12403,10 @@ def finance_financial_statements_contacts_revenue_read_all():
     #[/CONTACTSREVENUE:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Contacts Revenue", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="contacts_revenue_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_profit_and_loss_read_all")
+@demos.page("Financial Statements Profit and Loss", menu=("finance", "financial_statements", "Profit and Loss (GET)"))
 @xero_token_required
 def finance_financial_statements_profit_and_loss_read_all():
     code = get_code_snippet("PROFITANDLOSS","READ_ALL")
@@ -12392,10 +12430,10 @@ def finance_financial_statements_profit_and_loss_read_all():
     #[/PROFITANDLOSS:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Profit and Loss", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="profit_and_loss_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_financial_statements_trial_balance_read_all")
+@demos.page("Financial Statements Trial Balance", menu=("finance", "financial_statements", "Trial Balance (GET)"))
 @xero_token_required
 def finance_financial_statements_trial_balance_read_all():
     code = get_code_snippet("TRIALBALANCE","READ_ALL")
@@ -12417,22 +12455,19 @@ def finance_financial_statements_trial_balance_read_all():
     #[/TRIALBALANCE:READ_ALL]
 
     return render_template(
-        "output.html", title="Financial Statements Trial Balance", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="trial_balance_read_all"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
-@app.route("/finance_bank_statement_accounting_read")
+@demos.page("Bank Statement Accounting", menu=("finance", "financial_statements", "Bank Statements Plus (GET)"))
 @xero_token_required
 def finance_bank_statement_accounting_read():
     code = get_code_snippet("BANKSTATEMENTSPLUS","READ")
     xero_tenant_id = get_xero_tenant_id()
-    accounting_api = AccountingApi(api_client)
+    accounting_api = get_api(AccountingApi)
 
     where = "Status==\"ACTIVE\" AND Type==\"BANK\""
     try:
-        read_accounts_for_valid_status = accounting_api.get_accounts(
-            xero_tenant_id, where=where
-        )
-        account_id = getvalue(read_accounts_for_valid_status, "accounts.0.account_id", "")
+        account_id = get_seed_value(AccountingApi, "get_accounts", "accounts.0.account_id", where=where)
     except AccountingBadRequestException as exception:
         output = "Error: " + exception.reason
         json = jsonify(exception.error_data)
@@ -12454,7 +12489,7 @@ def finance_bank_statement_accounting_read():
     #[/BANKSTATEMENTSPLUS:READ]
 
     return render_template(
-        "output.html", title="Bank Statement Accounting", code=code, json=json, output=output, len = 0, set="finance", endpoint="financial_statements", action="bank_statements_plus_read"
+        "output.html", code=code, json=json, output=output, len = 0
     )
 
 @app.route("/login")
@@ -12476,6 +12511,7 @@ def oauth_callback():
         raise
     if response is None or response.get("access_token") is None:
         return "Access denied: response=%s" % response
+    tenant_cache.pop(get_token_cache_key())
     store_xero_oauth2_token(response)
     return redirect(url_for("index", _external=True))
 
@@ -12483,16 +12519,17 @@ def oauth_callback():
 @app.route("/disconnect")
 def disconnect():
     connection_id = get_connection_id()
-    identity_api = IdentityApi(api_client)
+    identity_api = get_api(IdentityApi)
     identity_api.delete_connection(
         id=connection_id
     )
+    tenant_cache.pop(get_token_cache_key())
 
     return redirect(url_for("index", _external=True))
 
 @app.route("/logout")
 def logout():
-
+    tenant_cache.pop(get_token_cache_key())
     store_xero_oauth2_token(None)
     return redirect(url_for("index", _external=True))
 
@@ -12515,7 +12552,10 @@ def export_token():
 @xero_token_required
 def refresh_token():
     xero_token = obtain_xero_oauth2_token()
-    new_token = api_client.refresh_oauth2_token()
+    new_token = token_refresher.refresh(
+        xero_token, timeout=app.config["TOKEN_REFRESH_TIMEOUT"]
+    )
+    store_xero_oauth2_token(new_token)
     return render_template(
         "output.html",
         title="Xero OAuth2 token",
@@ -12526,6 +12566,7 @@ def refresh_token():
 @xero_token_required
 def revoke_token():
     xero_token = obtain_xero_oauth2_token()
+    tenant_cache.pop(get_token_cache_key())
     new_token = api_client.revoke_oauth2_token()
     session.pop('token', None)
     return render_template(
@@ -12536,22 +12577,204 @@ def revoke_token():
     )
 
 
-def get_connection_id():
-    identity_api = IdentityApi(api_client)
+@app.route("/sync")
+@xero_token_required
+def sync_entities():
+    # bring the local copy of every entity, or just ?entity=invoices, up to date
+    entity = request.args.get("entity")
+    entities = list(SYNC_ENTITIES) + [JOURNALS]
+    if entity is not None and entity not in entities:
+        return render_template(
+            "output.html",
+            title="Incremental sync",
+            output="Error: unknown entity {}, one of {}".format(entity, ", ".join(entities)),
+        )
+
+    accounting_api = get_api(AccountingApi)
+    xero_tenant_id = get_xero_tenant_id()
+    # journals synced from now on are counted on top of the ones already stored
+    ledger.backfill(xero_tenant_id)
+    try:
+        results = [
+            incremental_sync.sync(accounting_api, xero_tenant_id, name)
+            for name in ([entity] if entity else entities)
+        ]
+    except AccountingBadRequestException as exception:
+        output = "Error: " + exception.reason
+        json = jsonify(exception.error_data)
+    else:
+        output = "Synced {} entities, fetched {} records.".format(
+            len(results), sum(result.fetched for result in results)
+        )
+        json = jsonify([result._asdict() for result in results])
+
+    return render_template(
+        "output.html", title="Incremental sync", output=output, json=json
+    )
+
+
+@app.route("/ledger")
+@xero_token_required
+def general_ledger():
+    # trial balance from the synced journals, ?period=2024-06 up to a month end,
+    # ?account=200 lists the monthly movements of an account, ?start= and ?end= bound them,
+    # ?rebuild=1 recomputes the totals from the stored journals first
+    xero_tenant_id = get_xero_tenant_id()
+    started = time.perf_counter()
+    if request.args.get("rebuild") == "1":
+        ledger.rebuild(xero_tenant_id)
+    else:
+        ledger.backfill(xero_tenant_id)
+    if "account" in request.args:
+        result = ledger.movements(
+            xero_tenant_id, request.args["account"],
+            request.args.get("start"), request.args.get("end"),
+        )
+        output = "Account {} movements in {} periods".format(request.args["account"], len(result))
+    else:
+        result = ledger.trial_balance(xero_tenant_id, request.args.get("period"))
+        output = "Trial balance of {} accounts, debits {} credits {}".format(
+            len(result["accounts"]), result["debit"], result["credit"]
+        )
+    output += " in {:.2f} ms, journals up to number {} (sync at /sync?entity=journals)".format(
+        (time.perf_counter() - started) * 1000, mirror.cursor(xero_tenant_id, JOURNALS)
+    )
+
+    return render_template(
+        "output.html", title="General ledger", output=output, json=jsonify(result)
+    )
+
+
+@app.route("/bulk-create")
+@xero_token_required
+def bulk_create():
+    # ?count=200 sample contacts created in chunks, with a result per contact
+    count = min(request.args.get("count", 100, type=int), app.config["BULK_DEMO_MAX_RECORDS"])
+    batch = get_random_num()
+    contacts = (
+        Contact(name="George-{}-{}".format(batch, number), first_name="George", last_name="Jetson")
+        for number in range(count)
+    )
+    report = bulk_writer.create(get_api(AccountingApi), get_xero_tenant_id(), "contacts", contacts)
+
+    output = "Created {} of {} contacts in {} chunks in {}s, {} failed".format(
+        report.created, count, report.chunks, report.seconds, report.failed
+    )
+    result_list = [
+        "Error: contact {}: {}".format(result.index, "; ".join(result.errors))
+        for result in report.results if result.errors
+    ]
+    return render_template(
+        "output.html", title="Bulk create", output=output, result_list=result_list,
+        json=jsonify(dict(
+            report._asdict(), results=[result._asdict() for result in report.results]
+        )),
+    )
+
+
+@app.route("/cache-stats")
+@xero_token_required
+def cache_stats():
+    # counters of the whole process, tenant state only of the signed in tenant
+    return render_template(
+        "output.html",
+        title="Cache and rate limit statistics",
+        code=jsonify({
+            "tenant_cache": tenant_cache.stats(),
+            "seed_cache": seed_cache.stats(),
+            "rate_limiter": api_client.rate_limiter.stats(get_xero_tenant_id()),
+            "session_store": getattr(app.session_interface, "stats", dict)(),
+            "compression": compression.stats(),
+            "incremental_sync": incremental_sync.stats(),
+            "bulk_writer": bulk_writer.stats(),
+        }),
+    )
+
+
+def get_token_cache_key():
+    # server side sessions have a stable id, fall back to the id token otherwise
+    token = obtain_xero_oauth2_token()
+    if not token:
+        return None
+    return getattr(session, "sid", None) or token.get("id_token")
+
+def get_organisation_connection():
+    cache_key = get_token_cache_key()
+    connection = tenant_cache.get(cache_key) if cache_key else None
+    if connection is not None:
+        return connection
+
+    identity_api = get_api(IdentityApi)
     for connection in identity_api.get_connections():
         if connection.tenant_type == "ORGANISATION":
-            return connection.id
+            if cache_key:
+                tenant_cache.set(cache_key, connection)
+            return connection
+
+def get_connection_id():
+    connection = get_organisation_connection()
+    if connection is not None:
+        return connection.id
 
 def get_xero_tenant_id():
+    # resolved at most once per request, routes ask for it several times
+    if "xero_tenant_id" in g:
+        return g.xero_tenant_id
+
     token = obtain_xero_oauth2_token()
     if not token:
         return None
 
-    identity_api = IdentityApi(api_client)
-    for connection in identity_api.get_connections():
-        if connection.tenant_type == "ORGANISATION":
-            return connection.tenant_id
+    connection = get_organisation_connection()
+    g.xero_tenant_id = connection.tenant_id if connection is not None else None
+    return g.xero_tenant_id
+
+def get_api(api_class):
+    # one api facade per class for the lifetime of the request
+    apis = g.setdefault("xero_apis", {})
+    if api_class not in apis:
+        apis[api_class] = api_class(api_client)
+    return apis[api_class]
+
+@app.after_request
+def invalidate_seed_cache(response):
+    # sample ids of tenants written to by any sdk call, including pool threads, are stale
+    for xero_tenant_id in list(written_tenants):
+        written_tenants.discard(xero_tenant_id)
+        seed_cache.discard(lambda key: key[0] == xero_tenant_id)
+    return response
 
+def get_seed_value(api_class, method, path, **kwargs):
+    # getvalue(fetch_once(...), path) shared across requests of the same tenant
+    xero_tenant_id = get_xero_tenant_id()
+    key = (xero_tenant_id, api_class.__name__, method, path, tuple(sorted(kwargs.items())))
+    value = seed_cache.get(key)
+    if value is None:
+        value = getvalue(fetch_once(api_class, method, **kwargs), path, "")
+        if value:
+            seed_cache.set(key, value)
+    return value
+
+def fetch_once(api_class, method, **kwargs):
+    # api_class.method(tenant_id, **kwargs) for the current tenant, called once per request
+    key = (api_class, method, tuple(sorted(kwargs.items())))
+    responses = g.setdefault("xero_responses", {})
+    if key not in responses:
+        api_method = getattr(get_api(api_class), method)
+        responses[key] = api_method(get_xero_tenant_id(), **kwargs)
+    return responses[key]
+
+def warm_up():
+    # build lazily computed state up front so a new worker's first requests aren't slow
+    for template_name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(template_name)
+    with app.test_request_context():
+        sidebar()
+    import_now(*app.config["XERO_PRELOAD_MODULES"])
+    build_model_plans()
+
+# runs once all routes are registered, before the worker accepts requests
+warm_up()
 
 if __name__ == "__main__":
     app.run(host='localhost', port=5000)
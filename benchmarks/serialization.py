@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Compare pretty and compact json serialization of large synthetic sdk models
+
+    python benchmarks/serialization.py [records] [repeat]
+"""
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from os.path import dirname, join
+
+sys.path.insert(0, join(dirname(__file__), ".."))
+
+from xero_python.accounting import (  # noqa: E402
+    Account,
+    BankTransaction,
+    BankTransactions,
+    Contact,
+    Invoice,
+    Invoices,
+    LineItem,
+)
+
+from xero_python.api_client.serializer import serialize  # noqa: E402
+
+from utils import jsonify, serialize_model  # noqa: E402
+
+
+def two_pass(model, style):
+    # serialize() copy of the model tree followed by json encoding of the copy
+    return jsonify(serialize(model), style)
+
+
+def line_items(count):
+    return [
+        LineItem(
+            line_item_id=str(uuid.uuid4()),
+            description="Consulting hours {}".format(number),
+            quantity=Decimal("1.5"),
+            unit_amount=Decimal("120.00"),
+            account_code="200",
+            tax_type="OUTPUT",
+            line_amount=Decimal("180.00"),
+        )
+        for number in range(count)
+    ]
+
+
+def invoices(count):
+    return Invoices(
+        invoices=[
+            Invoice(
+                invoice_id=str(uuid.uuid4()),
+                invoice_number="INV-{:06d}".format(number),
+                type="ACCREC",
+                contact=Contact(contact_id=str(uuid.uuid4()), name="Customer {}".format(number)),
+                date=date(2021, 1, 1),
+                due_date=date(2021, 2, 1),
+                updated_date_utc=datetime(2021, 1, 1, 12, 30, tzinfo=timezone.utc),
+                status="AUTHORISED",
+                line_items=line_items(5),
+                sub_total=Decimal("900.00"),
+                total_tax=Decimal("135.00"),
+                total=Decimal("1035.00"),
+            )
+            for number in range(count)
+        ]
+    )
+
+
+def bank_transactions(count):
+    return BankTransactions(
+        bank_transactions=[
+            BankTransaction(
+                bank_transaction_id=str(uuid.uuid4()),
+                type="SPEND",
+                bank_account=Account(account_id=str(uuid.uuid4()), code="090"),
+                contact=Contact(contact_id=str(uuid.uuid4()), name="Supplier {}".format(number)),
+                date=date(2021, 1, 1),
+                updated_date_utc=datetime(2021, 1, 1, 12, 30, tzinfo=timezone.utc),
+                status="AUTHORISED",
+                line_items=line_items(3),
+                total=Decimal("540.00"),
+            )
+            for number in range(count)
+        ]
+    )
+
+
+def main(records=2000, repeat=5):
+    models = (
+        ("invoices", invoices(records)),
+        ("bank transactions", bank_transactions(records)),
+    )
+    for name, model in models:
+        for style in ("pretty", "compact"):
+            for encoder in (two_pass, serialize_model):
+                size = len(encoder(model, style))
+                seconds = min(
+                    timeit.repeat(lambda: encoder(model, style), number=1, repeat=repeat)
+                )
+                print(
+                    "{:<18} {:>6} records {:<8} {:<16} {:8.1f} ms {:10d} bytes".format(
+                        name, records, style, encoder.__name__, seconds * 1000, size
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Time a cold "import app" in fresh interpreters with a per module breakdown
+
+    python benchmarks/startup.py [runs] [modules shown]
+"""
+import subprocess
+import sys
+from collections import defaultdict
+from os.path import dirname, join
+
+ROOT = join(dirname(__file__), "..")
+PRODUCT_MODULES = (
+    "xero_python.accounting",
+    "xero_python.assets",
+    "xero_python.project",
+    "xero_python.payrollau",
+    "xero_python.payrolluk",
+    "xero_python.payrollnz",
+    "xero_python.file",
+    "xero_python.finance",
+    "xero_python.identity",
+)
+
+
+def import_times():
+    """
+    Import app in a new interpreter with -X importtime
+    :return: dict module name -> cumulative us of app and the modules it imports,
+        and the names of the modules app imports directly
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    direct = []
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # nested imports are listed before their parent, indented two spaces a level
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if depth == 0:
+            if name == "app":
+                direct = children
+            children = []
+        elif depth == 1:
+            children.append(name)
+        times.setdefault(name, int(cumulative))
+    return times, direct
+
+
+def main(runs=5, shown=15):
+    best = defaultdict(lambda: float("inf"))
+    for _ in range(runs):
+        times, direct = import_times()
+        for name, cumulative in times.items():
+            best[name] = min(best[name], cumulative)
+
+    print("import app {:8.1f} ms (best of {} runs)".format(best["app"] / 1000, runs))
+    print()
+    print("modules imported by app")
+    for name in sorted(direct, key=lambda name: best[name], reverse=True)[:shown]:
+        print("  {:<40} {:8.1f} ms".format(name, best[name] / 1000))
+    print()
+    print("xero_python product packages")
+    for name in PRODUCT_MODULES:
+        if name in best:
+            print("  {:<40} {:8.1f} ms".format(name, best[name] / 1000))
+        else:
+            print("  {:<40} {:>8}".format(name, "lazy"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
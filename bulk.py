@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import deque, namedtuple
+from itertools import islice
+from uuid import uuid4
+
+from fanout import submit
+from lazy_imports import LazyName
+
+# accounting create call, its list model and record id attribute
+BulkEntity = namedtuple("BulkEntity", ["method", "list_model", "id_attribute"])
+
+BULK_ENTITIES = {
+    "contacts": BulkEntity(
+        "create_contacts", LazyName("xero_python.accounting", "Contacts"), "contact_id"
+    ),
+    "invoices": BulkEntity(
+        "create_invoices", LazyName("xero_python.accounting", "Invoices"), "invoice_id"
+    ),
+    "bank_transactions": BulkEntity(
+        "create_bank_transactions", LazyName("xero_python.accounting", "BankTransactions"),
+        "bank_transaction_id",
+    ),
+    "credit_notes": BulkEntity(
+        "create_credit_notes", LazyName("xero_python.accounting", "CreditNotes"), "credit_note_id"
+    ),
+    "items": BulkEntity("create_items", LazyName("xero_python.accounting", "Items"), "item_id"),
+}
+
+# outcome of one input record, errors is empty when it was created
+BulkResult = namedtuple("BulkResult", ["index", "record_id", "errors"])
+BulkReport = namedtuple(
+    "BulkReport", ["entity", "created", "failed", "chunks", "seconds", "results"]
+)
+
+
+def chunks_of(records, size):
+    # lists of up to size records, read lazily from any iterable
+    iterator = iter(records)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+class BulkWriter(object):
+    """
+    Creates any number of records through the batch create calls
+    * records are sent in chunks of chunk_size, at most parallel chunks in flight,
+      the api client's rate limiter keeps the calls within the tenant's budget
+    * summarize_errors=False makes xero report validation errors per record, a
+      chunk rejected as a whole marks each of its records with the error
+    * each chunk carries an idempotency key unique to the create() call, so a chunk
+      resent by the api client's retries isn't created twice, separate calls with
+      the same records still create them again
+    """
+
+    def __init__(self, chunk_size=50, parallel=5):
+        self.chunk_size = chunk_size
+        self.parallel = parallel
+        self.chunks = self.created = self.failed = 0
+        self._lock = threading.Lock()
+
+    def create(self, accounting_api, tenant_id, entity, records):
+        """
+        Create records of one entity
+        :param accounting_api: AccountingApi whose api client pool sends the chunks
+        :param str entity: key of BULK_ENTITIES, eg. "contacts"
+        :param records: iterable of sdk models, eg. Contact
+        :return: BulkReport, results in input order
+        """
+        spec = BULK_ENTITIES[entity]
+        method = getattr(accounting_api, spec.method)
+        run_id = uuid4().hex
+        started = time.perf_counter()
+
+        def send(chunk, number):
+            return method(
+                tenant_id,
+                spec.list_model(**{entity: chunk}),
+                summarize_errors=False,
+                idempotency_key="{}-{}".format(run_id, number),
+            )
+
+        results = []
+        pending = deque()
+        chunk_count = offset = 0
+        for chunk in chunks_of(records, self.chunk_size):
+            if len(pending) >= self.parallel:
+                results.extend(self._collect(spec, entity, *pending.popleft()))
+            pending.append(
+                (offset, chunk, submit(accounting_api.api_client, send, (chunk, chunk_count)))
+            )
+            chunk_count += 1
+            offset += len(chunk)
+        while pending:
+            results.extend(self._collect(spec, entity, *pending.popleft()))
+
+        failed = sum(1 for result in results if result.errors)
+        with self._lock:
+            self.chunks += chunk_count
+            self.created += len(results) - failed
+            self.failed += failed
+        return BulkReport(
+            entity, len(results) - failed, failed, chunk_count,
+            round(time.perf_counter() - started, 3), results,
+        )
+
+    def _collect(self, spec, entity, offset, chunk, pending):
+        try:
+            created = getattr(pending.get(), entity) or []
+        except Exception as exception:
+            error = getattr(exception, "reason", None) or str(exception)
+            return [BulkResult(offset + index, None, [error]) for index in range(len(chunk))]
+
+        results = []
+        for index, record in enumerate(created):
+            errors = [error.message for error in record.validation_errors or ()]
+            record_id = getattr(record, spec.id_attribute)
+            results.append(BulkResult(
+                offset + index, str(record_id) if record_id and not errors else None, errors
+            ))
+        return results
+
+    def stats(self):
+        return {"chunks": self.chunks, "created": self.created, "failed": self.failed}
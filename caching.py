@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+
+class TTLCache(object):
+    """
+    Thread safe in-memory mapping whose entries expire ttl seconds after being set
+    * hits and misses are counted so the saved round-trips can be inspected
+    """
+
+    def __init__(self, ttl, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._purge()
+            self._data[key] = (expires_at, value)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard(self, predicate):
+        # drop every entry whose key matches predicate
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "ttl": self.ttl,
+            }
+
+    def _purge(self):
+        now = time.monotonic()
+        for key in [key for key, entry in self._data.items() if entry[0] <= now]:
+            del self._data[key]
+        # still full of live entries - drop the ones closest to expiry
+        while len(self._data) >= self.maxsize:
+            del self._data[min(self._data, key=lambda key: self._data[key][0])]
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def negotiate(accept_encodings):
+    # preferred content coding the client accepts, None for identity
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return accept_encodings.best_match(offered)
+
+
+def compressor(encoding, level):
+    """
+    Incremental compressor for a content coding
+    :param str encoding: "br" or "gzip"
+    :param int level: brotli quality or gzip compression level
+    :return: (compress(data), flush(), finish()) functions returning bytes
+    """
+    if encoding == "br":
+        stream = brotli.Compressor(quality=level)
+        return stream.process, stream.flush, stream.finish
+    # wbits 31 writes the gzip header and trailer
+    stream = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return stream.compress, lambda: stream.flush(zlib.Z_SYNC_FLUSH), stream.flush
+
+
+def compress(data, encoding, level):
+    process, _, finish = compressor(encoding, level)
+    return process(data) + finish()
+
+
+def compress_stream(chunks, encoding, level):
+    # flush after every chunk so the client receives streamed pages as they are produced
+    process, flush, finish = compressor(encoding, level)
+    for chunk in chunks:
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+class Compression(object):
+    """
+    Compresses text responses negotiated on Accept-Encoding and tags complete
+    responses with a strong ETag of their body, repeat views get 304 Not Modified
+    """
+
+    def __init__(self, mimetypes, min_size=500, gzip_level=6, brotli_quality=4):
+        self.mimetypes = frozenset(mimetypes)
+        self.min_size = min_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+        self.compressed = self.not_modified = 0
+
+    def __call__(self, response):
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype not in self.mimetypes
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate(request.accept_encodings)
+        if response.is_streamed:
+            # the body isn't known up front, compress it as it is sent without an etag
+            if encoding:
+                response.response = compress_stream(
+                    response.iter_encoded(), encoding, self.levels[encoding]
+                )
+                response.content_encoding = encoding
+                response.headers.pop("Content-Length", None)
+                self.compressed += 1
+            return response
+
+        body = response.get_data()
+        if len(body) < self.min_size:
+            encoding = None
+        # each content coding is a different representation with its own etag
+        etag = hashlib.sha1(body).hexdigest()
+        response.set_etag("{}-{}".format(etag, encoding) if encoding else etag)
+        response.make_conditional(request)
+        if response.status_code == 304:
+            self.not_modified += 1
+            return response
+        if encoding:
+            response.set_data(compress(body, encoding, self.levels[encoding]))
+            response.content_encoding = encoding
+            self.compressed += 1
+        return response
+
+    def stats(self):
+        return {
+            "compressed": self.compressed,
+            "not_modified": self.not_modified,
+            "brotli": brotli is not None,
+        }
+
+
+def init_compression(app):
+    """
+    Register response compression and conditional GET from app.config
+    * COMPRESS_MIMETYPES, COMPRESS_MIN_SIZE, COMPRESS_GZIP_LEVEL, COMPRESS_BROTLI_QUALITY
+    """
+    compression = Compression(
+        app.config["COMPRESS_MIMETYPES"],
+        min_size=app.config["COMPRESS_MIN_SIZE"],
+        gzip_level=app.config["COMPRESS_GZIP_LEVEL"],
+        brotli_quality=app.config["COMPRESS_BROTLI_QUALITY"],
+    )
+    app.after_request(compression)
+    return compression
@@ -3,9 +3,62 @@ import os
 from os.path import dirname, join
 
 SECRET_KEY = os.urandom(16)
-# configure file based session
-SESSION_TYPE = "filesystem"
+# configure server side session: "sqlite" (worker processes of one host, like the
+# "filesystem" type it replaces), "redis" (any host), "memory" (opt in, a single
+# process only, sessions are lost on restart) or any Flask-Session type
+SESSION_TYPE = "sqlite"
+SESSION_MEMORY_MAXSIZE = 10000
+SESSION_SQLITE_PATH = join(dirname(__file__), "cache", "sessions.sqlite3")
+SESSION_REDIS_URL = "redis://localhost:6379/0"
 SESSION_FILE_DIR = join(dirname(__file__), "cache")
 
 # configure flask app for local development
 ENV = "development"
+# compiled templates shared by worker processes, None disables the cache
+TEMPLATE_BYTECODE_CACHE_DIR = join(dirname(__file__), "cache", "jinja")
+# xero_python product packages are imported on first use, list any to import
+# while a worker warms up instead, eg. ("xero_python.accounting", "xero_python.identity")
+XERO_PRELOAD_MODULES = ()
+
+# seconds before expiry an oauth2 token is refreshed in the background,
+# and how long a request may wait for a refresh it can't continue without
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_TIMEOUT = 30
+
+# seconds a resolved xero tenant id is reused before asking the identity api again
+TENANT_CACHE_TTL = 300
+# seconds the "first record" ids used by demo pages are reused per tenant
+SEED_CACHE_TTL = 300
+
+# xero-python sdk client worker threads and pooled connections per host
+API_POOL_THREADS = 8
+API_CONNECTION_POOL_MAXSIZE = 8
+# xero api limits per tenant, 429 responses are retried up to API_MAX_RETRIES times
+API_CALLS_PER_MINUTE = 60
+API_CONCURRENT_CALLS = 5
+API_MAX_RETRIES = 3
+# longest a request waits for the rate limits in seconds, longer waits fail with
+# RateLimitException, and how long a used up daily limit blocks the tenant
+API_MAX_WAIT = 60
+API_DAY_LIMIT_BLOCK = 3600
+# seconds each tenant's organisation request may take on the /tenants page
+TENANT_FETCH_TIMEOUT = 10
+
+# compression of pages negotiated on Accept-Encoding, brotli needs the brotli package
+COMPRESS_MIMETYPES = ("text/html", "application/json")
+COMPRESS_MIN_SIZE = 500
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 4
+
+# records per page of the /sync list calls, xero returns at most 1000
+SYNC_PAGE_SIZE = 1000
+# local sqlite mirror of the synced records, read_all and read_one pages of synced
+# entities are served from it with ?source=mirror
+MIRROR_DATABASE = join(dirname(__file__), "cache", "mirror.sqlite3")
+
+# records per batch create call and batch calls in flight at once for /bulk-create,
+# the rate limiter still applies to each call
+BULK_CHUNK_SIZE = 50
+BULK_PARALLEL_CHUNKS = 5
+# most sample contacts /bulk-create?count= will create
+BULK_DEMO_MAX_RECORDS = 1000
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+
+from flask import abort, request, url_for
+from werkzeug.routing import BaseConverter, ValidationError
+
+# sidebar menu of a product and its sections, icon is a font awesome class
+DemoMenu = namedtuple("DemoMenu", ["id", "label", "icon", "sections"])
+DemoSection = namedtuple("DemoSection", ["id", "label"])
+
+# a demo page, menu and section are the ids of the sidebar entry it is listed under
+# * stream: send the page's json while it is encoded
+# * mirror: mirror entity the page can be answered from with ?source=mirror
+# * raw: (api class, method, kwargs) of the call whose response the page shows
+#   unchanged, ?format=json forwards its body without building sdk models
+DemoPage = namedtuple(
+    "DemoPage",
+    ["name", "view", "title", "menu", "section", "label", "stream", "mirror", "raw"],
+)
+
+
+class PageNameConverter(BaseConverter):
+    # matches registered page names only, other paths fail at routing
+    registry = None
+
+    def to_python(self, value):
+        if value not in self.registry.pages:
+            raise ValidationError()
+        return value
+
+
+class DemoRegistry(object):
+    """
+    Registry of the api demo pages, served through a single "/<name>" url rule
+    instead of a url rule per page, werkzeug compiles every rule it is given
+    * @demos.page(title, menu=(menu, section, label)) registers a view under its
+      function name, names are unique
+    * the registry holds the page metadata, the sidebar and the json streaming,
+      mirror and raw json policies are built from it
+    * url_for(name) still builds the page url through a url build error handler
+    """
+
+    def __init__(self, endpoint="demo"):
+        self.endpoint = endpoint
+        self.pages = {}
+        self._menus = []
+        self._sections = {}
+
+    def add_menus(self, menus):
+        """
+        Declare the sidebar menus, before the pages listed under them
+        :param menus: (id, label, icon, ((section id, label), ...)) per menu, in menu order
+        """
+        for menu_id, label, icon, sections in menus:
+            menu = DemoMenu(menu_id, label, icon, [DemoSection(*section) for section in sections])
+            self._menus.append(menu)
+            for section in menu.sections:
+                self._sections[(menu_id, section.id)] = section
+
+    def page(self, title, menu, stream=False, mirror=None, raw=None):
+        """
+        Register a demo page view
+        :param str title: page title
+        :param menu: (menu id, section id, label) of the sidebar entry
+        """
+        def register(function):
+            name = function.__name__
+            if name in self.pages:
+                raise ValueError("demo page {} is registered twice".format(name))
+            menu_id, section_id, label = menu
+            if (menu_id, section_id) not in self._sections:
+                raise ValueError("demo page {} is in unknown section {}/{}".format(
+                    name, menu_id, section_id
+                ))
+            self.pages[name] = DemoPage(
+                name, function, title, menu_id, section_id, label, stream, mirror, raw
+            )
+            return function
+
+        return register
+
+    def init_app(self, app):
+        app.url_map.converters["demo_page"] = type(
+            "DemoPageNameConverter", (PageNameConverter,), {"registry": self}
+        )
+        app.add_url_rule("/<demo_page:name>", self.endpoint, self.dispatch)
+        app.url_build_error_handlers.append(self.build_url)
+
+    def dispatch(self, name):
+        page = self.pages.get(name)
+        if page is None:
+            abort(404)
+        return page.view()
+
+    def build_url(self, error, endpoint, values):
+        if endpoint not in self.pages:
+            return None
+        return url_for(self.endpoint, name=endpoint, **values)
+
+    def current(self):
+        # name of the demo page being served, or the endpoint of any other page
+        if request.endpoint == self.endpoint:
+            return request.view_args["name"]
+        return request.endpoint
+
+    def current_page(self):
+        # DemoPage being served, None for any other page
+        return self.pages.get(self.current())
+
+    def menus(self):
+        # [(DemoMenu, [(DemoSection, [DemoPage, ...]), ...]), ...] of the sidebar
+        listed = {}
+        for page in self.pages.values():
+            listed.setdefault((page.menu, page.section), []).append(page)
+        return [
+            (menu, [
+                (section, listed[(menu.id, section.id)])
+                for section in menu.sections if (menu.id, section.id) in listed
+            ])
+            for menu in self._menus
+        ]
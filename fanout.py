@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import time
+from collections import namedtuple
+
+from flask import copy_current_request_context, has_request_context
+
+Outcome = namedtuple("Outcome", ["value", "error"])
+
+
+def submit(api_client, function, args=(), kwargs=None):
+    """
+    Run an sdk call on the api client thread pool
+    :return: AsyncResult of the call
+    """
+    if has_request_context():
+        # workers need the request context to read the oauth2 token from session
+        function = copy_current_request_context(function)
+    return api_client.pool.apply_async(function, args, kwargs or {})
+
+
+def fan_out(api_client, calls, timeout=None):
+    """
+    Run independent sdk calls concurrently on the api client thread pool
+    :param api_client: ApiClient whose pool_threads workers run the calls
+    :param calls: iterable of (function, args, kwargs) tuples
+    :param timeout: seconds to wait for all calls, None waits forever
+    :return: list of Outcome(value, error) in the same order as calls
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = [submit(api_client, function, args, kwargs) for function, args, kwargs in calls]
+
+    outcomes = []
+    for result in pending:
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        try:
+            outcomes.append(Outcome(result.get(remaining), None))
+        except Exception as exception:
+            outcomes.append(Outcome(None, exception))
+    return outcomes
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import importlib
+
+
+class LazyName(object):
+    """
+    Stand-in for a class or enum of a module imported on first use, calling it
+    or reading its attributes imports the module and forwards to the real object,
+    its own attributes are underscored so they don't hide the real object's
+    """
+
+    __slots__ = ("_module_name", "_name", "_target")
+
+    def __init__(self, module_name, name):
+        self._module_name = module_name
+        self._name = name
+        self._target = None
+
+    def _resolve(self):
+        target = self._target
+        if target is None:
+            # the import lock makes concurrent first uses import the module once
+            module = importlib.import_module(self._module_name)
+            target = self._target = getattr(module, self._name)
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attribute):
+        return getattr(self._resolve(), attribute)
+
+    def __repr__(self):
+        return "<lazy {}.{}>".format(self._module_name, self._name)
+
+
+def lazy_import(module_name, *names):
+    """
+    Lazy equivalent of "from module_name import name, ..."
+    :param str module_name: module imported when any of the names is first used
+    :return: list of LazyName, one per name
+    """
+    return [LazyName(module_name, name) for name in names]
+
+
+def import_now(*module_names):
+    # import modules up front, eg. while warming up a worker
+    for module_name in module_names:
+        importlib.import_module(module_name)
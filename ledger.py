@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+import json
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from xero_python.api_client import ModelFinder
+from xero_python.api_client.deserializer import deserialize
+
+from sync import JOURNALS
+
+# marks entity recording when a tenant's ledger was filled from its stored journals
+LEDGER = "ledger"
+
+SCHEMA = (
+    # debits, credits and tax of each account per "YYYY-MM" period, in cents
+    "CREATE TABLE IF NOT EXISTS ledger_periods ("
+    "tenant_id TEXT NOT NULL, account_id TEXT NOT NULL, period TEXT NOT NULL, "
+    "debit INTEGER NOT NULL, credit INTEGER NOT NULL, tax INTEGER NOT NULL, "
+    "lines INTEGER NOT NULL, "
+    "PRIMARY KEY (tenant_id, account_id, period)) WITHOUT ROWID",
+    # running totals of each account across all periods
+    "CREATE TABLE IF NOT EXISTS ledger_accounts ("
+    "tenant_id TEXT NOT NULL, account_id TEXT NOT NULL, account_code TEXT, "
+    "account_name TEXT, account_type TEXT, "
+    "debit INTEGER NOT NULL, credit INTEGER NOT NULL, tax INTEGER NOT NULL, "
+    "lines INTEGER NOT NULL, "
+    "PRIMARY KEY (tenant_id, account_id)) WITHOUT ROWID",
+)
+
+
+def cents(amount):
+    if amount is None:
+        return 0
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int((amount * 100).to_integral_value())
+
+
+def money(value):
+    return Decimal(value).scaleb(-2)
+
+
+class GeneralLedger(object):
+    """
+    Per account and per month totals of the journal lines in a mirror.SQLiteRecordStore,
+    updated as journal batches are stored instead of recomputed, so balances and
+    trial balances are read from one row per account
+    * positive journal line net amounts are debits, negative ones credits
+    * a journal already in the store is not counted again
+    * journals stored before the ledger existed are added by backfill() on a tenant's
+      first use, its completion is kept in the store's marks
+    * rebuild() recomputes it from the stored journals at any time
+    """
+
+    def __init__(self, store):
+        self.store = store
+        store.add_listener(self)
+
+    def create(self, connection):
+        for statement in SCHEMA:
+            connection.execute(statement)
+
+    def backfill(self, tenant_id):
+        """
+        Add the tenant's journals stored before the ledger existed, once
+        :return: True when the ledger was filled by this call
+        """
+        if self.store.high_water_mark(tenant_id, LEDGER) is not None:
+            return False
+        with self.store.transaction() as connection:
+            # another worker may have filled it while this one waited for the write lock
+            if connection.execute(
+                "SELECT 1 FROM marks WHERE tenant_id = ? AND entity = ?", (tenant_id, LEDGER)
+            ).fetchone() is not None:
+                return False
+            self._rebuild(connection, tenant_id)
+        return True
+
+    def rebuild(self, tenant_id=None):
+        """
+        Recompute the ledger from the journals in the store
+        :param tenant_id: tenant to recompute, None for every tenant
+        """
+        with self.store.transaction() as connection:
+            self._rebuild(connection, tenant_id)
+
+    def _rebuild(self, connection, tenant_id=None):
+        tenant_ids = [tenant_id] if tenant_id else [row[0] for row in connection.execute(
+            "SELECT DISTINCT tenant_id FROM records WHERE entity = ?", (JOURNALS,)
+        )]
+        model_finder = None
+        for tenant_id in tenant_ids:
+            self.reset(connection, tenant_id)
+            connection.execute(
+                "INSERT OR REPLACE INTO marks (tenant_id, entity, high_water_mark) VALUES (?, ?, ?)",
+                (tenant_id, LEDGER, datetime.now(timezone.utc).isoformat()),
+            )
+            bodies = [row[0] for row in connection.execute(
+                "SELECT body FROM records WHERE tenant_id = ? AND entity = ?", (tenant_id, JOURNALS)
+            )]
+            if not bodies:
+                continue
+            if model_finder is None:
+                # models are only imported when there are journals to read, see lazy_imports
+                from xero_python.accounting import models
+
+                model_finder = ModelFinder(models)
+            journals = [
+                deserialize("Journal", json.loads(body, parse_float=Decimal), model_finder)
+                for body in bodies
+            ]
+            self._add(connection, tenant_id, journals)
+
+    def apply(self, connection, tenant_id, entity, records):
+        if entity != JOURNALS or not records:
+            return
+        ids = [str(journal.journal_id) for journal in records]
+        stored = set(row[0] for row in connection.execute(
+            "SELECT record_id FROM records WHERE tenant_id = ? AND entity = ? "
+            "AND record_id IN ({})".format(", ".join("?" * len(ids))),
+            [tenant_id, entity] + ids,
+        ))
+        self._add(
+            connection, tenant_id,
+            [journal for journal in records if str(journal.journal_id) not in stored],
+        )
+
+    def _add(self, connection, tenant_id, journals):
+        periods = defaultdict(lambda: [0, 0, 0, 0])
+        accounts = {}
+        for journal in journals:
+            period = journal.journal_date.strftime("%Y-%m") if journal.journal_date else ""
+            for line in journal.journal_lines or ():
+                account_id = str(line.account_id)
+                net = cents(line.net_amount)
+                totals = periods[(account_id, period)]
+                totals[0 if net > 0 else 1] += abs(net)
+                totals[2] += cents(line.tax_amount)
+                totals[3] += 1
+                account_type = getattr(line.account_type, "value", line.account_type)
+                accounts[account_id] = (line.account_code, line.account_name, account_type)
+
+        connection.executemany(
+            "INSERT INTO ledger_periods VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (tenant_id, account_id, period) DO UPDATE SET "
+            "debit = debit + excluded.debit, credit = credit + excluded.credit, "
+            "tax = tax + excluded.tax, lines = lines + excluded.lines",
+            [(tenant_id, account_id, period) + tuple(totals)
+             for (account_id, period), totals in periods.items()],
+        )
+        account_totals = defaultdict(lambda: [0, 0, 0, 0])
+        for (account_id, _), totals in periods.items():
+            account_totals[account_id] = [a + b for a, b in zip(account_totals[account_id], totals)]
+        connection.executemany(
+            "INSERT INTO ledger_accounts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (tenant_id, account_id) DO UPDATE SET "
+            "account_code = excluded.account_code, account_name = excluded.account_name, "
+            "account_type = excluded.account_type, "
+            "debit = debit + excluded.debit, credit = credit + excluded.credit, "
+            "tax = tax + excluded.tax, lines = lines + excluded.lines",
+            [(tenant_id, account_id) + accounts[account_id] + tuple(totals)
+             for account_id, totals in account_totals.items()],
+        )
+
+    def reset(self, connection, tenant_id):
+        for table in ("ledger_periods", "ledger_accounts"):
+            connection.execute("DELETE FROM {} WHERE tenant_id = ?".format(table), (tenant_id,))
+
+    def trial_balance(self, tenant_id, period=None):
+        """
+        Debit and credit balance of every account
+        :param str period: "YYYY-MM" to include journals up to the end of, None for all
+        :return: dict of accounts, sorted by code, and the debit and credit totals
+        """
+        if period is None:
+            rows = self.store.query(
+                "SELECT account_id, account_code, account_name, account_type, debit, credit "
+                "FROM ledger_accounts WHERE tenant_id = ?",
+                (tenant_id,),
+            )
+        else:
+            rows = self.store.query(
+                "SELECT a.account_id, a.account_code, a.account_name, a.account_type, "
+                "SUM(p.debit), SUM(p.credit) FROM ledger_periods p JOIN ledger_accounts a "
+                "ON a.tenant_id = p.tenant_id AND a.account_id = p.account_id "
+                "WHERE p.tenant_id = ? AND p.period <= ? GROUP BY a.account_id",
+                (tenant_id, period),
+            )
+
+        accounts = []
+        debit = credit = 0
+        for account_id, code, name, account_type, debits, credits in rows:
+            balance = debits - credits
+            debit += max(balance, 0)
+            credit += max(-balance, 0)
+            accounts.append({
+                "account_id": account_id,
+                "account_code": code,
+                "account_name": name,
+                "account_type": account_type,
+                "debit": money(max(balance, 0)),
+                "credit": money(max(-balance, 0)),
+            })
+        accounts.sort(key=lambda account: account["account_code"] or "")
+        return {"accounts": accounts, "debit": money(debit), "credit": money(credit)}
+
+    def balance(self, tenant_id, account_code, period=None):
+        # debits less credits of one account, up to the end of period when given
+        for account in self.trial_balance(tenant_id, period)["accounts"]:
+            if account["account_code"] == account_code:
+                return account["debit"] - account["credit"]
+        return money(0)
+
+    def movements(self, tenant_id, account_code=None, start=None, end=None):
+        """
+        Debits, credits and net movement per account and period
+        :param str start: first "YYYY-MM" period included, None for the earliest
+        :param str end: last "YYYY-MM" period included, None for the latest
+        :return: list of dict, by account code then period
+        """
+        sql = (
+            "SELECT a.account_code, a.account_name, p.period, p.debit, p.credit, p.tax, p.lines "
+            "FROM ledger_periods p JOIN ledger_accounts a "
+            "ON a.tenant_id = p.tenant_id AND a.account_id = p.account_id WHERE p.tenant_id = ?"
+        )
+        parameters = [tenant_id]
+        for condition, value in (
+            (" AND a.account_code = ?", account_code),
+            (" AND p.period >= ?", start),
+            (" AND p.period <= ?", end),
+        ):
+            if value is not None:
+                sql += condition
+                parameters.append(value)
+        return [
+            {
+                "account_code": code,
+                "account_name": name,
+                "period": period,
+                "debit": money(debit),
+                "credit": money(credit),
+                "net": money(debit - credit),
+                "tax": money(tax),
+                "lines": lines,
+            }
+            for code, name, period, debit, credit, tax, lines in self.store.query(
+                sql + " ORDER BY a.account_code, p.period", parameters
+            )
+        ]
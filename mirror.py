@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from xero_python.api_client import serialize
+
+from sync import JOURNALS
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS records ("
+    "tenant_id TEXT NOT NULL, entity TEXT NOT NULL, record_id TEXT NOT NULL, "
+    "updated_date_utc TEXT, body TEXT NOT NULL, "
+    "PRIMARY KEY (tenant_id, entity, record_id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS line_items ("
+    "tenant_id TEXT NOT NULL, entity TEXT NOT NULL, record_id TEXT NOT NULL, "
+    "position INTEGER NOT NULL, line_item_id TEXT, account_code TEXT, item_code TEXT, "
+    "description TEXT, quantity REAL, unit_amount REAL, line_amount REAL, "
+    "PRIMARY KEY (tenant_id, entity, record_id, position)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS marks ("
+    "tenant_id TEXT NOT NULL, entity TEXT NOT NULL, high_water_mark TEXT, "
+    "PRIMARY KEY (tenant_id, entity)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS cursors ("
+    "tenant_id TEXT NOT NULL, entity TEXT NOT NULL, cursor INTEGER NOT NULL, "
+    "PRIMARY KEY (tenant_id, entity)) WITHOUT ROWID",
+)
+
+
+# order of the records the list call returns, journals by number, the other
+# entities by modified date as the sync pulls them
+RECORD_ORDER = {
+    JOURNALS: "CAST(json_extract(body, '$.JournalNumber') AS INTEGER)",
+}
+DEFAULT_RECORD_ORDER = "updated_date_utc, record_id"
+
+
+def number(value):
+    # sdk amounts are Decimal, sqlite stores them as REAL
+    return None if value is None else float(value)
+
+
+class SQLiteRecordStore(object):
+    """
+    Mirror of synced accounting records in a local sqlite database (WAL mode),
+    a drop in replacement of sync.MemoryRecordStore shared by the worker processes
+    of one host
+    * records are kept as their xero json, upserted by id
+    * line items of invoices, credit notes and bank transactions get a row each
+    * appended entities such as journals keep the position to resume from instead
+      of a high-water mark
+    * listeners update views derived from the records, eg. ledger.GeneralLedger,
+      in the transaction that writes them
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.listeners = []
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        connection = self._connection()
+        for statement in SCHEMA:
+            connection.execute(statement)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def add_listener(self, listener):
+        """
+        Keep a derived view up to date, the listener has
+        * create(connection) to create its tables
+        * apply(connection, tenant_id, entity, records), called before the records are stored
+        * reset(connection, tenant_id)
+        """
+        with self.transaction() as connection:
+            listener.create(connection)
+        self.listeners.append(listener)
+
+    @contextmanager
+    def transaction(self):
+        # write transaction of this thread's connection, it waits for other writers
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def query(self, sql, parameters=()):
+        return self._connection().execute(sql, parameters).fetchall()
+
+    def high_water_mark(self, tenant_id, entity):
+        row = self._connection().execute(
+            "SELECT high_water_mark FROM marks WHERE tenant_id = ? AND entity = ?",
+            (tenant_id, entity),
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def cursor(self, tenant_id, entity):
+        row = self._connection().execute(
+            "SELECT cursor FROM cursors WHERE tenant_id = ? AND entity = ?", (tenant_id, entity)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def merge(self, tenant_id, entity, records, id_attribute, high_water_mark):
+        """
+        Upsert records by id and move the entity's high-water mark, in one transaction
+        :param records: sdk models, eg. Invoice
+        :param str id_attribute: model attribute holding the record id, eg. "invoice_id"
+        """
+        self._write(
+            tenant_id, entity, records, id_attribute,
+            "INSERT OR REPLACE INTO marks (tenant_id, entity, high_water_mark) VALUES (?, ?, ?)",
+            high_water_mark.isoformat() if high_water_mark else None,
+        )
+
+    def append(self, tenant_id, entity, records, id_attribute, cursor):
+        # upsert a batch of records and the position to resume from, in one transaction
+        self._write(
+            tenant_id, entity, records, id_attribute,
+            "INSERT OR REPLACE INTO cursors (tenant_id, entity, cursor) VALUES (?, ?, ?)",
+            cursor,
+        )
+
+    def _write(self, tenant_id, entity, records, id_attribute, checkpoint_sql, checkpoint):
+        rows = []
+        line_items = []
+        for record in records:
+            record_id = str(getattr(record, id_attribute))
+            updated = getattr(record, "updated_date_utc", None)
+            rows.append((
+                tenant_id, entity, record_id,
+                updated.isoformat() if updated else None,
+                json.dumps(serialize(record), separators=(",", ":")),
+            ))
+            for position, line_item in enumerate(getattr(record, "line_items", None) or ()):
+                line_items.append((
+                    tenant_id, entity, record_id, position,
+                    line_item.line_item_id and str(line_item.line_item_id),
+                    line_item.account_code, line_item.item_code, line_item.description,
+                    number(line_item.quantity), number(line_item.unit_amount),
+                    number(line_item.line_amount),
+                ))
+
+        with self.transaction() as connection:
+            for listener in self.listeners:
+                listener.apply(connection, tenant_id, entity, records)
+            connection.executemany(
+                "INSERT INTO records (tenant_id, entity, record_id, updated_date_utc, body) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (tenant_id, entity, record_id) "
+                "DO UPDATE SET updated_date_utc = excluded.updated_date_utc, body = excluded.body",
+                rows,
+            )
+            # a changed record brings all of its line items, drop the old ones
+            connection.executemany(
+                "DELETE FROM line_items WHERE tenant_id = ? AND entity = ? AND record_id = ?",
+                [row[:3] for row in rows],
+            )
+            connection.executemany(
+                "INSERT INTO line_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", line_items
+            )
+            connection.execute(checkpoint_sql, (tenant_id, entity, checkpoint))
+
+    def bodies(self, tenant_id, entity):
+        # xero json of every record, as stored, in the order the api lists them
+        return [row[0] for row in self._connection().execute(
+            "SELECT body FROM records WHERE tenant_id = ? AND entity = ? ORDER BY {}".format(
+                RECORD_ORDER.get(entity, DEFAULT_RECORD_ORDER)
+            ),
+            (tenant_id, entity),
+        )]
+
+    def body(self, tenant_id, entity, record_id=None):
+        # xero json of one record, any record of the entity when record_id is None
+        if record_id is None:
+            row = self._connection().execute(
+                "SELECT body FROM records WHERE tenant_id = ? AND entity = ? LIMIT 1",
+                (tenant_id, entity),
+            ).fetchone()
+        else:
+            row = self._connection().execute(
+                "SELECT body FROM records WHERE tenant_id = ? AND entity = ? AND record_id = ?",
+                (tenant_id, entity, record_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def records(self, tenant_id, entity):
+        return [json.loads(body) for body in self.bodies(tenant_id, entity)]
+
+    def count(self, tenant_id, entity):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM records WHERE tenant_id = ? AND entity = ?", (tenant_id, entity)
+        ).fetchone()[0]
+
+    def line_items(self, tenant_id, entity):
+        # (record id, position, line item id, account code, item code, description,
+        # quantity, unit amount, line amount) rows of the entity's records
+        return self._connection().execute(
+            "SELECT record_id, position, line_item_id, account_code, item_code, description, "
+            "quantity, unit_amount, line_amount FROM line_items WHERE tenant_id = ? AND entity = ?",
+            (tenant_id, entity),
+        ).fetchall()
+
+    def reset(self, tenant_id):
+        # forget a tenant's records, checkpoints and derived views, in one transaction
+        with self.transaction() as connection:
+            for table in ("records", "line_items", "marks", "cursors"):
+                connection.execute("DELETE FROM {} WHERE tenant_id = ?".format(table), (tenant_id,))
+            for listener in self.listeners:
+                listener.reset(connection, tenant_id)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from fanout import submit
+
+# records per page xero returns when page_size isn't given
+DEFAULT_PAGE_SIZE = 100
+
+
+def items_of(response):
+    # the record list of a page response, eg. invoices of Invoices
+    for attribute in response.openapi_types:
+        if attribute not in ("pagination", "warnings"):
+            return getattr(response, attribute) or []
+    return []
+
+
+def iter_pages(api_client, method, *args, page_size=None, prefetch=True, **kwargs):
+    """
+    Lazily fetch every page of a paged sdk list call such as get_invoices,
+    the next page is requested on the api client pool while the caller
+    consumes the current one
+    :param api_client: ApiClient whose pool runs the prefetches
+    :param method: bound sdk method accepting page (and page_size when given)
+    :param page_size: records per page, None for the api default
+    :param prefetch: False fetches each page only when it is reached
+    :return: generator of page responses, ends after the last page
+    """
+    size = page_size or DEFAULT_PAGE_SIZE
+    if page_size:
+        kwargs["page_size"] = page_size
+
+    def fetch(page):
+        return method(*args, page=page, **kwargs)
+
+    page = 1
+    response = fetch(page)
+    while True:
+        pagination = getattr(response, "pagination", None)
+        if getattr(pagination, "page_count", None) is not None:
+            more = page < pagination.page_count
+        else:
+            # endpoints without pagination end with a short page
+            more = len(items_of(response)) >= size
+        pending = submit(api_client, fetch, (page + 1,)) if more and prefetch else None
+        yield response
+        if not more:
+            return
+        page += 1
+        response = pending.get() if pending is not None else fetch(page)
+
+
+def iter_items(api_client, method, *args, **kwargs):
+    """
+    Records of every page of a paged sdk list call, see iter_pages
+    :return: generator of records, eg. Invoice for get_invoices
+    """
+    for response in iter_pages(api_client, method, *args, **kwargs):
+        for item in items_of(response):
+            yield item
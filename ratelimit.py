@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from xero_python.api_client import ApiClient
+from xero_python.exceptions import HTTPStatusException, RateLimitException
+
+logger = logging.getLogger(__name__)
+
+# http methods of the sdk calls that create, change or delete records
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+def header_number(headers, name):
+    try:
+        return float(headers.get(name))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class TenantBucket(object):
+    """
+    Token bucket with a concurrent call limit for a single tenant
+    """
+
+    def __init__(self, per_minute, concurrent):
+        self.capacity = per_minute
+        self.tokens = float(per_minute)
+        self.refill_rate = per_minute / 60.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.day_remaining = None
+        self.slots = threading.BoundedSemaphore(concurrent)
+
+    def refill(self, now):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, now):
+        # seconds until a call may be made, 0 means a token was taken
+        self.refill(now)
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.refill_rate
+
+
+class TenantRateLimiter(object):
+    """
+    Throttles xero api calls per tenant to stay within the published limits
+    * per_minute calls per rolling minute (token bucket)
+    * concurrent calls in flight at once
+    * X-MinLimit-Remaining / X-DayLimit-Remaining / Retry-After response headers
+      keep the local buckets in step with the server
+    * a used up daily limit blocks the tenant for day_block seconds
+    * callers wait at most max_wait seconds, a longer block raises RateLimitException
+    """
+
+    def __init__(self, per_minute=60, concurrent=5, jitter=1.0, max_wait=60, day_block=3600):
+        self.per_minute = per_minute
+        self.concurrent = concurrent
+        self.jitter = jitter
+        self.max_wait = max_wait
+        self.day_block = day_block
+        self.waits = self.throttled = 0
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def bucket(self, tenant_id):
+        with self._lock:
+            bucket = self._buckets.get(tenant_id)
+            if bucket is None:
+                bucket = self._buckets[tenant_id] = TenantBucket(
+                    self.per_minute, self.concurrent
+                )
+            return bucket
+
+    @contextmanager
+    def slot(self, tenant_id):
+        bucket = self.bucket(tenant_id)
+        while True:
+            with self._lock:
+                delay = bucket.wait_time(time.monotonic())
+                if delay:
+                    self.waits += 1
+            if not delay:
+                break
+            if delay > self.max_wait:
+                logger.warning("tenant %s rate limited for another %.0fs", tenant_id, delay)
+                raise RateLimitException(
+                    status=429, reason="Rate limited for another {:.0f}s".format(delay)
+                )
+            time.sleep(delay)
+        with bucket.slots:
+            yield
+
+    def observe(self, tenant_id, headers):
+        bucket = self.bucket(tenant_id)
+        minute_remaining = header_number(headers, "X-MinLimit-Remaining")
+        day_remaining = header_number(headers, "X-DayLimit-Remaining")
+        with self._lock:
+            bucket.refill(time.monotonic())
+            if minute_remaining is not None:
+                bucket.tokens = min(bucket.tokens, minute_remaining)
+            if day_remaining is not None:
+                bucket.day_remaining = day_remaining
+                if day_remaining <= 0:
+                    # refill() would hand out tokens again within a second
+                    bucket.blocked_until = max(
+                        bucket.blocked_until, time.monotonic() + self.day_block
+                    )
+
+    def reject(self, tenant_id, headers, attempt):
+        """
+        Record a 429 response and block the tenant until it may retry
+        :return: seconds the caller should sleep before retrying
+        """
+        retry_after = header_number(headers, "Retry-After")
+        if retry_after is None:
+            retry_after = 2 ** attempt
+        delay = retry_after + random.uniform(0, self.jitter)
+        bucket = self.bucket(tenant_id)
+        with self._lock:
+            self.throttled += 1
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        logger.warning(
+            "tenant %s rate limited (%s), blocked for %.1fs",
+            tenant_id,
+            headers.get("X-Rate-Limit-Problem") if headers else None,
+            delay,
+        )
+        return delay
+
+    def stats(self, tenant_id=None):
+        # totals of all tenants, the bucket state only of tenant_id when given
+        with self._lock:
+            stats = {"waits": self.waits, "throttled": self.throttled, "tenants": len(self._buckets)}
+            bucket = self._buckets.get(tenant_id)
+            if bucket is not None:
+                stats["tenant"] = {
+                    "tokens": round(bucket.tokens, 2),
+                    "day_remaining": bucket.day_remaining,
+                }
+            return stats
+
+
+class RateLimitedApiClient(ApiClient):
+    """
+    ApiClient passing every tenant scoped request through a TenantRateLimiter
+    and retrying requests rejected with 429 Too Many Requests
+    * on_write(tenant_id) is called after each successful POST/PUT/PATCH/DELETE
+    """
+
+    def __init__(self, configuration=None, rate_limiter=None, max_retries=3, on_write=None,
+                 **kwargs):
+        super(RateLimitedApiClient, self).__init__(configuration, **kwargs)
+        self.rate_limiter = rate_limiter or TenantRateLimiter()
+        self.max_retries = max_retries
+        self.on_write = on_write
+
+    def request(self, method, url, query_params=None, headers=None, **kwargs):
+        tenant_id = (headers or {}).get("xero-tenant-id")
+        if not tenant_id:
+            return super(RateLimitedApiClient, self).request(
+                method, url, query_params=query_params, headers=headers, **kwargs
+            )
+
+        attempt = 0
+        while True:
+            with self.rate_limiter.slot(tenant_id):
+                try:
+                    response = super(RateLimitedApiClient, self).request(
+                        method, url, query_params=query_params, headers=headers, **kwargs
+                    )
+                except HTTPStatusException as error:
+                    if error.status != 429 or attempt >= self.max_retries:
+                        raise
+                    delay = self.rate_limiter.reject(tenant_id, error.headers, attempt)
+                    # a daily limit's Retry-After can be hours, don't hold the request
+                    if delay > self.rate_limiter.max_wait:
+                        raise
+                else:
+                    # raw urllib3 response when called with _preload_content=False
+                    raw_response = getattr(response, "urllib3_response", response)
+                    self.rate_limiter.observe(tenant_id, raw_response.headers)
+                    if self.on_write is not None and method in WRITE_METHODS:
+                        self.on_write(tenant_id)
+                    return response
+            attempt += 1
+            time.sleep(delay)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from uuid import uuid4
+
+from flask.sessions import SessionInterface
+from flask_session import Session
+from flask_session.sessions import ServerSideSession
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class MemoryStore(object):
+    """
+    Least recently used sessions kept in process memory, for single process use
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def get(self, sid):
+        with self._lock:
+            entry = self._data.get(sid)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._data[sid]
+                return None
+            self._data.move_to_end(sid)
+            return entry[1]
+
+    def set(self, sid, data, ttl):
+        with self._lock:
+            self._data[sid] = (time.time() + ttl, data)
+            self._data.move_to_end(sid)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._data.pop(sid, None)
+
+
+class SqliteStore(object):
+    """
+    Sessions in a local sqlite database, shared by the worker processes of one host,
+    expired rows are purged every purge_interval seconds when a session is saved
+    """
+
+    def __init__(self, path, purge_interval=300):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._purged_at = 0.0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(sid TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, sid):
+        row = self._connection().execute(
+            "SELECT data FROM sessions WHERE sid = ? AND expires_at > ?",
+            (sid, time.time()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, sid, data, ttl):
+        now = time.time()
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO sessions (sid, data, expires_at) VALUES (?, ?, ?)",
+            (sid, data, now + ttl),
+        )
+        if now - self._purged_at >= self.purge_interval:
+            self._purged_at = now
+            connection.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def delete(self, sid):
+        self._connection().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+
+class RedisStore(object):
+    """
+    Sessions in redis, shared by worker processes on any host
+    """
+
+    def __init__(self, client, prefix="session:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, sid):
+        return self.client.get(self.prefix + sid)
+
+    def set(self, sid, data, ttl):
+        self.client.setex(self.prefix + sid, max(int(ttl), 1), data)
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+
+class StoreSession(ServerSideSession):
+    def __init__(self, initial=None, sid=None, permanent=None, new=False, snapshot=None):
+        super(StoreSession, self).__init__(initial, sid, permanent)
+        self.new = new
+        # serialized contents as last loaded or saved, used to skip unchanged writes
+        self.snapshot = snapshot
+
+
+class StoreSessionInterface(SessionInterface):
+    """
+    Server side sessions kept in a MemoryStore, SqliteStore or RedisStore,
+    the browser cookie only carries the session id
+    """
+
+    serializer = pickle
+
+    def __init__(self, store, permanent=True):
+        self.store = store
+        self.permanent = permanent
+        self.writes = self.skipped_writes = 0
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.get(sid)
+            if data is not None:
+                return StoreSession(
+                    self.serializer.loads(data), sid, self.permanent, snapshot=data
+                )
+        return StoreSession(sid=uuid4().hex, permanent=self.permanent, new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        # compare contents rather than trusting the modified flag, this skips
+        # writes of unchanged values and catches changes to nested values
+        data = self.serializer.dumps(dict(session))
+        if data != session.snapshot:
+            self.store.set(
+                session.sid, data, app.permanent_session_lifetime.total_seconds()
+            )
+            session.snapshot = data
+            self.writes += 1
+        else:
+            self.skipped_writes += 1
+        if session.new or self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+    def stats(self):
+        return {"writes": self.writes, "skipped_writes": self.skipped_writes}
+
+
+def init_session(app):
+    """
+    Configure server side sessions from app.config["SESSION_TYPE"]
+    * memory, sqlite and redis are served by StoreSessionInterface
+    * any other type (eg. filesystem) is passed on to Flask-Session
+    """
+    session_type = app.config["SESSION_TYPE"]
+    if session_type == "memory":
+        store = MemoryStore(app.config["SESSION_MEMORY_MAXSIZE"])
+    elif session_type == "sqlite":
+        store = SqliteStore(app.config["SESSION_SQLITE_PATH"])
+    elif session_type == "redis":
+        client = app.config.get("SESSION_REDIS")
+        if client is None:
+            if redis is None:
+                raise RuntimeError("SESSION_TYPE redis requires the redis package")
+            client = redis.Redis.from_url(app.config["SESSION_REDIS_URL"])
+        store = RedisStore(client, app.config.get("SESSION_KEY_PREFIX", "session:"))
+    else:
+        return Session(app)
+
+    app.session_interface = StoreSessionInterface(
+        store, permanent=app.config.get("SESSION_PERMANENT", True)
+    )
+    return app.session_interface
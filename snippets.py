@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+MARKER_RE = re.compile(r"#\[(/?)([A-Z0-9_]+):([A-Z0-9_]+)\]")
+USAGE_RE = re.compile(r'get_code_snippet\(\s*"([A-Z0-9_]+)"\s*,\s*"([A-Z0-9_]+)"\s*\)')
+
+
+def parse_snippets(source):
+    """
+    Collect every #[SET:ACTION] ... #[/SET:ACTION] block of source
+    :param str source: python source code containing snippet markers
+    :return: tuple of ({(set, action): snippet}, [problem descriptions])
+    """
+    snippets = {}
+    problems = []
+    open_blocks = {}
+
+    def line_of(position):
+        return source.count("\n", 0, position) + 1
+
+    for match in MARKER_RE.finditer(source):
+        closing, key = match.group(1), (match.group(2), match.group(3))
+        if not closing:
+            if key in open_blocks:
+                problems.append(
+                    "line {}: marker [{}:{}] opened again before being closed".format(
+                        line_of(open_blocks[key]), *key
+                    )
+                )
+            open_blocks[key] = match.end()
+            continue
+
+        start = open_blocks.pop(key, None)
+        if start is None:
+            problems.append(
+                "line {}: closing marker [/{}:{}] without opening marker".format(
+                    line_of(match.start()), *key
+                )
+            )
+        else:
+            # first complete block wins, later ones are commented out copies
+            snippets.setdefault(key, source[start:match.start()])
+
+    for key, start in open_blocks.items():
+        problems.append(
+            "line {}: marker [{}:{}] is never closed".format(line_of(start), *key)
+        )
+
+    for key in USAGE_RE.findall(source):
+        if key not in snippets:
+            problems.append("snippet [{}:{}] is used but not defined".format(*key))
+
+    return snippets, problems
+
+
+class SnippetIndex(object):
+    """
+    Code snippets of a source file parsed once and kept in memory
+    * auto_reload=True re-parses the file whenever its mtime changes (development)
+    * auto_reload=False freezes the index after the first build (production)
+    """
+
+    def __init__(self, path, auto_reload=False):
+        self.path = path
+        self.auto_reload = auto_reload
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._snippets = None
+
+    def get(self, endpoint, action):
+        snippet = self._current().get((endpoint, action))
+        if snippet is None:
+            logger.warning("code snippet [%s:%s] not found", endpoint, action)
+            return ""
+        return snippet
+
+    def build(self):
+        """
+        (Re)parse the source file and report missing or unbalanced markers
+        :return: list of problem descriptions
+        """
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            with open(self.path, encoding="utf-8") as source_file:
+                snippets, problems = parse_snippets(source_file.read())
+            for problem in problems:
+                logger.warning("%s %s", self.path, problem)
+            self._snippets = snippets
+            self._mtime = mtime
+        return problems
+
+    def _current(self):
+        if self._snippets is None:
+            self.build()
+        elif self.auto_reload and os.stat(self.path).st_mtime_ns != self._mtime:
+            self.build()
+        return self._snippets
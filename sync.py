@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import namedtuple
+
+from fanout import submit
+from paging import items_of, iter_items
+
+# accounting list call, record id attribute, whether the call is paged and any
+# other arguments it is called with
+SyncEntity = namedtuple("SyncEntity", ["method", "id_attribute", "paged", "params"], defaults=(None,))
+
+# archived records are left out of list calls unless asked for, a record archived
+# after its first sync would otherwise stay active in the store
+INCLUDE_ARCHIVED = {"include_archived": True}
+
+SYNC_ENTITIES = {
+    "accounts": SyncEntity("get_accounts", "account_id", False),
+    "invoices": SyncEntity("get_invoices", "invoice_id", True, INCLUDE_ARCHIVED),
+    "contacts": SyncEntity("get_contacts", "contact_id", True, INCLUDE_ARCHIVED),
+    "bank_transactions": SyncEntity("get_bank_transactions", "bank_transaction_id", True),
+    "payments": SyncEntity("get_payments", "payment_id", True),
+    "credit_notes": SyncEntity("get_credit_notes", "credit_note_id", True),
+    "items": SyncEntity("get_items", "item_id", False),
+}
+
+# the append-only journal ledger, pulled by journal number instead of modified date
+JOURNALS = "journals"
+# journals get_journals returns per call
+JOURNAL_BATCH_SIZE = 100
+
+SyncResult = namedtuple("SyncResult", ["entity", "full", "fetched", "total", "high_water_mark"])
+
+
+class MemoryRecordStore(object):
+    """
+    Synced records by id and the high-water mark of each tenant's entities,
+    kept in process memory
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+        self._marks = {}
+        self._cursors = {}
+
+    def high_water_mark(self, tenant_id, entity):
+        return self._marks.get((tenant_id, entity))
+
+    def merge(self, tenant_id, entity, records, id_attribute, high_water_mark):
+        with self._lock:
+            stored = self._records.setdefault((tenant_id, entity), {})
+            for record in records:
+                stored[getattr(record, id_attribute)] = record
+            self._marks[(tenant_id, entity)] = high_water_mark
+
+    def cursor(self, tenant_id, entity):
+        return self._cursors.get((tenant_id, entity), 0)
+
+    def append(self, tenant_id, entity, records, id_attribute, cursor):
+        with self._lock:
+            stored = self._records.setdefault((tenant_id, entity), {})
+            for record in records:
+                stored[getattr(record, id_attribute)] = record
+            self._cursors[(tenant_id, entity)] = cursor
+
+    def records(self, tenant_id, entity):
+        with self._lock:
+            return list(self._records.get((tenant_id, entity), {}).values())
+
+    def count(self, tenant_id, entity):
+        return len(self._records.get((tenant_id, entity), ()))
+
+    def reset(self, tenant_id):
+        with self._lock:
+            for key in [key for key in self._records if key[0] == tenant_id]:
+                self._records.pop(key, None)
+                self._marks.pop(key, None)
+                self._cursors.pop(key, None)
+
+
+class IncrementalSync(object):
+    """
+    Keeps a local copy of accounting entities up to date per tenant
+    * the first sync of an entity reads every page
+    * later syncs send the newest UpdatedDateUTC seen as If-Modified-Since and
+      merge only the records created or changed since into the store
+    * journals are pulled by offset from the last journal number stored, the next
+      batch is requested while the current one is written
+    """
+
+    def __init__(self, store=None, page_size=None, prefetch=True):
+        self.store = store or MemoryRecordStore()
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.full_syncs = self.delta_syncs = self.fetched = 0
+        self.journal_batches = 0
+        self._lock = threading.Lock()
+        self._entity_locks = {}
+
+    def entity_lock(self, tenant_id, entity):
+        with self._lock:
+            return self._entity_locks.setdefault((tenant_id, entity), threading.Lock())
+
+    def sync(self, accounting_api, tenant_id, entity):
+        """
+        Bring one entity of a tenant up to date
+        :param accounting_api: AccountingApi used for the list calls
+        :param str entity: key of SYNC_ENTITIES, eg. "invoices", or JOURNALS
+        :return: SyncResult
+        """
+        if entity == JOURNALS:
+            return self.sync_journals(accounting_api, tenant_id)
+        spec = SYNC_ENTITIES[entity]
+        method = getattr(accounting_api, spec.method)
+        # one sync per tenant and entity at a time, a caller that waited only fetches the delta
+        with self.entity_lock(tenant_id, entity):
+            mark = self.store.high_water_mark(tenant_id, entity)
+            kwargs = dict(spec.params or {})
+            if mark is not None:
+                kwargs["if_modified_since"] = mark
+            if spec.paged:
+                records = list(iter_items(
+                    accounting_api.api_client, method, tenant_id,
+                    page_size=self.page_size, **kwargs
+                ))
+            else:
+                records = items_of(method(tenant_id, **kwargs))
+
+            new_mark = max(
+                (record.updated_date_utc for record in records if record.updated_date_utc),
+                default=mark,
+            )
+            self.store.merge(tenant_id, entity, records, spec.id_attribute, new_mark)
+
+        self._count(mark is None, len(records))
+        return SyncResult(
+            entity, mark is None, len(records), self.store.count(tenant_id, entity), new_mark
+        )
+
+    def sync_journals(self, accounting_api, tenant_id):
+        """
+        Append the journals posted since the last sync, journal numbers only grow so
+        the last number stored is a checkpoint to resume from with offset
+        :return: SyncResult whose high_water_mark is the last journal number
+        """
+        with self.entity_lock(tenant_id, JOURNALS):
+            start = cursor = self.store.cursor(tenant_id, JOURNALS)
+            fetched = 0
+            journals = accounting_api.get_journals(tenant_id, offset=cursor).journals or []
+            while journals:
+                cursor = max(journal.journal_number for journal in journals)
+                more = len(journals) >= JOURNAL_BATCH_SIZE
+                pending = None
+                if more and self.prefetch:
+                    pending = submit(
+                        accounting_api.api_client, accounting_api.get_journals,
+                        (tenant_id,), {"offset": cursor},
+                    )
+                # each batch is stored with its checkpoint, an interrupted sync resumes after it
+                self.store.append(tenant_id, JOURNALS, journals, "journal_id", cursor)
+                fetched += len(journals)
+                with self._lock:
+                    self.journal_batches += 1
+                if not more:
+                    break
+                if pending is not None:
+                    journals = pending.get().journals or []
+                else:
+                    journals = accounting_api.get_journals(tenant_id, offset=cursor).journals or []
+
+        self._count(start == 0, fetched)
+        return SyncResult(
+            JOURNALS, start == 0, fetched, self.store.count(tenant_id, JOURNALS), cursor
+        )
+
+    def _count(self, full, fetched):
+        with self._lock:
+            if full:
+                self.full_syncs += 1
+            else:
+                self.delta_syncs += 1
+            self.fetched += fetched
+
+    def stats(self):
+        return {
+            "full_syncs": self.full_syncs,
+            "delta_syncs": self.delta_syncs,
+            "fetched": self.fetched,
+            "journal_batches": self.journal_batches,
+        }
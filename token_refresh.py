@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from caching import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefresher(object):
+    """
+    Renews oauth2 tokens shortly before they expire
+    * refreshes run on background threads, at most one per refresh token
+    * callers arriving while a refresh is in flight share its result, and
+      callers still holding the spent refresh token get the refreshed token,
+      so concurrent requests never invalidate each other's refresh tokens
+    """
+
+    def __init__(self, refresh_function, refresh_margin=300, expiration_buffer=60,
+                 max_workers=4, result_ttl=600):
+        self.refresh_function = refresh_function
+        self.refresh_margin = refresh_margin
+        self.expiration_buffer = expiration_buffer
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="token-refresh")
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._refreshed = TTLCache(ttl=result_ttl)
+
+    def current_token(self, token, timeout=None):
+        """
+        Token to use for the next api calls
+        * expiring within refresh_margin: refresh starts in the background
+        * expiring within expiration_buffer: wait for the refresh to finish
+        :param dict token: oauth2 token as stored in the session
+        :param timeout: seconds to wait for a blocking refresh
+        :return: dict token, the same one if no newer token is available
+        """
+        refresh_token = token.get("refresh_token")
+        expires_at = token.get("expires_at")
+        if not refresh_token or not expires_at:
+            return token
+
+        remaining = expires_at - time.time()
+        if remaining > self.refresh_margin:
+            return token
+
+        future = self._submit(token)
+        if future.done() or remaining <= self.expiration_buffer:
+            return future.result(timeout)
+        return token
+
+    def refresh(self, token, timeout=None):
+        # refresh now, joining a refresh of the same token already in flight
+        return self._submit(token).result(timeout)
+
+    def _submit(self, token):
+        refresh_token = token["refresh_token"]
+        with self._lock:
+            future = self._in_flight.get(refresh_token)
+            if future is None:
+                new_token = self._refreshed.get(refresh_token)
+                if new_token is not None:
+                    # refreshed by an earlier request, the refresh token is spent
+                    future = Future()
+                    future.set_result(new_token)
+                    return future
+                future = self._executor.submit(self._refresh, token)
+                self._in_flight[refresh_token] = future
+            return future
+
+    def _refresh(self, token):
+        refresh_token = token["refresh_token"]
+        try:
+            new_token = self.refresh_function(token)
+            self._refreshed.set(refresh_token, new_token)
+            return new_token
+        except Exception:
+            logger.exception("oauth2 token refresh failed")
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(refresh_token, None)
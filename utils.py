@@ -1,30 +1,213 @@
 # -*- coding: utf-8 -*-
 import json
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, date
 from decimal import Decimal
+from enum import Enum
 
-from xero_python.api_client.serializer import serialize
+from xero_python.api_client.serializer import serialize_date_ms, serialize_datetime_ms
+from xero_python.models import BaseModel
+
+# "pretty" (sorted, indented) for html pages, "compact" for machine consumers
+json_style = ContextVar("json_style", default="pretty")
+# serialize_model() returns lazily encoded StreamingJSON instead of a string
+json_stream = ContextVar("json_stream", default=False)
+# id(model) -> (model, api response body) of the current request, None collects nothing
+raw_bodies = ContextVar("raw_bodies", default=None)
+
+
+def isoformat(o):
+    return o.isoformat()
+
+
+# exact type -> conversion, subclasses are resolved once and added on first use
+JSON_TYPE_HANDLERS = {
+    datetime: isoformat,
+    date: isoformat,
+    uuid.UUID: str,
+    Decimal: str,
+}
 
 
 class JSONEncoder(json.JSONEncoder):
     def default(self, o):
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, date):
-            return o.isoformat()
-        if isinstance(o, (uuid.UUID, Decimal)):
-            return str(o)
-        return super(JSONEncoder, self).default(o)
+        handler = JSON_TYPE_HANDLERS.get(type(o))
+        if handler is None:
+            for klass, klass_handler in list(JSON_TYPE_HANDLERS.items()):
+                if isinstance(o, klass):
+                    handler = JSON_TYPE_HANDLERS[type(o)] = klass_handler
+                    break
+            else:
+                return super(JSONEncoder, self).default(o)
+        return handler(o)
+
+
+def list_of(converter):
+    return lambda values: [converter(value) for value in values]
+
+
+# openapi attribute type -> conversion matching xero_python serialize(),
+# models, enums and plain values are left to the encoder
+MODEL_ATTRIBUTE_CONVERTERS = {
+    "float": float,
+    "list[float]": list_of(float),
+    "date[ms-format]": serialize_date_ms,
+    "datetime[ms-format]": serialize_datetime_ms,
+}
+
+# model class -> ((attribute name, json key, converter), ...)
+model_plans = {}
+
+
+def model_plan(klass):
+    plan = model_plans.get(klass)
+    if plan is None:
+        plan = model_plans[klass] = tuple(
+            (attr_name, klass.attribute_map[attr_name], MODEL_ATTRIBUTE_CONVERTERS.get(attr_type))
+            for attr_name, attr_type in klass.openapi_types.items()
+        )
+    return plan
+
+
+def build_model_plans(klass=BaseModel):
+    # plans of every loaded sdk model, otherwise built on first use
+    for subclass in klass.__subclasses__():
+        model_plan(subclass)
+        build_model_plans(subclass)
+
+
+class ModelJSONEncoder(JSONEncoder):
+    """
+    Encodes sdk models while walking them, each model is turned into a shallow
+    dict only while it is written instead of serialize() copying the whole tree
+    """
+
+    def default(self, o):
+        plan = model_plans.get(type(o))
+        if plan is None and isinstance(o, BaseModel):
+            plan = model_plan(type(o))
+        if plan is not None:
+            serialized = {}
+            for attr_name, key, converter in plan:
+                value = getattr(o, attr_name)
+                if value is not None:
+                    serialized[key] = value if converter is None else converter(value)
+            return serialized
+        if isinstance(o, Enum):
+            return o.value
+        if isinstance(o, Decimal):
+            return float(o)
+        return super(ModelJSONEncoder, self).default(o)
+
+
+# without indent the encoders run on the C accelerated json path
+compact_encoder = JSONEncoder(separators=(",", ":"))
+compact_model_encoder = ModelJSONEncoder(separators=(",", ":"))
+pretty_model_encoder = ModelJSONEncoder(sort_keys=True, indent=4)
+
+
+class StreamingJSON(object):
+    """
+    Model json encoded on demand, iterating yields chunks of about chunk_size
+    characters while the model is walked so memory stays flat and the first
+    chunk is available before the whole model is encoded
+    """
+
+    def __init__(self, model, style, chunk_size=65536):
+        self.model = model
+        self.style = style
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        encoder = compact_model_encoder if self.style == "compact" else pretty_model_encoder
+        buffer = []
+        size = 0
+        for piece in encoder.iterencode(self.model):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def __str__(self):
+        return serialize_model(self.model, self.style, stream=False)
+
+
+class RawJSON(object):
+    """
+    Json text served without going through sdk models, eg. records of the local mirror
+    * compact style forwards the text untouched
+    * pretty style re-indents the parsed body
+    """
+
+    def __init__(self, body):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = json.loads(self.body)
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def json(self, style=None):
+        style = style or json_style.get()
+        if style == "compact" and not json_stream.get():
+            return self.body.decode("utf-8")
+        return serialize_model(self.data, style)
+
+
+def keep_raw_bodies(api_client):
+    """
+    Remember the response body each model of api_client is deserialized from while
+    raw_bodies collects them, serialize_model() then returns compact json of the
+    model as the upstream body instead of encoding the model again
+    """
+    deserialize = api_client.deserialize
+
+    def deserialize_keeping_body(response, response_type, response_model_finder):
+        data = deserialize(response, response_type, response_model_finder)
+        bodies = raw_bodies.get()
+        if bodies is not None and isinstance(data, BaseModel):
+            bodies[id(data)] = (data, response.data)
+        return data
+
+    api_client.deserialize = deserialize_keeping_body
+
+
+def raw_body(model):
+    # upstream json of a model read in the current request, None when not kept
+    entry = (raw_bodies.get() or {}).get(id(model))
+    if entry is None or entry[0] is not model:
+        return None
+    body = entry[1]
+    return body.decode("utf-8") if isinstance(body, bytes) else body
 
 
 def parse_json(data):
     return json.loads(data, parse_float=Decimal)
 
 
-def serialize_model(model):
-    return jsonify(serialize(model))
+def serialize_model(model, style=None, stream=None):
+    style = style or json_style.get()
+    if json_stream.get() if stream is None else stream:
+        return StreamingJSON(model, style)
+    if style == "compact":
+        body = raw_body(model)
+        if body is not None:
+            return body
+        return compact_model_encoder.encode(model)
+    return pretty_model_encoder.encode(model)
 
 
-def jsonify(data):
+def jsonify(data, style=None):
+    if (style or json_style.get()) == "compact":
+        return compact_encoder.encode(data)
     return json.dumps(data, sort_keys=True, indent=4, cls=JSONEncoder)